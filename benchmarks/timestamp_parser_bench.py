@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: compiled timestamp parser vs. the original strptime loop.
+
+Run from the repository root::
+
+    python benchmarks/timestamp_parser_bench.py [--rows N] [--repeat R]
+
+Before timing, every sample is parsed by both implementations and the results
+are compared, so the benchmark doubles as an equivalence check.
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+from datetime import date, datetime, timedelta
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, project_root)
+
+from src.utils.timestamp_parser import (  # noqa: E402
+    TIMESTAMP_FORMATS,
+    datetime_to_epoch,
+    normalize_timestamp_str,
+    parse_datetime,
+    parse_epoch_column,
+)
+
+
+def legacy_parse_timestamp(timestamp_str):
+    """The pre-compiled-parser implementation of ``parse_timestamp`` (without logging)."""
+    if not isinstance(timestamp_str, str):
+        timestamp_str = str(timestamp_str)
+    timestamp_str = normalize_timestamp_str(timestamp_str.strip())
+    for fmt in TIMESTAMP_FORMATS:
+        try:
+            if fmt == "%H:%M:%S":
+                time_part = datetime.strptime(timestamp_str, fmt).time()
+                return datetime.combine(date.today(), time_part)
+            return datetime.strptime(timestamp_str, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def make_samples(rows, seed=0):
+    """Event-log cells, MCAP and video filenames, and a sprinkling of junk."""
+    rng = random.Random(seed)
+    start = datetime(2025, 9, 19, 8, 0, 0)
+    layouts = [
+        lambda t: t.strftime("%Y-%m-%d %H:%M:%S") + f" {rng.randrange(1000)}",
+        lambda t: t.strftime("%Y-%m-%d %H:%M:%S"),
+        lambda t: f"PSA8411_{t.strftime('%Y-%m-%d-%H-%M-%S')}_{rng.randrange(10)}",
+        lambda t: t.strftime("%Y%m%d_%H%M%S"),
+        lambda t: t.strftime("%Y%m%d%H%M%S"),
+        lambda t: t.strftime("%H:%M:%S"),
+        lambda t: t.strftime("%Y-%m-%d %H:%M:%S.%f"),
+        lambda t: t.strftime("%Y%m%d%H%M%S%f"),
+        lambda t: t.strftime("%Y-%m-%d %H:%M"),
+        lambda t: "not a timestamp",
+    ]
+    weights = [60, 10, 10, 4, 4, 3, 3, 2, 2, 2]
+    samples = []
+    for _ in range(rows):
+        moment = start + timedelta(seconds=rng.randrange(86400 * 30), microseconds=rng.randrange(1_000_000))
+        samples.append(rng.choices(layouts, weights)[0](moment))
+    # Digit strings whose fields only parse under a later format.
+    samples += ["20251301093523", "2025021093523", "20250230093523123", "2025-9-1 1:2:3", "2025-09-19 10:50:60"]
+    return samples
+
+
+def check_equivalence(samples):
+    mismatches = [s for s in samples if legacy_parse_timestamp(s) != parse_datetime(s)]
+    epochs = parse_epoch_column(samples)
+    for text, epoch in zip(samples, epochs):
+        expected = legacy_parse_timestamp(text)
+        if (expected is None) != (epoch != epoch) or (expected is not None and datetime_to_epoch(expected) != epoch):
+            mismatches.append(text)
+    return mismatches
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--rows", type=int, default=100_000)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    samples = make_samples(args.rows)
+    mismatches = check_equivalence(samples)
+    if mismatches:
+        print(f"MISMATCH on {len(mismatches)} samples, e.g. {mismatches[:5]}")
+        return 1
+    print(f"{len(samples)} samples: results identical")
+
+    cases = [
+        ("legacy strptime loop", lambda: [legacy_parse_timestamp(s) for s in samples]),
+        ("parse_datetime", lambda: [parse_datetime(s) for s in samples]),
+        ("parse_epoch_column", lambda: parse_epoch_column(samples)),
+    ]
+    baseline = None
+    for name, func in cases:
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        baseline = baseline or best
+        print(f"{name:<22} {best * 1000:9.1f} ms  {best / len(samples) * 1e6:6.2f} us/row  x{baseline / best:5.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,332 @@
+"""``bazel build`` driven by its Build Event Protocol stream.
+
+Streaming every output line of a large build into the Tk log drowns the UI.
+:class:`BazelBuild` instead sends Bazel's raw output to :data:`BUILD_LOG_PATH`
+and asks Bazel for a JSON Build Event Protocol file
+(``--build_event_json_file``), which it tails while the build runs.
+:class:`BuildState` folds the events into progress — targets configured and
+completed, failed targets, the ``[done / total]`` action counter of Bazel's
+progress messages — and, once the build has finished, into a summary with
+action and cache statistics and the critical path.  The caller gets a short
+progress text at most every
+:data:`~src.utils.constants.BAZEL_BUILD_PROGRESS_INTERVAL` seconds, and only
+when it changed.
+
+A build can be cancelled from another thread (:meth:`BazelBuild.cancel`):
+Bazel gets the same interrupt as a Ctrl+C and is killed if it has not stopped
+within :data:`_CANCEL_GRACE` seconds.  :func:`source_fingerprint` and
+:class:`BuildStamps` let the caller skip a build whose sources and targets are
+unchanged since the last successful one.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import re
+import signal
+import subprocess
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+from ..utils.constants import BAZEL_BUILD_PROGRESS_INTERVAL, BAZEL_BUILD_STAMPS_PATH, BAZEL_BUILD_TIMEOUT
+from ..utils.logger import LOG_DIR, get_logger
+
+logger = get_logger(__name__)
+
+#: Raw stdout/stderr of the last build.
+BUILD_LOG_PATH = os.path.join(LOG_DIR, "bazel_build.log")
+#: Build Event Protocol stream of the last build (one JSON event per line).
+BUILD_EVENTS_PATH = os.path.join(LOG_DIR, "bazel_build_events.json")
+
+_POLL_INTERVAL = 0.2
+_ACTION_COUNTER = re.compile(r"\[([\d,]+) / ([\d,]+)\]")
+_MAX_ERRORS = 10
+_CANCEL_GRACE = 10.0
+
+
+class BepFileReader:
+    """Returns the events Bazel appended to a ``--build_event_json_file`` since the last call."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._fh = None
+        self._partial = b""
+
+    def read_events(self) -> List[dict]:
+        if self._fh is None:
+            try:
+                self._fh = open(self.path, "rb")
+            except FileNotFoundError:  # Bazel creates it once the command has started
+                return []
+        data = self._fh.read()
+        if not data:
+            return []
+        lines = (self._partial + data).split(b"\n")
+        self._partial = lines.pop()
+        events = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                events.append(json.loads(line))
+            except ValueError:
+                logger.debug("Skipping malformed build event: %r", line[:200])
+        return events
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+def _count(value) -> int:
+    # int64 fields are strings in the proto3 JSON mapping
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+class BuildState:
+    """What the BEP stream of one build has reported so far."""
+
+    def __init__(self) -> None:
+        self.targets_configured = 0
+        self.targets: Dict[str, bool] = {}  # label -> built successfully
+        self.actions_done: Optional[int] = None
+        self.actions_total: Optional[int] = None
+        self.errors: List[str] = []
+        self.actions_executed: Optional[int] = None
+        self.cache_hits = 0  # remote / disk cache
+        self.action_cache_hits: Optional[int] = None  # already up to date locally
+        self.critical_path: Optional[str] = None
+        self.exit_name: Optional[str] = None
+        self.success: Optional[bool] = None
+
+    @property
+    def failed_targets(self) -> List[str]:
+        return [label for label, ok in self.targets.items() if not ok]
+
+    def apply(self, event: dict) -> None:
+        event_id = event.get("id", {})
+        if "progress" in event:
+            self._apply_output(event["progress"].get("stderr", ""))
+        if "targetConfigured" in event_id:
+            self.targets_configured += 1
+        elif "targetCompleted" in event_id:
+            label = event_id["targetCompleted"].get("label", "?")
+            # "aborted" (skipped after an earlier failure, …) carries no "completed" payload
+            self.targets[label] = bool(event.get("completed", {}).get("success", False))
+        elif "buildMetrics" in event_id:
+            summary = event.get("buildMetrics", {}).get("actionSummary", {})
+            self.actions_executed = _count(summary.get("actionsExecuted"))
+            self.cache_hits = sum(
+                _count(runner.get("count"))
+                for runner in summary.get("runnerCount", [])
+                if "cache hit" in runner.get("name", "")
+            )
+            if "actionCacheStatistics" in summary:
+                self.action_cache_hits = _count(summary["actionCacheStatistics"].get("hits"))
+        elif "buildToolLogs" in event_id:
+            for log in event.get("buildToolLogs", {}).get("log", []):
+                if log.get("name") == "critical path" and log.get("contents"):
+                    text = base64.b64decode(log["contents"]).decode("utf-8", "replace").strip()
+                    self.critical_path = text.splitlines()[0] if text else None
+        elif "buildFinished" in event_id:
+            finished = event.get("finished", {})
+            self.exit_name = finished.get("exitCode", {}).get("name")
+            self.success = finished.get("overallSuccess", self.exit_name == "SUCCESS")
+
+    def _apply_output(self, text: str) -> None:
+        counters = _ACTION_COUNTER.findall(text)
+        if counters:
+            done, total = counters[-1]
+            self.actions_done, self.actions_total = int(done.replace(",", "")), int(total.replace(",", ""))
+        for line in text.splitlines():
+            if line.startswith("ERROR:") and len(self.errors) < _MAX_ERRORS:
+                self.errors.append(line)
+
+    def progress_text(self) -> str:
+        parts = []
+        if self.actions_total:
+            parts.append(f"{self.actions_done:,} / {self.actions_total:,} actions")
+        if self.targets_configured:
+            parts.append(f"{len(self.targets)}/{self.targets_configured} targets")
+        failed = len(self.failed_targets)
+        if failed:
+            parts.append(f"{failed} failed")
+        return " · ".join(parts) if parts else "analyzing"
+
+    def summary_lines(self, max_targets: int = 25) -> List[str]:
+        """Human-readable per-target summary; each target is listed when there are at most *max_targets*."""
+        lines = []
+        built = len(self.targets) - len(self.failed_targets)
+        lines.append(
+            f"Targets: {built} built, {len(self.failed_targets)} failed (of {self.targets_configured} configured)"
+        )
+        if len(self.targets) <= max_targets:
+            lines.extend(f"   {'✓' if ok else '✗'} {label}" for label, ok in sorted(self.targets.items()))
+        else:
+            lines.extend(f"   ✗ {label}" for label in self.failed_targets[:max_targets])
+            if len(self.failed_targets) > max_targets:
+                lines.append(f"   … and {len(self.failed_targets) - max_targets} more failed targets")
+        if self.actions_executed is not None:
+            actions = f"Actions: {self.actions_executed:,} executed ({self.cache_hits:,} remote/disk cache hits)"
+            if self.action_cache_hits is not None:
+                actions += f", {self.action_cache_hits:,} up to date"
+            lines.append(actions)
+        if self.critical_path:
+            lines.append(self.critical_path)
+        lines.extend(self.errors)
+        return lines
+
+
+class BazelBuild:
+    """One ``bazel build`` run in *cwd*.
+
+    Args:
+        cwd: Bazel working directory.
+        targets: Target patterns to build.
+        timeout: Seconds before the build is killed.
+    """
+
+    def __init__(self, cwd: str, targets: Sequence[str] = ("//...",), timeout: float = BAZEL_BUILD_TIMEOUT) -> None:
+        self.cwd = cwd
+        self.targets = list(targets)
+        self.timeout = timeout
+        self.log_path = BUILD_LOG_PATH
+        self.events_path = BUILD_EVENTS_PATH
+        self.state = BuildState()
+        self.timed_out = False
+        self.cancelled = False
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        """Ask the running build to stop; :meth:`run` then returns Bazel's exit code (or ``None``)."""
+        self._cancel.set()
+
+    def run(self, on_progress: Optional[Callable[[str], None]] = None) -> Optional[int]:
+        """Build and return Bazel's exit code (``None`` when it was killed); raises ``OSError`` if it cannot start.
+
+        *on_progress* receives :meth:`BuildState.progress_text` from this
+        thread, throttled to one call per
+        :data:`~src.utils.constants.BAZEL_BUILD_PROGRESS_INTERVAL` seconds.
+        """
+        os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+        try:
+            os.remove(self.events_path)  # never tail the previous build's events
+        except FileNotFoundError:
+            pass
+        command = ["bazel", "build", f"--build_event_json_file={self.events_path}", *self.targets]
+        with open(self.log_path, "wb") as log:
+            proc = subprocess.Popen(
+                command, cwd=self.cwd, stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT
+            )
+        reader = BepFileReader(self.events_path)
+        deadline = time.monotonic() + self.timeout
+        next_progress, last_progress = 0.0, None
+        kill_at = None
+        try:
+            while True:
+                try:
+                    returncode = proc.wait(_POLL_INTERVAL)
+                except subprocess.TimeoutExpired:
+                    returncode = None
+                for event in reader.read_events():
+                    self.state.apply(event)
+                if returncode is not None:
+                    return returncode
+                now = time.monotonic()
+                if self._cancel.is_set() and not self.cancelled:
+                    self.cancelled = True
+                    kill_at = now + _CANCEL_GRACE
+                    # Like Ctrl+C: Bazel stops its actions and releases the server lock.
+                    if sys.platform != "win32":
+                        proc.send_signal(signal.SIGINT)
+                    else:
+                        proc.terminate()
+                if now >= deadline or (kill_at is not None and now >= kill_at):
+                    self.timed_out = not self.cancelled
+                    proc.kill()
+                    proc.wait()
+                    return None
+                if on_progress is not None and now >= next_progress:
+                    text = self.state.progress_text()
+                    if text != last_progress:
+                        on_progress(text)
+                        last_progress = text
+                    next_progress = now + BAZEL_BUILD_PROGRESS_INTERVAL
+        finally:
+            reader.close()
+
+
+def source_fingerprint(workspace: str, targets: Sequence[str]) -> Optional[str]:
+    """Hash of *targets* and the git state of *workspace*: ``HEAD``, and path, size and mtime of every changed file.
+
+    ``git status`` answers from the index's stat cache, so this takes well
+    under a second even in large workspaces.  Returns ``None`` outside git
+    (the build is then never skipped).
+    """
+    try:
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD", "--show-toplevel"], cwd=workspace, capture_output=True, text=True, timeout=30
+        )
+        status = subprocess.run(
+            ["git", "status", "--porcelain=v1", "-z", "--untracked-files=all"],
+            cwd=workspace,
+            capture_output=True,
+            timeout=60,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if head.returncode != 0 or status.returncode != 0:
+        return None
+    commit, _, root = head.stdout.strip().partition("\n")
+    digest = hashlib.sha256()
+    digest.update(commit.encode())
+    digest.update("\0".join(targets).encode())
+    entries = iter(status.stdout.split(b"\0"))
+    for entry in entries:
+        if len(entry) < 4:
+            continue
+        if b"R" in entry[:2] or b"C" in entry[:2]:
+            next(entries, None)  # the rename / copy source follows as its own field
+        digest.update(entry)
+        try:
+            st = os.stat(os.path.join(root, os.fsdecode(entry[3:])))
+            digest.update(f"{st.st_size}:{st.st_mtime_ns}".encode())
+        except OSError:  # deleted
+            digest.update(b"-")
+    return digest.hexdigest()
+
+
+class BuildStamps:
+    """Source fingerprint of the last successful build per workspace, persisted as JSON."""
+
+    def __init__(self, path: str = BAZEL_BUILD_STAMPS_PATH) -> None:
+        self.path = path
+        try:
+            with open(path, "r") as fh:
+                self._stamps: Dict[str, str] = json.load(fh)
+        except (OSError, ValueError):
+            self._stamps = {}
+
+    def get(self, workspace: str) -> Optional[str]:
+        return self._stamps.get(os.path.realpath(workspace))
+
+    def set(self, workspace: str, fingerprint: Optional[str]) -> None:
+        key = os.path.realpath(workspace)
+        if fingerprint is None:
+            self._stamps.pop(key, None)
+        else:
+            self._stamps[key] = fingerprint
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path + ".tmp", "w") as fh:
+                json.dump(self._stamps, fh, indent=1)
+            os.replace(self.path + ".tmp", self.path)
+        except OSError as e:
+            logger.warning("Could not save build stamps to %s: %s", self.path, e)
@@ -0,0 +1,230 @@
+"""Resolution of ``bazel run`` targets to their prebuilt binaries.
+
+``bazel run //tools/plot`` contacts (or starts) the Bazel server, re-analyses
+the target and checks that it is up to date before running it, which costs
+seconds on every click even when nothing changed.  :class:`BazelTargetResolver`
+asks Bazel once per target where its executable lives
+(``bazel cquery --output=files`` plus ``bazel info``) and caches the answer,
+so later launches can exec the binary directly, from its runfiles tree and
+with the environment ``bazel run`` would have given it.
+
+A cached binary is only handed out while the workspace's sources are the
+ones it was resolved at — same :func:`~.bazel_build.source_fingerprint`, i.e.
+git ``HEAD`` plus the path, size and mtime of every uncommitted change — and
+the file still exists; otherwise the caller falls back to ``bazel run`` (which
+also rebuilds) and the target is resolved again in the background.  Outside
+git the sources cannot be fingerprinted, so ``bazel run`` is always used.
+
+Looking a binary up never runs git (it is called on the UI thread): while
+binaries are cached, a background thread fingerprints their workspaces every
+:data:`~src.utils.constants.BAZEL_SOURCES_CHECK_INTERVAL` seconds and lookups
+compare against the latest result, so an edit is noticed within that time.
+"""
+
+import os
+import shlex
+import subprocess
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from ..utils.constants import BAZEL_RESOLVE_TIMEOUT, BAZEL_SOURCES_CHECK_INTERVAL
+from ..utils.logger import get_logger
+from .bazel_build import source_fingerprint
+
+logger = get_logger(__name__)
+
+_SHELL_OPERATORS = {"&&", "||", ";", "|", "&", ">", "<"}
+
+
+class BazelRunCommand(NamedTuple):
+    """A ``bazel run [options] <target> [-- args]`` command line, split up."""
+
+    options: Tuple[str, ...]
+    target: str
+    args: Tuple[str, ...]
+
+
+class PrebuiltTool(NamedTuple):
+    """Where a resolved target's executable lives and how ``bazel run`` would start it."""
+
+    binary: str
+    cwd: str
+    env: Dict[str, str]
+    fingerprint: str  # source_fingerprint() of the workspace (no targets) when the binary was resolved
+
+
+def parse_bazel_run(command) -> Optional[BazelRunCommand]:
+    """Split a plain ``bazel run`` command; ``None`` for anything else (or anything ambiguous)."""
+    try:
+        args = shlex.split(command) if isinstance(command, str) else [str(arg) for arg in command]
+    except ValueError:
+        return None
+    if args[:2] != ["bazel", "run"] or _SHELL_OPERATORS.intersection(args):
+        return None
+    rest = args[2:]
+    head, tail = (rest[: rest.index("--")], rest[rest.index("--") + 1 :]) if "--" in rest else (rest, [])
+    # Options taking a separate value ("-c opt") would look like a second target: leave those to bazel.
+    targets = [arg for arg in head if not arg.startswith("-")]
+    if len(targets) != 1:
+        return None
+    return BazelRunCommand(tuple(arg for arg in head if arg.startswith("-")), targets[0], tuple(tail))
+
+
+def _target_name(target: str) -> str:
+    return target.rsplit(":", 1)[1] if ":" in target else target.rstrip("/").rsplit("/", 1)[-1]
+
+
+class BazelTargetResolver:
+    """Caches ``bazel run`` targets → :class:`PrebuiltTool`, resolving them on background threads.
+
+    Args:
+        bazel: Bazel executable.
+        check_interval: Seconds between background fingerprints of workspaces with cached binaries.
+    """
+
+    def __init__(self, bazel: str = "bazel", check_interval: float = BAZEL_SOURCES_CHECK_INTERVAL) -> None:
+        self._bazel = bazel
+        self._check_interval = check_interval
+        self._lock = threading.Lock()
+        self._tools: Dict[tuple, PrebuiltTool] = {}
+        self._runs: Dict[tuple, Tuple[str, BazelRunCommand]] = {}
+        self._resolving = set()
+        self._generation = 0
+        # Real workspace path -> (monotonic start, fingerprint) of the latest source check.
+        self._sources: Dict[str, Tuple[float, Optional[str]]] = {}
+        self._checker: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _key(workspace: str, run: BazelRunCommand) -> tuple:
+        return os.path.realpath(workspace), run.target, run.options
+
+    def lookup(self, workspace: str, run: BazelRunCommand) -> Optional[PrebuiltTool]:
+        """The cached binary of *run* in *workspace*, if it was resolved from the current sources.
+
+        Compares with the last background check of the sources; never runs git.
+        """
+        key = self._key(workspace, run)
+        with self._lock:
+            tool = self._tools.get(key)
+            _, current = self._sources.get(key[0], (0.0, None))
+        if tool is None:
+            return None
+        if tool.fingerprint != current or not os.access(tool.binary, os.X_OK):
+            self.forget(workspace, run)
+            return None
+        return tool
+
+    def forget(self, workspace: str, run: BazelRunCommand) -> None:
+        with self._lock:
+            self._tools.pop(self._key(workspace, run), None)
+
+    def invalidate(self) -> None:
+        """Drop every cached binary; resolutions still running are discarded."""
+        with self._lock:
+            self._tools.clear()
+            self._generation += 1
+
+    def refresh(self) -> None:
+        """Invalidate, then resolve again every target resolved so far (e.g. after ``bazel build``)."""
+        self.invalidate()
+        with self._lock:
+            runs = list(self._runs.values())
+        for workspace, run in runs:
+            self.resolve_async(workspace, run)
+
+    def resolve_async(self, workspace: str, run: BazelRunCommand) -> None:
+        """Resolve *run* on a background thread unless it is cached or already being resolved."""
+        key = self._key(workspace, run)
+        with self._lock:
+            if key in self._tools or key in self._resolving:
+                return
+            self._resolving.add(key)
+            self._runs[key] = (workspace, run)
+            generation = self._generation
+        threading.Thread(
+            target=self._resolve, args=(key, workspace, run, generation), daemon=True, name="BazelTargetResolver"
+        ).start()
+
+    def _resolve(self, key: tuple, workspace: str, run: BazelRunCommand, generation: int) -> None:
+        try:
+            fingerprint = self._check_sources(key[0])
+            if fingerprint is None:
+                logger.info("%s is not in git; launching %s with bazel run", workspace, run.target)
+                return
+            tool = self.resolve(workspace, run, fingerprint)
+            with self._lock:
+                if tool is not None and generation == self._generation:
+                    self._tools[key] = tool
+                    if self._checker is None:
+                        self._checker = threading.Thread(target=self._run_checks, daemon=True, name="BazelSourcesCheck")
+                        self._checker.start()
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.info("Could not resolve %s to a prebuilt binary: %s", run.target, e)
+        finally:
+            with self._lock:
+                self._resolving.discard(key)
+
+    def _check_sources(self, workspace: str) -> Optional[str]:
+        """Fingerprint *workspace* now (blocking) and record it for :meth:`lookup`, unless a newer check won."""
+        started = time.monotonic()
+        fingerprint = source_fingerprint(workspace, ())
+        with self._lock:
+            if started > self._sources.get(workspace, (0.0, None))[0]:
+                self._sources[workspace] = (started, fingerprint)
+        return fingerprint
+
+    def _run_checks(self) -> None:
+        while True:
+            time.sleep(self._check_interval)
+            with self._lock:
+                workspaces = {key[0] for key in self._tools}
+                if not workspaces:
+                    self._checker = None  # restarted by the next resolution
+                    return
+            for workspace in workspaces:
+                self._check_sources(workspace)
+
+    def resolve(self, workspace: str, run: BazelRunCommand, fingerprint: str = "") -> Optional[PrebuiltTool]:
+        """Ask Bazel for *run*'s executable now (blocking); ``None`` when it has not been built."""
+        info = dict(
+            line.split(": ", 1)
+            for line in self._bazel_output(workspace, ["info", "execution_root", "workspace"]).splitlines()
+            if ": " in line
+        )
+        execroot, workspace_root = info.get("execution_root"), info.get("workspace")
+        if not execroot or not workspace_root:
+            raise OSError("bazel info returned no execution_root/workspace")
+        outputs = self._bazel_output(workspace, ["cquery", *run.options, "--output=files", run.target]).splitlines()
+        paths = [os.path.join(execroot, path.strip()) for path in outputs if path.strip()]
+        executables = [path for path in paths if os.path.isfile(path) and os.access(path, os.X_OK)]
+        if not executables:
+            logger.info("%s has no built executable yet; launching it with bazel run", run.target)
+            return None
+        name = _target_name(run.target)
+        binary = next((path for path in executables if os.path.basename(path) == name), executables[0])
+
+        env = {"BUILD_WORKSPACE_DIRECTORY": workspace_root}
+        cwd = workspace_root
+        runfiles = binary + ".runfiles"
+        if os.path.isdir(runfiles):
+            env["RUNFILES_DIR"] = runfiles
+            # bazel run starts the binary from <runfiles>/<workspace name>; the execroot is named after it.
+            main_repo = os.path.join(runfiles, os.path.basename(execroot))
+            cwd = main_repo if os.path.isdir(main_repo) else runfiles
+        logger.info("Resolved %s to %s", run.target, binary)
+        return PrebuiltTool(binary, cwd, env, fingerprint)
+
+    def _bazel_output(self, workspace: str, args: List[str]) -> str:
+        result = subprocess.run(
+            [self._bazel, *args],
+            cwd=workspace,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            timeout=BAZEL_RESOLVE_TIMEOUT,
+        )
+        if result.returncode != 0:
+            last = result.stderr.strip().splitlines()[-1:] or [f"exit code {result.returncode}"]
+            raise OSError(f"bazel {args[0]} failed: {last[0]}")
+        return result.stdout
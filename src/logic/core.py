@@ -1,3 +1,4 @@
+import functools
 import os
 import shutil
 import signal
@@ -6,110 +7,171 @@ import sys
 import threading
 import time
 import urllib.parse
-from typing import Optional
+from typing import List, Optional
 
 from ..utils.constants import (
+    BAZEL_BUILD_TIMEOUT,
     DEFAULT_BACKUP_PATH,
     DEFAULT_DATA_PATH,
     DEFAULT_SETTINGS,
     FOXGLOVE_DS_URL,
     FOXGLOVE_REMOTE_BASE_URL,
+    LAUNCH_READY_TIMEOUT,
     LONG_RUNNING_PROCESS_THRESHOLD,
-    PROCESS_MONITOR_INTERVAL,
+    PROCESS_KILL_TIMEOUT,
     PROCESS_NAMES,
     PROCESS_SHUTDOWN_TIMEOUT,
+    PROCESS_STATE_FILE_PATH,
+    PROCESS_TERMINATE_TIMEOUT,
 )
 from ..utils.file_operations import open_url_in_browser
 from ..utils.logger import get_logger
+from .bazel_build import BazelBuild, BuildStamps, source_fingerprint
+from .bazel_targets import BazelTargetResolver, parse_bazel_run
+from .launch_metrics import LaunchMetrics, MpvIpcProbe, OutputProbe, WindowProbe
+from .mpv_ipc import (
+    IPC_TIMEOUT,
+    MpvIpcClient,
+    MpvIpcError,
+    default_socket_path,
+    ipc_supported,
+    socket_path_from_command,
+)
+from .process_output import OutputCapture, ProcessOutput
+from .process_registry import ProcessRegistry
+from .process_sampler import ProcessSampler
+from .process_supervisor import ProcessSupervisor
 from .symlink_playback_logic import SymlinkPlaybackLogic
 
 logger = get_logger(__name__)
 
+#: Printed by ``bazel run`` once the build is done and the tool itself starts.
+BAZEL_RUN_STARTED = r"^INFO: Running command line"
+
+
+def _launch_request(method):
+    """Mark when a user-requested launch starts, for click-to-spawn latency (the outermost call wins).
+
+    The time is kept per thread, so launches running concurrently (UI thread, build-then-launch thread)
+    each measure from their own request.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        launch = self._launch_context
+        if getattr(launch, "requested_at", None) is not None:
+            return method(self, *args, **kwargs)
+        launch.requested_at = time.monotonic()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            launch.requested_at = None
+
+    return wrapper
+
 
 class FoxgloveAppLogic:
     def __init__(self, log_callback=None):
-        self.running_processes = []
+        self._processes = ProcessRegistry(PROCESS_STATE_FILE_PATH)  # launched processes by id, name and media path
         self.local_base_path_absolute = DEFAULT_DATA_PATH
         self.backup_base_path_absolute = DEFAULT_BACKUP_PATH
         self.bazel_working_dir = None
         self.settings = DEFAULT_SETTINGS.copy()
-        self._process_id_counter = 0
         self.log_callback = log_callback or (lambda *args, **kwargs: None)
-        self._processes_lock = threading.RLock()
-        self._process_monitor_thread = None
-        self._monitor_stop_event = threading.Event()
+        self._exit_listeners = []
+        self._sampler = ProcessSampler()  # CPU/RSS/I/O history per launched process group
+        self._output = OutputCapture()  # last lines printed by each launched process
+        self._launch_metrics = LaunchMetrics()  # click-to-spawn / spawn-to-ready latency per tool
+        self._launch_context = threading.local()  # requested_at: start of the current thread's launch
+        self._bazel_targets = BazelTargetResolver()  # bazel run targets -> prebuilt binaries
+        self._build_stamps = BuildStamps()  # sources of the last successful build per workspace
+        self._build = None  # BazelBuild in progress
+        self._supervisor = ProcessSupervisor(
+            self._on_process_exit, self._on_process_overdue, overdue_after=LONG_RUNNING_PROCESS_THRESHOLD
+        )
+        # Single-instance mpv is driven over its IPC socket instead of being relaunched per event.
+        self._mpv_ipc = MpvIpcClient(default_socket_path()) if ipc_supported() else None
         self._start_process_monitor()
+        self._adopt_processes()
 
     def _start_process_monitor(self):
-        """Start background thread to monitor process health and clean up zombies."""
-        if self._process_monitor_thread is None or not self._process_monitor_thread.is_alive():
-            self._monitor_stop_event.clear()
-            self._process_monitor_thread = threading.Thread(
-                target=self._process_health_monitor, daemon=True, name="ProcessHealthMonitor"
-            )
-            self._process_monitor_thread.start()
-
-    def _process_health_monitor(self):
-        """
-        Background process health monitor that periodically checks and cleans up
-        dead processes to prevent zombies and hanging states.
+        """Start the supervisor that reports launched processes' exits as they happen."""
+        self._supervisor.start()
+
+    def _adopt_processes(self):
+        """Track again the tools a previous session launched that are still running."""
+        for record in self._processes.adopt_saved(self._output.reopen):
+            if record.output is not None:
+                record.output.key = record.id
+            self._supervisor.watch(record.id, record.process, child=False)
+            self._sampler.track(record.id, record.pgid)
+            self.log_callback(f"Re-attached to {record.name} (PID: {record.pid}) left running by a previous session.")
+        self._output.prune()  # after re-opening: the adopted tools' files are kept
+
+    def add_process_exit_listener(self, listener):
+        """Call *listener(record, returncode)* with the :class:`ProcessRecord` when a tracked process exits on its own.
+
+        Runs on the supervisor thread; processes stopped by this application
+        are not reported.
         """
-        while not self._monitor_stop_event.wait(PROCESS_MONITOR_INTERVAL):
+        self._exit_listeners.append(listener)
+
+    def _on_process_exit(self, proc_id, proc, returncode):
+        record = self._processes.mark_exited(proc_id, returncode)
+        if record is None:
+            return
+        self._sampler.untrack(proc_id)
+        if record.stopping:
+            return
+        if record.adopted:  # not our child: its exit status is unknown
+            self.log_callback(f"{record.name} exited (PID: {proc.pid}).")
+        else:
+            self.log_callback(
+                f"{record.name} exited (PID: {proc.pid}, exit code {returncode}).", is_error=returncode != 0
+            )
+        for listener in list(self._exit_listeners):
             try:
-                self._cleanup_dead_processes()
+                listener(record, returncode)
             except Exception as e:
-                # Use module logger for background-thread errors (avoids Tkinter
-                # cross-thread issues and guarantees capture in the log file)
-                logger.error("Process monitor error: %s", e)
-
-    def _cleanup_dead_processes(self):
-        """Remove dead processes from tracking list to prevent zombie accumulation."""
-        dead_processes = []
-        current_time = time.time()
-
-        with self._processes_lock:
-            processes_snapshot = list(self.running_processes)
+                logger.error("Process exit listener error: %s", e)
+
+    def _on_process_overdue(self, proc_id, proc):
+        record = self._processes.get(proc_id)
+        if record is not None:
+            logger.warning(
+                "Long-running process detected: %s (PID: %s, runtime: %.1fh)",
+                record.name,
+                proc.pid,
+                LONG_RUNNING_PROCESS_THRESHOLD / 3600,
+            )
 
-        for proc_info in processes_snapshot:
-            proc = proc_info["process"]
-            if proc.poll() is not None:
-                dead_processes.append(proc_info)
-            else:
-                # Check for potentially hanging processes
-                start_time = proc_info.get("start_time", current_time)
-                runtime = current_time - start_time
-                if runtime > LONG_RUNNING_PROCESS_THRESHOLD:
-                    logger.warning(
-                        "Long-running process detected: %s (PID: %s, runtime: %.1fh)",
-                        proc_info["name"],
-                        proc.pid,
-                        runtime / 3600,
-                    )
+    def _is_running(self, record):
+        """Whether a tracked process is alive, from the supervisor's exit events.
 
-        if dead_processes:
-            with self._processes_lock:
-                for proc_info in dead_processes:
-                    if proc_info in self.running_processes:
-                        self.running_processes.remove(proc_info)
+        Only the polling fallback, whose events may lag, asks the process itself.
+        """
+        if not record.running:
+            return False
+        if self._supervisor.is_alive() and self._supervisor.backend != "poll":
+            return True
+        return record.process.poll() is None
 
     def get_process_status(self):
         """Get current status of all tracked processes."""
-        with self._processes_lock:
-            processes_snapshot = list(self.running_processes)
+        records = self._processes.snapshot()
 
-        status = {"total": len(processes_snapshot), "running": 0, "dead": 0, "processes": []}
+        status = {"total": len(records), "running": 0, "dead": 0, "processes": []}
 
         current_time = time.time()
-        for proc_info in processes_snapshot:
-            proc = proc_info["process"]
-            is_running = proc.poll() is None
-            start_time = proc_info.get("start_time", current_time)
-            runtime = current_time - start_time
+        for record in records:
+            is_running = self._is_running(record)
+            runtime = current_time - record.start_time
 
             process_status = {
-                "name": proc_info["name"],
-                "pid": proc.pid,
+                "name": record.name,
+                "pid": record.pid,
                 "running": is_running,
+                "adopted": record.adopted,
                 "runtime_seconds": runtime,
                 "runtime_display": (
                     f"Runtime: {int(runtime//60)}:{int(runtime%60):02d} min"
@@ -117,6 +179,18 @@ class FoxgloveAppLogic:
                     else f"Runtime: {runtime/3600:.1f}h"
                 ),
             }
+            history = self._sampler.history(record.id)
+            sample = history.latest if history is not None else None
+            if sample is not None:
+                process_status["usage"] = {
+                    "cpu_percent": sample.cpu_percent,
+                    "peak_cpu_percent": history.peak_cpu_percent,
+                    "rss_bytes": sample.rss_bytes,
+                    "peak_rss_bytes": history.peak_rss_bytes,
+                    "read_bytes": sample.read_bytes,
+                    "write_bytes": sample.write_bytes,
+                    "processes": sample.processes,
+                }
 
             status["processes"].append(process_status)
             if is_running:
@@ -127,10 +201,8 @@ class FoxgloveAppLogic:
         return status
 
     def _stop_process_monitor(self):
-        """Stop the process health monitor."""
-        if self._process_monitor_thread and self._process_monitor_thread.is_alive():
-            self._monitor_stop_event.set()
-            self._process_monitor_thread.join(timeout=PROCESS_SHUTDOWN_TIMEOUT)
+        """Stop the process supervisor."""
+        self._supervisor.stop(timeout=PROCESS_SHUTDOWN_TIMEOUT)
 
     def update_search_paths(self, primary_path: Optional[str], backup_path: Optional[str]) -> None:
         if primary_path:
@@ -243,53 +315,90 @@ class FoxgloveAppLogic:
             PROCESS_NAMES["BAZEL_TOOLS_VIZ"],
             PROCESS_NAMES["BAZEL_BAG_GUI"],
         }
-        with self._processes_lock:
-            return any(p["process"].poll() is None and p["name"] in viz_processes for p in self.running_processes)
+        return any(self._is_process_running_by_name(name) for name in viz_processes)
 
     def _terminate_process_by_name(self, name: str) -> None:
-        with self._processes_lock:
-            targets = [proc_info for proc_info in self.running_processes if proc_info["name"] == name]
-
-        for proc_info in targets:
-            if proc_info["name"] == name:
-                proc = proc_info["process"]
-                if proc.poll() is None:
-                    self._kill_proc(proc, name)
-                with self._processes_lock:
-                    if proc_info in self.running_processes:
-                        self.running_processes.remove(proc_info)
+        self._stop_processes(self._processes.by_name(name))
 
     def _is_process_running_by_name(self, name):
-        with self._processes_lock:
-            processes_snapshot = list(self.running_processes)
-        for proc_info in processes_snapshot:
-            if proc_info["name"] == name:
-                if proc_info["process"].poll() is None:
-                    return True
-        return False
-
-    def _kill_proc(self, proc, name: str) -> None:
+        return any(self._is_running(record) for record in self._processes.by_name(name))
+
+    def _running_with_path(self, name, path, command):
+        """The running *name* started with *command* that shows *path*, if any (relaunching it would change nothing)."""
+        if not path:
+            return None
+        records = self._processes.by_path(path)
+        return next((r for r in records if r.name == name and r.command == command and self._is_running(r)), None)
+
+    def _stop_process(self, record):
+        """Stop tracking *record* and terminate its process group; ``False`` if it had already exited."""
+        return bool(self._stop_processes([record])[0])
+
+    def _stop_processes(self, records):
+        """Stop tracking *records* and terminate their process groups, all at once.
+
+        Every group is sent SIGTERM up front and they share one
+        ``PROCESS_TERMINATE_TIMEOUT`` to exit; only the stragglers are then
+        killed, so stopping any number of tools takes at most
+        ``PROCESS_TERMINATE_TIMEOUT + PROCESS_KILL_TIMEOUT``.
+
+        Returns ``(stopped, killed)``: the records that were still running,
+        and those among them that had to be killed.
+        """
+        stopped = []
+        for record in records:
+            self._processes.remove(record.id)
+            self._sampler.untrack(record.id)
+            if record.process.poll() is None:
+                record.stopping = True
+                self._signal_group(record.process, kill=False)
+                stopped.append(record)
+        killed = self._wait_for_exit(stopped, time.monotonic() + PROCESS_TERMINATE_TIMEOUT)
+        for record in killed:
+            logger.info(
+                "%s (PID: %s) ignored SIGTERM for %ss; killing it", record.name, record.pid, PROCESS_TERMINATE_TIMEOUT
+            )
+            self._signal_group(record.process, kill=True)
+        for record in self._wait_for_exit(killed, time.monotonic() + PROCESS_KILL_TIMEOUT):
+            self.log_callback(f"Process {record.name} (PID: {record.pid}) is unresponsive to SIGKILL", is_error=True)
+        return stopped, killed
+
+    @staticmethod
+    def _signal_group(proc, kill):
+        """Send SIGTERM (or SIGKILL) to *proc*'s process group; on Windows, terminate/kill *proc* itself."""
         try:
             if sys.platform != "win32":
-                os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
+                os.killpg(os.getpgid(proc.pid), signal.SIGKILL if kill else signal.SIGTERM)
+            elif kill:
+                proc.kill()
             else:
                 proc.terminate()
-            proc.wait(timeout=3)
-        except subprocess.TimeoutExpired:
-            try:
-                if sys.platform != "win32":
-                    os.killpg(os.getpgid(proc.pid), signal.SIGKILL)
-                else:
-                    proc.kill()
-                proc.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.log_callback(f"Process {name} (PID: {proc.pid}) is unresponsive to SIGKILL", is_error=True)
-            except (ProcessLookupError, PermissionError, OSError):
-                pass
         except (ProcessLookupError, PermissionError, OSError):
             pass
 
-    def _launch_process(self, command, name, cwd=None, mcap_path=None, startup_timeout=10, single_instance=None):
+    @staticmethod
+    def _wait_for_exit(records, deadline):
+        """Poll *records*' processes until all have exited or *deadline* passes; returns those still running."""
+        pending = [record for record in records if record.process.poll() is None]
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(0.05, remaining))
+            pending = [record for record in pending if record.process.poll() is None]
+        return pending
+
+    def _launch_process(
+        self,
+        command,
+        name,
+        cwd=None,
+        mcap_path=None,
+        startup_timeout=10,
+        single_instance=None,
+        env=None,
+        prebuilt=False,
+    ):
         if name == "Foxglove Studio (Browser)":
             if mcap_path:
                 return self.launch_foxglove_browser(mcap_path)
@@ -301,6 +410,9 @@ class FoxgloveAppLogic:
             if self._is_process_running_by_name(name):
                 return f"{name} is already running.", None, None
         elif name == "Foxglove Studio":
+            record = self._running_with_path(name, mcap_path, command)
+            if record is not None:
+                return f"{name} already has {os.path.basename(mcap_path)} open.", None, record.id
             self._terminate_process_by_name(name)
         elif name in ["Bazel Bag GUI", "MPV Video"]:
             if single_instance is None:
@@ -314,22 +426,33 @@ class FoxgloveAppLogic:
 
             preexec_fn = os.setsid if sys.platform != "win32" else None
 
-            proc = subprocess.Popen(
-                command,
-                cwd=cwd,
-                shell=use_shell,
-                preexec_fn=preexec_fn,
-                stdin=subprocess.DEVNULL,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
+            requested_at = getattr(self._launch_context, "requested_at", None) or time.monotonic()
+            # Output goes straight to a file, not a pipe: the tool outlives a crash of this application.
+            output = self._output.create(name)
+            try:
+                proc = subprocess.Popen(
+                    command,
+                    cwd=cwd,
+                    env=env,
+                    shell=use_shell,
+                    preexec_fn=preexec_fn,
+                    stdin=subprocess.DEVNULL,
+                    stdout=output.sink if output is not None else subprocess.DEVNULL,
+                    stderr=subprocess.STDOUT,
+                )
+            except BaseException:
+                self._output.discard(output)
+                raise
+            spawned_at = time.monotonic()
+            output = self._output.attach(output, proc)
 
             try:
                 time.sleep(0.1)
                 if proc.poll() is not None:
                     return (
                         None,
-                        f"Process {name} failed to start (exited immediately). Check command and working directory.",
+                        f"Process {name} failed to start (exited immediately). Check command and working directory."
+                        + self._last_output_lines(output),
                         None,
                     )
 
@@ -338,22 +461,17 @@ class FoxgloveAppLogic:
             except Exception as e:
                 self.log_callback(f"Warning: Could not validate startup for {name}: {e}", is_error=True)
 
-            with self._processes_lock:
-                proc_id = self._process_id_counter
-                self._process_id_counter += 1
-                self.running_processes.append(
-                    {
-                        "name": name,
-                        "process": proc,
-                        "path": mcap_path,
-                        "command": command,
-                        "cwd": cwd,
-                        "start_time": time.time(),
-                        "id": proc_id,
-                    }
-                )
+            record = self._processes.add(name, proc, command, cwd, mcap_path, output, prebuilt)
+            proc_id = record.id
+            if output is not None:
+                output.key = proc_id
+            self._supervisor.watch(proc_id, proc)
+            if preexec_fn is not None:  # own session: the group id is the pid
+                self._sampler.track(proc_id, proc.pid)
+            self._watch_readiness(record, requested_at, spawned_at)
 
-            return f"{name} launched (PID: {proc.pid}).", None, proc_id
+            via = ", prebuilt binary" if prebuilt else ""
+            return f"{name} launched (PID: {proc.pid}{via}).", None, proc_id
 
         except FileNotFoundError:
             cmd_str = command if use_shell else command[0]
@@ -370,6 +488,83 @@ class FoxgloveAppLogic:
         except Exception as e:
             return None, f"Failed to launch {name}: {e}", None
 
+    @staticmethod
+    def _last_output_lines(output, count=5):
+        """The final lines a process wrote so far, formatted for an error message ("" if none).
+
+        Reads what is in its output file right now; never waits for more.
+        """
+        if output is None:
+            return ""
+        output.update()
+        lines = [line for line in output.tail(count) if line.strip()]
+        if not lines:
+            return ""
+        return "\nLast output:\n" + "\n".join(f"   {line}" for line in lines)
+
+    def _readiness_probe(self, record):
+        """How to tell that *record*'s tool is usable, and the name its latency is recorded under."""
+        name, command = record.name, record.command
+        args = command.split() if isinstance(command, str) else [str(arg) for arg in command]
+        ipc = socket_path_from_command(args)
+        if ipc is not None:
+            if "--idle=yes" in args:
+                return f"{name} (pre-warm)", MpvIpcProbe(ipc)
+            return name, MpvIpcProbe(ipc, require="playback-time")
+        if record.prebuilt:
+            name = f"{name} (prebuilt)"
+        if WindowProbe.available():
+            return name, WindowProbe(record.pid)
+        if args[:2] == ["bazel", "run"] and record.output is not None:
+            return name, OutputProbe(record.output, BAZEL_RUN_STARTED)
+        return name, None
+
+    def _watch_readiness(self, record, requested_at, spawned_at):
+        """Record the launch latency of *record* once its tool is ready (on a background thread)."""
+        tool, probe = self._readiness_probe(record)
+        threading.Thread(
+            target=self._await_ready,
+            args=(record, tool, probe, requested_at, spawned_at),
+            daemon=True,
+            name=f"LaunchReady-{record.id}",
+        ).start()
+
+    def _await_ready(self, record, tool, probe, requested_at, spawned_at):
+        ready_s = None
+        if probe is not None:
+            try:
+                if probe.wait(record.process, spawned_at + LAUNCH_READY_TIMEOUT):
+                    ready_s = time.monotonic() - spawned_at
+            except Exception as e:
+                logger.warning("Readiness probe for %s failed: %s", tool, e)
+        previous = self._launch_metrics.summary(tool)
+        self._launch_metrics.record(tool, spawned_at - requested_at, ready_s, probe.kind if probe else None)
+        if probe is None:
+            return
+        if ready_s is None:
+            if record.process.poll() is None:
+                self.log_callback(f"{tool} did not signal readiness ({probe.kind}) within {LAUNCH_READY_TIMEOUT}s.")
+            return
+        record.ready_after = ready_s
+        message = f"{tool} ready after {ready_s:.1f}s (spawned in {(spawned_at - requested_at) * 1000:.0f} ms)"
+        if previous and previous["ready_samples"] >= 5:
+            message += f"; usually {previous['ready_median']:.1f}s"
+            if ready_s > 1.5 * previous["ready_p90"]:
+                self.log_callback(
+                    f"⚠️ {message} — well above the recent p90 of {previous['ready_p90']:.1f}s.", is_error=True
+                )
+                return
+        self.log_callback(f"{message}.")
+
+    def launch_metrics(self):
+        """Median / p90 launch latencies per tool (see :meth:`LaunchMetrics.summary`)."""
+        return self._launch_metrics.summaries()
+
+    def process_outputs(self) -> List[ProcessOutput]:
+        """Captured output of launched processes, oldest first (recently exited ones included)."""
+        return self._output.outputs()
+
+    @_launch_request
     def launch_foxglove(self, mcap_filepath_absolute, settings):
         self._max_foxglove_files = settings.get("max_foxglove_files", 50)
 
@@ -397,6 +592,7 @@ class FoxgloveAppLogic:
                 )
             return self.launch_foxglove_desktop_multiple(mcap_filepaths)
 
+    @_launch_request
     def launch_foxglove_desktop(self, mcap_filepath_absolute):
         if not mcap_filepath_absolute:
             return None, "No MCAP file path provided", None
@@ -407,6 +603,7 @@ class FoxgloveAppLogic:
         command = ["foxglove-studio", "--file", mcap_filepath_absolute]
         return self._launch_process(command, "Foxglove Studio", mcap_path=mcap_filepath_absolute)
 
+    @_launch_request
     def launch_foxglove_desktop_multiple(self, mcap_filepaths):
         if not mcap_filepaths:
             return None, "No MCAP files provided", None
@@ -475,71 +672,129 @@ class FoxgloveAppLogic:
             return f"{base_command} -- --start-offset {int(start_time)} --rate={rate} {files_str}"
         return f"{base_command} -- --rate={rate} {files_str}"
 
+    def _launch_bazel_target(self, command, name, settings, **kwargs):
+        """Launch a ``bazel run`` *command* from the Bazel working directory.
+
+        When the target's prebuilt binary is known and current it is exec'd
+        directly; otherwise ``bazel run`` is used (and builds the target if
+        needed) while the binary is resolved in the background for next time.
+        """
+        run = parse_bazel_run(command) if settings.get("exec_prebuilt_bazel_tools", True) else None
+        if run is not None:
+            tool = self._bazel_targets.lookup(self.bazel_working_dir, run)
+            if tool is not None:
+                env = dict(os.environ, BUILD_WORKING_DIRECTORY=self.bazel_working_dir, **tool.env)
+                result = self._launch_process(
+                    [tool.binary, *run.args], name, cwd=tool.cwd, env=env, prebuilt=True, **kwargs
+                )
+                if result[1] is None:
+                    return result
+                # Stale or broken outputs: let bazel run rebuild, and resolve the target again afterwards.
+                self.log_callback(f"Prebuilt {name} failed to start; falling back to bazel run.", is_error=True)
+                self._bazel_targets.forget(self.bazel_working_dir, run)
+        result = self._launch_process(command, name, cwd=self.bazel_working_dir, **kwargs)
+        if run is not None and result[1] is None:
+            self._bazel_targets.resolve_async(self.bazel_working_dir, run)
+        return result
+
+    @_launch_request
     def launch_bazel_tools_viz(self, settings):
         self.bazel_working_dir = self.get_bazel_working_dir(settings)
         if not self.bazel_working_dir or not os.path.isdir(self.bazel_working_dir):
             return None, f"Bazel working directory not found: {self.bazel_working_dir}", None
         command = DEFAULT_SETTINGS["bazel_tools_viz_cmd"]
-        return self._launch_process(command, "Bazel Tools Viz", cwd=self.bazel_working_dir)
+        return self._launch_bazel_target(command, "Bazel Tools Viz", settings)
 
+    @_launch_request
     def launch_bazel_tool(self, settings, command, tool_name):
         self.bazel_working_dir = self.get_bazel_working_dir(settings)
         if not self.bazel_working_dir or not os.path.isdir(self.bazel_working_dir):
             return None, f"Bazel working directory not found: {self.bazel_working_dir}", None
-        return self._launch_process(command, tool_name, cwd=self.bazel_working_dir)
-
-    def run_bazel_build(self, settings):
+        return self._launch_bazel_target(command, tool_name, settings)
+
+    @staticmethod
+    def bazel_build_targets(settings):
+        """Targets the Build button builds: the configured tool targets, or ``//...``."""
+        if settings.get("build_tool_targets_only", True):
+            targets = settings.get("bazel_build_targets", DEFAULT_SETTINGS["bazel_build_targets"]).split()
+            if targets:
+                return targets
+        return ["//..."]
+
+    def run_bazel_build(self, settings, on_progress=None):
+        """Build :meth:`bazel_build_targets`; returns ``(message, error)``. Blocks: run it on a worker thread.
+
+        In tools-only mode the build is skipped when the workspace's sources
+        are unchanged since the last successful build of the same targets.
+        Only a summary is logged; *on_progress* gets throttled progress texts
+        (see :class:`BazelBuild`) on the calling thread.
+        """
         self.bazel_working_dir = self.get_bazel_working_dir(settings)
         if not self.bazel_working_dir or not os.path.isdir(self.bazel_working_dir):
             return None, f"Bazel working directory not found: {self.bazel_working_dir}"
 
-        self.log_callback("Running: bazel build //...")
-        self.log_callback("=" * 60)
+        targets = self.bazel_build_targets(settings)
+        fingerprint = None
+        if targets != ["//..."]:
+            fingerprint = source_fingerprint(self.bazel_working_dir, targets)
+            if fingerprint is not None and fingerprint == self._build_stamps.get(self.bazel_working_dir):
+                return f"✓ No source changes since the last successful build of {' '.join(targets)}; skipped.", None
+
+        self.log_callback(f"Running: bazel build {' '.join(targets)}")
+        # The build replaces outputs: launch with bazel run until the binaries are resolved again.
+        self._bazel_targets.invalidate()
+        self._build_stamps.set(self.bazel_working_dir, None)
+        build = self._build = BazelBuild(self.bazel_working_dir, targets)
         try:
-            process = subprocess.Popen(
-                ["bazel", "build", "//..."],
-                cwd=self.bazel_working_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-            )
-
-            for line in process.stdout:
-                line = line.rstrip()
-                if line:
-                    self.log_callback(line)
-
-            return_code = process.wait(timeout=600)
-            self.log_callback("=" * 60)
-
-            if return_code == 0:
-                return "✓ Bazel build completed successfully.", None
-            else:
-                return None, f"Build failed with exit code {return_code}"
-
-        except subprocess.TimeoutExpired:
-            process.kill()
-            return None, "Build timed out after 10 minutes"
+            return_code = build.run(on_progress)
         except FileNotFoundError:
             return None, "Bazel command not found. Ensure bazel is installed and in PATH."
         except Exception as e:
             return None, f"Build error: {e}"
+        finally:
+            self._build = None
+
+        self.log_callback("=" * 60)
+        for line in build.state.summary_lines():
+            self.log_callback(line)
+        self.log_callback(f"Full build output: {build.log_path}")
+        self.log_callback("=" * 60)
 
+        if build.cancelled:
+            return None, "Build cancelled"
+        if return_code is None:
+            return None, f"Build timed out after {BAZEL_BUILD_TIMEOUT // 60} minutes"
+        if return_code == 0:
+            self._build_stamps.set(self.bazel_working_dir, fingerprint)
+            # Fresh outputs: look the launched tools' binaries up again.
+            self._bazel_targets.refresh()
+            return "✓ Bazel build completed successfully.", None
+        return None, f"Build failed with exit code {return_code}"
+
+    def cancel_bazel_build(self):
+        """Stop the running :meth:`run_bazel_build`; ``False`` when no build is running."""
+        build = self._build
+        if build is None:
+            return False
+        build.cancel()
+        return True
+
+    @_launch_request
     def launch_bazel_bag_gui(self, mcap_path, settings, start_time=None):
         self.bazel_working_dir = self.get_bazel_working_dir(settings)
         base_command = DEFAULT_SETTINGS["bazel_bag_gui_cmd"]
         command = self._build_bazel_bag_cmd(
             base_command, settings.get("bazel_bag_gui_rate", 1.0), mcap_path, start_time
         )
-        return self._launch_process(
+        return self._launch_bazel_target(
             command,
             "Bazel Bag GUI",
-            cwd=self.bazel_working_dir,
+            settings,
             mcap_path=mcap_path,
             single_instance=settings.get("single_instance_rosbag", True),
         )
 
+    @_launch_request
     def play_bazel_bag_gui_with_symlinks(self, mcap_filepaths, settings, start_time=None):
         self.bazel_working_dir = self.get_bazel_working_dir(settings)
         symlink_logic = SymlinkPlaybackLogic(log_callback=self.log_callback)
@@ -554,15 +809,16 @@ class FoxgloveAppLogic:
         command = self._build_bazel_bag_cmd(
             base_command, settings.get("bazel_bag_gui_rate", 1.0), files_str, start_time
         )
-        message, error, proc_id = self._launch_process(
+        message, error, proc_id = self._launch_bazel_target(
             command,
             "Bazel Bag GUI",
-            cwd=self.bazel_working_dir,
+            settings,
             mcap_path=symlink_dir,
             single_instance=settings.get("single_instance_rosbag", True),
         )
         return message, error, symlink_dir, proc_id
 
+    @_launch_request
     def launch_mpv_video(self, video_filepath, start_offset, settings):
         if not video_filepath:
             return None, "No video file path provided", None
@@ -572,59 +828,114 @@ class FoxgloveAppLogic:
 
         single_instance = settings.get("single_instance_video", True)
         command = ["mpv", f"--start={int(start_offset)}", video_filepath]
+        if single_instance and self._mpv_ipc is not None:
+            reused = self._play_in_running_mpv(video_filepath, start_offset)
+            if reused is not None:
+                return reused
+            command.insert(1, f"--input-ipc-server={self._mpv_ipc.socket_path}")
         return self._launch_process(command, "MPV Video", mcap_path=video_filepath, single_instance=single_instance)
 
+    @_launch_request
+    def prewarm_mpv(self, settings):
+        """Start an idle, IPC-controlled mpv window so the first video only needs a ``loadfile``.
+
+        Does nothing unless single-instance video is on and IPC is supported,
+        or when an mpv is already running.  Returns a ``_launch_process``-style
+        result; the player is tracked like any other launch.
+        """
+        name = PROCESS_NAMES["MPV_VIDEO"]
+        if self._mpv_ipc is None or not settings.get("single_instance_video", True):
+            return None, None, None
+        if self._is_process_running_by_name(name):
+            return None, None, None
+        command = ["mpv", "--idle=yes", "--force-window=yes", f"--input-ipc-server={self._mpv_ipc.socket_path}"]
+        message, error, proc_id = self._launch_process(command, name, single_instance=True)
+        if message:
+            message = f"Pre-warmed {message}"
+        return message, error, proc_id
+
+    def _play_in_running_mpv(self, video_filepath, start_offset):
+        """Point the tracked mpv at *video_filepath*/*start_offset* over IPC.
+
+        Returns a ``_launch_process``-style result, or ``None`` when there is
+        no live mpv or it did not answer (the caller then relaunches it).
+        """
+        name = PROCESS_NAMES["MPV_VIDEO"]
+        running = [
+            r for r in self._processes.by_name(name) if socket_path_from_command(r.command) and self._is_running(r)
+        ]
+        if not running:
+            return None
+        record = running[-1]
+        socket_path = socket_path_from_command(record.command)
+        if socket_path != self._mpv_ipc.socket_path:
+            # Adopted from an earlier session: keep driving it on the socket it was started with.
+            self._mpv_ipc.close()
+            self._mpv_ipc = MpvIpcClient(socket_path)
+        # A player started a moment ago may still be creating its socket.
+        wait = IPC_TIMEOUT if time.time() - record.start_time < 5 else 0.0
+        started = time.perf_counter()
+        try:
+            action = self._mpv_ipc.play(video_filepath, start_offset, wait=wait)
+        except MpvIpcError as e:
+            logger.info("mpv IPC unavailable, relaunching: %s", e)
+            return None
+        self._processes.set_path(record, video_filepath)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        verb = "Seeked" if action == "seek" else "Loaded"
+        return (
+            f"{verb} {os.path.basename(video_filepath)} at {int(start_offset)}s in running {name} "
+            f"({elapsed_ms:.0f} ms).",
+            None,
+            record.id,
+        )
+
     def check_process_loaded(self, process_name):
-        with self._processes_lock:
-            processes_snapshot = list(self.running_processes)
-        for proc_info in processes_snapshot:
-            if proc_info["name"] == process_name:
-                if proc_info["process"].poll() is None:
-                    runtime = time.time() - proc_info["start_time"]
-                    return True, f"{process_name} is running (runtime: {runtime:.1f}s, PID: {proc_info['process'].pid})"
-                else:
-                    return False, f"{process_name} has exited unexpectedly"
+        for record in self._processes.by_name(process_name):
+            if self._is_running(record):
+                runtime = time.time() - record.start_time
+                return True, f"{process_name} is running (runtime: {runtime:.1f}s, PID: {record.pid})"
+            else:
+                return False, f"{process_name} has exited unexpectedly"
         return False, f"{process_name} not found in running processes"
 
     def terminate_process_by_id(self, proc_id: int) -> bool:
-        with self._processes_lock:
-            processes_snapshot = list(self.running_processes)
-
-        for proc_info in processes_snapshot:
-            if proc_info.get("id") == proc_id:
-                proc = proc_info["process"]
-                name = proc_info["name"]
-                if proc.poll() is None:
-                    self._kill_proc(proc, name)
-                    self.log_callback(f"{name} terminated (ID: {proc_id}).")
-                with self._processes_lock:
-                    if proc_info in self.running_processes:
-                        self.running_processes.remove(proc_info)
-                return True
-        return False
+        record = self._processes.get(proc_id)
+        if record is None:
+            return False
+        if self._stop_process(record):
+            self.log_callback(f"{record.name} terminated (ID: {proc_id}).")
+        return True
 
     def terminate_all_processes(self):
         self._stop_process_monitor()
+        self._sampler.stop()
         msgs = []
-        with self._processes_lock:
-            processes_snapshot = list(self.running_processes)
+        records = self._processes.snapshot()
 
-        if not processes_snapshot:
+        if not records:
             msgs.append("No processes were recorded as running by this application.")
-        for proc_info in processes_snapshot:
-            proc, name = proc_info["process"], proc_info["name"]
-            if proc.poll() is None:
-                msgs.append(f"Terminating {name} (PID: {proc.pid})...")
-                try:
-                    self._kill_proc(proc, name)
-                    msgs.append(f"{name} terminated.")
-                except Exception as e:
-                    msgs.append(f"Error terminating {name}: {e}")
+        for record in records:
+            if record.process.poll() is None:
+                msgs.append(f"Terminating {record.name} (PID: {record.pid})...")
             else:
-                msgs.append(f"{name} (PID: {proc.pid}) was already terminated.")
-            with self._processes_lock:
-                if proc_info in self.running_processes:
-                    self.running_processes.remove(proc_info)
+                msgs.append(f"{record.name} (PID: {record.pid}) was already terminated.")
+        started = time.monotonic()
+        stopped, killed = self._stop_processes(records)
+        for record in stopped:
+            if record in killed:
+                msgs.append(f"{record.name} killed (did not exit within {PROCESS_TERMINATE_TIMEOUT}s of SIGTERM).")
+            else:
+                msgs.append(f"{record.name} terminated.")
+        if stopped:
+            msgs.append(f"Stopped {len(stopped)} process(es) in {time.monotonic() - started:.1f}s.")
+        if self._mpv_ipc is not None:
+            self._mpv_ipc.close()
+            if os.path.exists(self._mpv_ipc.socket_path):
+                try:
+                    os.remove(self._mpv_ipc.socket_path)
+                except OSError:
+                    pass
         symlink_dir = "/tmp/selected_bags_symlinks"
         if os.path.exists(symlink_dir):
             try:
@@ -0,0 +1,206 @@
+"""Streaming export of event rows to CSV, JSON Lines and a columnar file.
+
+:func:`export_events` writes a selection of an :class:`EventStore`'s rows
+(typically the viewer's current filter result) in chunks of
+:data:`EXPORT_CHUNK_ROWS`.  Row tuples are read straight from the store and
+handed to the writers chunk by chunk, so memory stays bounded regardless of the
+number of rows and the file can be written from a background thread.
+
+Formats (chosen by file extension, see :data:`EXPORT_FORMATS`):
+
+* ``.csv`` — a header row with the column ids, then one record per event.
+* ``.jsonl`` — one JSON object per event keyed by column id.
+* ``.evcol`` — a Parquet-style columnar file made of row groups, readable with
+  :func:`read_columnar` and simple to parse from other languages::
+
+      b"EVCOL1\\n"
+      {"columns": [...], "epochs": true}\\n          file header (JSON line)
+      {"rows": n, "chunks": [{"categories": [...] | null, "size": k}, ...]}\\n
+      <chunk bytes of each column, then n little-endian float64 epochs>
+      ... next row group ...
+
+  A chunk with ``categories`` holds one code byte per row indexing that list;
+  otherwise it is the column's values joined with ``\\t`` in UTF-8.  Values
+  parsed from event logs never contain tabs; if one does, the chunk is marked
+  ``"escaped": true`` and every value has ``\\`` written as ``\\\\`` and a tab
+  as ``\\t``.  Epochs are naive seconds, NaN where the timestamp did not
+  parse, and only present when the store's time index was built.
+"""
+
+import csv
+import json
+import re
+import sys
+from array import array
+from itertools import islice
+from json.encoder import encode_basestring
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .event_loader import EncodedColumn, decode_column, encode_column
+from .event_store import EventStore
+
+#: Rows written per chunk (and per row group of a columnar file).
+EXPORT_CHUNK_ROWS = 65536
+
+#: Columnar file signature.
+COLUMNAR_MAGIC = b"EVCOL1\n"
+
+#: File extension → human-readable format name, for save dialogs.
+EXPORT_FORMATS: Dict[str, str] = {
+    ".csv": "CSV",
+    ".jsonl": "JSON Lines",
+    ".evcol": "Columnar (row groups)",
+}
+
+# An escaped text chunk's "\\x" sequences ("\\t" is a tab, anything else the character itself).
+_ESCAPED = re.compile(r"\\(.)", re.DOTALL)
+
+
+class ExportCancelled(Exception):
+    """Raised inside :func:`export_events` when *should_cancel* returns ``True``."""
+
+
+def _chunks(rows: Sequence[int]) -> Iterator[Sequence[int]]:
+    if isinstance(rows, range):
+        for start in range(0, len(rows), EXPORT_CHUNK_ROWS):
+            yield rows[start : start + EXPORT_CHUNK_ROWS]
+        return
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, EXPORT_CHUNK_ROWS))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _write_csv(fh, store: EventStore, chunks: Iterator[Sequence[int]]) -> Iterator[int]:
+    writer = csv.writer(fh)
+    writer.writerow(store.column_ids)
+    for chunk in chunks:
+        writer.writerows(map(store.__getitem__, chunk))
+        yield len(chunk)
+
+
+def _write_jsonl(fh, store: EventStore, chunks: Iterator[Sequence[int]]) -> Iterator[int]:
+    # Pre-encode the keys once; each value goes through the C string encoder.
+    prefixes = [("{" if j == 0 else ", ") + encode_basestring(c) + ": " for j, c in enumerate(store.column_ids)]
+    width = len(prefixes)
+    template = "".join(prefix + "%s" for prefix in prefixes) + "}\n"
+    for chunk in chunks:
+        lines = []
+        for row in map(store.__getitem__, chunk):
+            values = tuple(map(encode_basestring, map(str, row[:width])))
+            if len(values) < width:
+                values += ('""',) * (width - len(values))
+            lines.append(template % values)
+        fh.write("".join(lines))
+        yield len(chunk)
+
+
+def _encode_text_column(values: List[str]) -> Tuple[EncodedColumn, bool]:
+    """:func:`encode_column`, escaping the values of a text chunk when one contains a tab."""
+    column = encode_column(values)
+    if column.categories is not None or not any("\t" in value for value in values):
+        return column, False
+    escaped = [value.replace("\\", "\\\\").replace("\t", "\\t") for value in values]
+    return EncodedColumn(None, "\t".join(escaped).encode("utf-8")), True
+
+
+def _unescape(value: str) -> str:
+    return _ESCAPED.sub(lambda m: "\t" if m.group(1) == "t" else m.group(1), value)
+
+
+def _write_columnar(fh, store: EventStore, chunks: Iterator[Sequence[int]]) -> Iterator[int]:
+    width = len(store.column_ids)
+    time_index = store.time_index
+    fh.write(COLUMNAR_MAGIC)
+    header = {"columns": list(store.column_ids), "epochs": time_index is not None}
+    fh.write(json.dumps(header).encode("utf-8") + b"\n")
+    for chunk in chunks:
+        rows = list(map(store.__getitem__, chunk))
+        chunks_meta = []
+        columns = []
+        for j in range(width):
+            column, escaped = _encode_text_column([str(row[j]) if j < len(row) else "" for row in rows])
+            meta = {"categories": column.categories, "size": len(column.data)}
+            if escaped:
+                meta["escaped"] = True
+            chunks_meta.append(meta)
+            columns.append(column)
+        group = {"rows": len(rows), "chunks": chunks_meta}
+        fh.write(json.dumps(group).encode("utf-8") + b"\n")
+        for column in columns:
+            fh.write(column.data)
+        if time_index is not None:
+            epochs = time_index.epochs_at(chunk)
+            if sys.byteorder != "little":
+                epochs.byteswap()
+            fh.write(epochs.tobytes())
+        yield len(rows)
+
+
+_WRITERS: Dict[str, Tuple[Callable[..., Iterator[int]], Dict[str, str]]] = {
+    ".csv": (_write_csv, {"mode": "w", "encoding": "utf-8", "newline": ""}),
+    ".jsonl": (_write_jsonl, {"mode": "w", "encoding": "utf-8"}),
+    ".evcol": (_write_columnar, {"mode": "wb"}),
+}
+
+
+def export_format(path: str) -> str:
+    """The :data:`EXPORT_FORMATS` key for *path*; raises ``ValueError`` for unknown extensions."""
+    lowered = path.lower()
+    for extension in _WRITERS:
+        if lowered.endswith(extension):
+            return extension
+    raise ValueError(f"Unsupported export format: {path!r} (use {', '.join(EXPORT_FORMATS)})")
+
+
+def export_events(
+    store: EventStore,
+    rows: Sequence[int],
+    path: str,
+    progress: Optional[Callable[[int, int], None]] = None,
+    should_cancel: Optional[Callable[[], bool]] = None,
+) -> int:
+    """Write *rows* of *store* to *path* in the format implied by its extension.
+
+    *progress(done, total)* is called after every chunk; when *should_cancel*
+    returns ``True`` the export stops with :class:`ExportCancelled` (the
+    partial file is left in place).  Returns the number of rows written.
+    """
+    writer, open_kwargs = _WRITERS[export_format(path)]
+    total, done = len(rows), 0
+    with open(path, **open_kwargs) as fh:  # type: ignore[call-overload]
+        for written in writer(fh, store, _chunks(rows)):
+            done += written
+            if progress is not None:
+                progress(done, total)
+            if should_cancel is not None and should_cancel():
+                raise ExportCancelled(f"Export cancelled after {done} of {total} rows")
+    return done
+
+
+def read_columnar(path: str) -> Tuple[List[str], List[Tuple[str, ...]], Optional["array[float]"]]:
+    """Read a ``.evcol`` file back into ``(column_ids, rows, epochs)`` (``epochs`` is ``None`` if absent)."""
+    with open(path, "rb") as fh:
+        if fh.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+            raise ValueError(f"Not an event columnar file: {path!r}")
+        header = json.loads(fh.readline())
+        column_ids: List[str] = header["columns"]
+        epochs: Optional["array[float]"] = array("d") if header["epochs"] else None
+        rows: List[Tuple[str, ...]] = []
+        for line in iter(fh.readline, b""):
+            group = json.loads(line)
+            count = group["rows"]
+            columns = []
+            for chunk in group["chunks"]:
+                values = decode_column(EncodedColumn(chunk["categories"], fh.read(chunk["size"])), count)
+                columns.append([_unescape(value) for value in values] if chunk.get("escaped") else values)
+            rows.extend(zip(*columns))
+            if epochs is not None:
+                group_epochs = array("d")
+                group_epochs.frombytes(fh.read(8 * count))
+                if sys.byteorder != "little":
+                    group_epochs.byteswap()
+                epochs.extend(group_epochs)
+    return column_ids, rows, epochs
@@ -0,0 +1,122 @@
+"""Inverted token index for event log search.
+
+The event log viewer filters rows with a case-insensitive substring match over
+the space-joined columns of each event.  Scanning every row on every keystroke
+is O(rows × row length); :class:`EventSearchIndex` instead tokenises each row
+once (on whitespace) and keeps a posting list of row numbers per token.
+
+A query is split on whitespace into *pieces*.  A piece without whitespace can
+only occur inside a single row token, so the rows containing it are the union
+of the posting lists of the vocabulary tokens that contain the piece.  Pieces
+are intersected smallest-first, and multi-piece queries are verified against
+the joined row text so the result is identical to the original linear scan.
+
+Narrowing queries (the previous query is a substring of the new one) start
+from the previous result set, and vocabulary look-ups for a longer piece only
+re-scan the tokens that matched a shorter cached piece.
+"""
+
+from array import array
+from typing import Dict, List, Optional, Sequence, Set
+
+#: Upper bound on cached piece → vocabulary-token look-ups.
+_TOKEN_CACHE_LIMIT = 256
+
+
+def event_search_text(row: Sequence[str]) -> str:
+    """Return the lower-cased text a search query is matched against."""
+    return " ".join(str(c) for c in row).lower()
+
+
+class EventSearchIndex:
+    """Token → row-number posting lists over a fixed list of event rows.
+
+    Build once per loaded log (safe in a background thread) and query with
+    :meth:`search`.  Row numbers are indices into the *events* sequence.
+    """
+
+    def __init__(self, events: Sequence[Sequence[str]]) -> None:
+        self._events = events
+        self._postings: Dict[str, array] = {}
+        self._token_cache: Dict[str, List[str]] = {}
+        self._last_query = ""
+        self._last_result: Optional[List[int]] = None
+
+        postings = self._postings
+        for idx, row in enumerate(events):
+            for token in set(event_search_text(row).split()):
+                bucket = postings.get(token)
+                if bucket is None:
+                    postings[token] = array("I", (idx,))
+                else:
+                    bucket.append(idx)
+        self._vocabulary: List[str] = list(postings)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    @property
+    def vocabulary_size(self) -> int:
+        return len(self._vocabulary)
+
+    def search(self, text: str) -> List[int]:
+        """Return ascending row numbers whose joined text contains *text*.
+
+        Matching is case-insensitive and ignores leading/trailing whitespace,
+        mirroring the viewer's original ``search_text in " ".join(row).lower()``.
+        """
+        query = text.lower().strip()
+        if not query:
+            self._last_query, self._last_result = "", None
+            return list(range(len(self._events)))
+
+        pieces = query.split()
+
+        rows: Optional[Set[int]] = None
+        if self._last_result is not None and self._last_query and self._last_query in query:
+            rows = set(self._last_result)
+
+        for piece in sorted(set(pieces), key=len, reverse=True):
+            piece_rows = self._rows_containing(piece)
+            if rows is None:
+                rows = set(piece_rows)
+            else:
+                rows.intersection_update(piece_rows)
+            if not rows:
+                break
+
+        result = sorted(rows) if rows else []
+        if len(pieces) > 1 and result:
+            # Pieces may match in the wrong order or across other text — verify the phrase.
+            events = self._events
+            result = [i for i in result if query in event_search_text(events[i])]
+
+        self._last_query, self._last_result = query, result
+        return result
+
+    def _matching_tokens(self, piece: str) -> List[str]:
+        tokens = self._token_cache.get(piece)
+        if tokens is not None:
+            return tokens
+
+        # Any token containing *piece* also contains every cached sub-piece of it,
+        # so the smallest such cached match list is a valid search space.
+        source = self._vocabulary
+        for cached_piece, cached_tokens in self._token_cache.items():
+            if len(cached_tokens) < len(source) and cached_piece in piece:
+                source = cached_tokens
+
+        tokens = [t for t in source if piece in t]
+        if len(self._token_cache) >= _TOKEN_CACHE_LIMIT:
+            self._token_cache.clear()
+        self._token_cache[piece] = tokens
+        return tokens
+
+    def _rows_containing(self, piece: str):
+        postings = self._postings
+        tokens = self._matching_tokens(piece)
+        if not tokens:
+            return ()
+        if len(tokens) == 1:
+            return postings[tokens[0]]
+        return set().union(*(postings[t] for t in tokens))
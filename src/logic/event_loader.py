@@ -0,0 +1,218 @@
+"""Event log file parsing and the multi-file loading pipeline.
+
+:func:`parse_event_file` turns one ``event_log_*.txt`` into row tuples and is
+what a single viewer uses.  When a vehicle folder holds many logs,
+:class:`EventLogLoader` parses them in parallel in a
+:class:`~concurrent.futures.ProcessPoolExecutor` so the work is not serialised
+by the GIL.  Workers do not send row tuples back (pickling millions of small
+objects would cost about as much as parsing); each column is shipped as one
+compact buffer instead:
+
+* low-cardinality columns (criticality, UI mode, …) as a list of distinct
+  values plus one code byte per row;
+* other columns as their values joined with ``\\t`` in a single UTF-8 blob
+  (fields are tab-split, so they never contain a tab);
+* the parsed ``current_time`` epochs as the raw bytes of an ``array('d')``,
+  so the UI process gets its time index without reparsing.
+
+The UI process turns a payload back into an :class:`EventStore` off the Tk
+thread, and each log's future resolves independently so tabs fill in as
+their log finishes.
+
+Workers use the ``spawn`` start method: forking a Tk process that runs
+background threads is not safe.
+"""
+
+import multiprocessing
+import os
+import threading
+from array import array
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from ..utils.logger import get_logger
+from ..utils.timestamp_parser import TIMESTAMP_PARSER
+from .event_store import EventStore
+from .event_time_index import EventTimeIndex
+
+logger = get_logger(__name__)
+
+#: Columns with at most this many distinct values are shipped as one code byte per row.
+_MAX_CATEGORIES = 255
+
+
+def preprocess_event_log_lines(raw_lines: List[str]) -> List[str]:
+    """Strip blank lines and the header row; return lines ready for parsing."""
+    result: List[str] = []
+    for line in raw_lines:
+        stripped = line.rstrip("\n")
+        if not stripped.strip():
+            continue
+        if stripped.lstrip().startswith("current_time"):
+            continue  # Skip the column-header row
+        result.append(stripped)
+    return result
+
+
+def parse_event_file(file_path: str) -> List[Tuple[str, ...]]:
+    """Parse *file_path* into event rows without touching any Tkinter widget.
+
+    Safe to call from a background thread or worker process.  Returns a list
+    of 5-element tuples.
+    """
+    all_events: List[Tuple[str, ...]] = []
+    current_parts: Optional[List[str]] = None
+
+    with open(file_path, "r", encoding="utf-8") as fh:
+        raw_lines = fh.readlines()
+
+    for line in preprocess_event_log_lines(raw_lines):
+        try:
+            parts = [p.strip() for p in line.split("\t")]
+            if current_parts is None:
+                if len(parts) >= 5:
+                    all_events.append(tuple(parts[:5]))
+                elif parts and (line.startswith("\t") or parts[0] == ""):
+                    pass
+                else:
+                    current_parts = parts
+            else:
+                if line.startswith("\t") or (parts and parts[0] == ""):
+                    if parts and parts[0] == "":
+                        parts = parts[1:]
+                    current_parts.extend(parts)
+                else:
+                    if len(current_parts) >= 3 and parts:
+                        current_parts[2] = (current_parts[2] + " " + parts[0]).strip()
+                        if len(parts) > 1:
+                            current_parts.extend(parts[1:])
+                    else:
+                        current_parts.extend(parts)
+
+                if len(current_parts) >= 5:
+                    all_events.append(tuple(current_parts[:5]))
+                    current_parts = None
+        except Exception:  # nosec B110
+            pass
+
+    return all_events
+
+
+def load_event_store(file_path: str) -> EventStore:
+    """Parse *file_path* into an :class:`EventStore` (no Tkinter; safe off the UI thread)."""
+    return EventStore(parse_event_file(file_path), file_path)
+
+
+# Column buffers exchanged with worker processes
+class EncodedColumn(NamedTuple):
+    """One column: ``categories`` + a code byte per row, or (``categories is None``) tab-joined UTF-8."""
+
+    categories: Optional[List[str]]
+    data: bytes
+
+
+class EventColumnsPayload(NamedTuple):
+    """Everything a worker sends back for one parsed log."""
+
+    file_path: str
+    row_count: int
+    columns: Tuple[EncodedColumn, ...]
+    epochs: bytes
+
+
+def encode_column(values: Sequence[str]) -> EncodedColumn:
+    """Dictionary-encode *values* when they have few distinct values, else tab-join them."""
+    lookup: Dict[str, int] = {}
+    codes = bytearray()
+    for value in values:
+        code = lookup.get(value)
+        if code is None:
+            if len(lookup) >= _MAX_CATEGORIES:
+                return EncodedColumn(None, "\t".join(values).encode("utf-8"))
+            code = lookup[value] = len(lookup)
+        codes.append(code)
+    return EncodedColumn(list(lookup), bytes(codes))
+
+
+def decode_column(column: EncodedColumn, row_count: int) -> List[str]:
+    """Inverse of :func:`encode_column` for a column of *row_count* values."""
+    if column.categories is not None:
+        return list(map(column.categories.__getitem__, column.data))
+    if row_count == 0:
+        return []
+    return column.data.decode("utf-8").split("\t")
+
+
+def encode_event_file(file_path: str) -> EventColumnsPayload:
+    """Worker entry point: parse *file_path* and pack it into column buffers."""
+    rows = parse_event_file(file_path)
+    columns = tuple(encode_column(values) for values in zip(*rows)) if rows else ()
+    epochs = TIMESTAMP_PARSER.parse_column(row[0] for row in rows)
+    return EventColumnsPayload(file_path, len(rows), columns, epochs.tobytes())
+
+
+def decode_event_store(payload: EventColumnsPayload) -> EventStore:
+    """Rebuild an :class:`EventStore` (with its time index) from a worker payload."""
+    rows: List[Tuple[str, ...]] = list(zip(*(decode_column(c, payload.row_count) for c in payload.columns)))
+    epochs = array("d")
+    epochs.frombytes(payload.epochs)
+    return EventStore(rows, payload.file_path, time_index=EventTimeIndex(epochs))
+
+
+class EventLogLoader:
+    """Parses many event logs in parallel worker processes.
+
+    The pool is created on first use and kept for later folders; call
+    :meth:`shutdown` when the application exits.  If worker processes cannot
+    be started, logs are parsed in background threads instead.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self._max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._pool
+
+    def load_many(self, file_paths: Sequence[str]) -> Dict[str, "Future[EventStore]"]:
+        """Start loading every path; each returned future resolves to that log's :class:`EventStore`."""
+        futures: Dict[str, "Future[EventStore]"] = {}
+        for path in file_paths:
+            result: "Future[EventStore]" = Future()
+            result.set_running_or_notify_cancel()
+            futures[path] = result
+            try:
+                parsed = self._get_pool().submit(encode_event_file, path)
+            except Exception as exc:
+                logger.warning("Process pool unavailable (%s); parsing %s in a thread", exc, path)
+                threading.Thread(target=self._load_in_thread, args=(path, result), daemon=True).start()
+                continue
+            parsed.add_done_callback(lambda f, out=result: self._decode(f, out))
+        return futures
+
+    @staticmethod
+    def _decode(parsed: "Future[EventColumnsPayload]", out: "Future[EventStore]") -> None:
+        try:
+            out.set_result(decode_event_store(parsed.result()))
+        except BaseException as exc:
+            out.set_exception(exc)
+
+    @staticmethod
+    def _load_in_thread(path: str, out: "Future[EventStore]") -> None:
+        try:
+            out.set_result(load_event_store(path))
+        except BaseException as exc:
+            out.set_exception(exc)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, abandoning queued work."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
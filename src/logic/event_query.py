@@ -0,0 +1,489 @@
+"""Structured query language for the event log search box.
+
+Besides plain substring search, the search box accepts queries such as::
+
+    criticality = HIGH and mode = AUTO and description contains brake between 10:00 and 10:30
+    (crit = high or crit = critical) and not desc ~ "test drive"
+    time >= "2025-09-19 10:00:00" source ~ front
+
+Grammar (keywords are case-insensitive; adjacent clauses are AND-ed)::
+
+    query   := or_expr
+    or_expr := and_expr ("or" and_expr)*
+    and_expr:= not_expr (["and"] not_expr)*
+    not_expr:= "not" not_expr | "(" or_expr ")" | clause
+    clause  := FIELD OP VALUE | [FIELD] "between" VALUE "and" VALUE | VALUE
+
+``OP`` is one of ``= != < > <= >= ~ contains``.  A bare ``VALUE`` is a
+substring match over the whole row, exactly like the plain search.  Values
+containing spaces or keywords must be quoted.  Comparisons on ``time`` use the
+parsed epoch column (``HH:MM[:SS]`` means that time on the log's first day;
+``time = 10:05`` matches the whole minute); other fields compare
+case-insensitively, numerically when both sides are numbers.
+
+A query is parsed once into a tree of closures (cached by text) and evaluated
+column-at-a-time over an :class:`EventColumnStore`: each clause yields a byte
+mask with one ``0``/``1`` byte per row, produced by C-level primitives
+(``bytes.translate`` over dictionary codes, slicing for time ranges), and
+boolean operators combine masks as big integers.  Only the final mask is
+expanded back into row numbers.
+"""
+
+import re
+from itertools import compress
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .event_index import event_search_text
+from .event_time_index import TIME_OF_DAY_RE, EventTimeIndex
+
+if TYPE_CHECKING:
+    from .event_store import EventStore
+
+#: Columns with at most this many distinct values are dictionary-encoded into one byte per row.
+_MAX_CATEGORIES = 255
+_COMPILED_CACHE_LIMIT = 64
+
+#: Query field name → column id.  ``time`` is special-cased to the epoch column.
+FIELD_ALIASES: Dict[str, str] = {
+    "time": "current_time",
+    "current_time": "current_time",
+    "timestamp": "timestamp",
+    "ts": "timestamp",
+    "description": "txt_manual",
+    "desc": "txt_manual",
+    "event": "txt_manual",
+    "manual": "txt_manual",
+    "txt_manual": "txt_manual",
+    "criticality": "txt_criticality",
+    "crit": "txt_criticality",
+    "severity": "txt_criticality",
+    "txt_criticality": "txt_criticality",
+    "mode": "ui_mode",
+    "ui_mode": "ui_mode",
+    "source": "source",
+    "log": "source",
+}
+
+_KEYWORDS = ("and", "or", "not", "contains", "between")
+_TOKEN_RE = re.compile(
+    r"""\s*(?:
+        (?P<quoted>"[^"]*"|'[^']*')
+      | (?P<op><=|>=|!=|=|<|>|~)
+      | (?P<paren>[()])
+      | (?P<word>[^\s()<>=!~"']+)
+    )""",
+    re.VERBOSE,
+)
+_STRUCTURED_RE = re.compile(
+    r"(?:^|[\s(])(?:" + "|".join(FIELD_ALIASES) + r")\s*(?:<=|>=|!=|=|<|>|~|contains\b|between\b)"
+    r"|(?:^|[\s(])between\s+\S+\s+and\s+\S",
+    re.IGNORECASE,
+)
+
+_NOT_TABLE = bytes.maketrans(b"\x00\x01", b"\x01\x00")
+
+Mask = bytes
+
+
+class QuerySyntaxError(ValueError):
+    """Raised for a query that looks structured but cannot be parsed."""
+
+
+def is_structured_query(text: str) -> bool:
+    """``True`` if *text* uses field filters or ``between``; otherwise it is a plain search."""
+    return bool(_STRUCTURED_RE.search(text))
+
+
+# Column store
+class _Column:
+    """One column: dictionary codes (``bytes``) when low-cardinality, else the lower-cased values."""
+
+    __slots__ = ("codes", "categories", "lowered")
+
+    def __init__(self, values: Sequence[str]) -> None:
+        lookup: Dict[str, int] = {}
+        codes = bytearray()
+        for value in values:
+            code = lookup.get(value)
+            if code is None:
+                if len(lookup) >= _MAX_CATEGORIES:
+                    break
+                code = lookup[value] = len(lookup)
+            codes.append(code)
+        else:
+            self.codes: Optional[bytes] = bytes(codes)
+            self.categories: List[str] = [value.lower() for value in lookup]
+            self.lowered: Optional[List[str]] = None
+            return
+        self.codes = None
+        self.categories = []
+        self.lowered = [value.lower() for value in values]
+
+    def mask_where(self, predicate: Callable[[str], bool]) -> Mask:
+        if self.codes is not None:
+            table = bytes(1 if predicate(c) else 0 for c in self.categories).ljust(256, b"\x00")
+            return self.codes.translate(table)
+        return bytes(map(predicate, self.lowered or ()))
+
+
+class EventColumnStore:
+    """Column-oriented copy of an event store's rows, built once for structured queries.
+
+    Args:
+        rows: The store's row tuples.
+        column_ids: Identifier of each tuple position (e.g. ``EVENT_COLUMNS``).
+    """
+
+    def __init__(self, rows: Sequence[Sequence[str]], column_ids: Sequence[str]) -> None:
+        self.row_count = len(rows)
+        self.column_ids = tuple(column_ids)
+        self._columns = {
+            column_id: _Column([str(row[j]) if j < len(row) else "" for row in rows])
+            for j, column_id in enumerate(self.column_ids)
+        }
+
+    def column(self, column_id: str) -> _Column:
+        try:
+            return self._columns[column_id]
+        except KeyError:
+            raise QuerySyntaxError(f"Field not available in this log: {column_id}") from None
+
+
+# Mask helpers
+def mask_from_rows(rows: Sequence[int], n: int) -> Mask:
+    """Byte mask of length *n* with the bytes at *rows* set."""
+    if isinstance(rows, range) and rows.step == 1:
+        return bytes(rows.start) + b"\x01" * len(rows) + bytes(n - rows.stop)
+    mask = bytearray(n)
+    for row in rows:
+        mask[row] = 1
+    return bytes(mask)
+
+
+def _positions(mask: Mask) -> Sequence[int]:
+    """Ascending indices of the set bytes of *mask*."""
+    ones = mask.count(1)
+    if ones == len(mask):
+        return range(len(mask))
+    if ones * 16 < len(mask):
+        positions = []
+        find = mask.find
+        i = find(1)
+        while i >= 0:
+            positions.append(i)
+            i = find(1, i + 1)
+        return positions
+    return list(compress(range(len(mask)), mask))
+
+
+def _and(a: Mask, b: Mask) -> Mask:
+    return (int.from_bytes(a, "little") & int.from_bytes(b, "little")).to_bytes(len(a), "little")
+
+
+def _or(a: Mask, b: Mask) -> Mask:
+    return (int.from_bytes(a, "little") | int.from_bytes(b, "little")).to_bytes(len(a), "little")
+
+
+def _not(a: Mask) -> Mask:
+    return a.translate(_NOT_TABLE)
+
+
+def value_sort_key(value: str) -> Tuple[int, object]:
+    """Order numbers numerically and before other (lower-cased) text; ``nan`` counts as text."""
+    try:
+        number = float(value)
+    except ValueError:
+        return 1, value
+    # NaN compares false with everything and would leave the sort order undefined.
+    return (0, number) if number == number else (1, value)
+
+
+_ORDERINGS: Dict[str, Callable[[Tuple[int, object], Tuple[int, object]], bool]] = {
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+}
+
+# Compiled query: a closure tree evaluated against a store.  An evaluator gets
+# the mask of rows still in play (``None`` = all) and must be correct on those
+# rows; outside them it may return anything, since its caller AND-s them away.
+Evaluator = Callable[["_Context", Optional[Mask]], Mask]
+#: Evaluators paired with a cost class: 0 = pure column operations, 1 = per-row verification.
+_Node = Tuple[int, Evaluator]
+
+
+class _Context:
+    """What a compiled query needs from an :class:`~src.logic.event_store.EventStore`."""
+
+    def __init__(self, store: "EventStore") -> None:
+        self.store = store
+        self.columns: EventColumnStore = store.build_column_store()
+        self.n = self.columns.row_count
+
+    def time_index(self) -> EventTimeIndex:
+        time_index = self.store.time_index
+        if time_index is None:
+            raise QuerySyntaxError("Timestamps are still being indexed; try again in a moment")
+        return time_index
+
+    def resolve_time(self, text: str) -> float:
+        try:
+            return self.time_index().resolve_time(text)
+        except ValueError as exc:
+            raise QuerySyntaxError(str(exc)) from None
+
+
+def _is_sparse(within: Optional[Mask]) -> bool:
+    """Whether checking *within*'s rows one by one beats going through the search index."""
+    return within is not None and within.count(1) * 8 < len(within)
+
+
+def _text_clause(text: str) -> _Node:
+    needle = text.lower().strip()  # as EventStore.search() normalises it: case must not depend on the path taken
+
+    def evaluate(ctx: _Context, within: Optional[Mask]) -> Mask:
+        if within is not None and _is_sparse(within):
+            store = ctx.store
+            return mask_from_rows([i for i in _positions(within) if needle in event_search_text(store[i])], ctx.n)
+        return mask_from_rows(ctx.store.search(needle), ctx.n)
+
+    return 1, evaluate
+
+
+def _field_clause(column_id: str, op: str, value: str) -> _Node:
+    needle = value.lower()
+
+    if op in ("=", "!="):
+
+        def predicate(v: str) -> bool:
+            return v == needle
+
+    elif op == "~":
+
+        def predicate(v: str) -> bool:
+            return needle in v
+
+    else:
+        key = value_sort_key(needle)
+        ordering = _ORDERINGS[op]
+
+        def predicate(v: str) -> bool:
+            return ordering(value_sort_key(v), key)
+
+    def evaluate(ctx: _Context, within: Optional[Mask]) -> Mask:
+        column = ctx.columns.column(column_id)
+        if column.codes is not None:
+            mask = column.mask_where(predicate)
+        else:
+            # High-cardinality text: verify only the rows still in play, or the
+            # candidates the row index yields for the needle, whichever is fewer.
+            lowered = column.lowered or []
+            if within is not None and _is_sparse(within):
+                candidates: Sequence[int] = _positions(within)
+            elif op in ("=", "!=", "~") and needle.strip():
+                candidates = ctx.store.search(needle)
+            else:
+                candidates = range(ctx.n)
+            mask = mask_from_rows([i for i in candidates if predicate(lowered[i])], ctx.n)
+        return _not(mask) if op == "!=" else mask
+
+    return 0 if op in ("=", "!=") else 1, evaluate
+
+
+def _time_clause(op: str, value: str) -> _Node:
+    # HH:MM compares at minute resolution, everything else at second resolution.
+    time_of_day = TIME_OF_DAY_RE.match(value.strip())
+    resolution = 60.0 if time_of_day and time_of_day.group(3) is None else 1.0
+
+    def evaluate(ctx: _Context, within: Optional[Mask]) -> Mask:
+        time_index = ctx.time_index()
+        t = ctx.resolve_time(value)
+        if op in ("=", "!=", "~"):
+            rows = time_index.rows_between(t, t + resolution, include_end=False)
+        elif op == "<":
+            rows = time_index.rows_between(None, t, include_end=False)
+        elif op == "<=":
+            rows = time_index.rows_between(None, t + resolution, include_end=False)
+        elif op == ">":
+            rows = time_index.rows_between(t + resolution, None)
+        else:
+            rows = time_index.rows_between(t, None)
+        mask = mask_from_rows(rows, ctx.n)
+        return _not(mask) if op == "!=" else mask
+
+    return 0, evaluate
+
+
+def _between_clause(column_id: str, low: str, high: str) -> _Node:
+    if column_id == "current_time":
+        high_time = TIME_OF_DAY_RE.match(high.strip())
+        high_resolution = 60.0 if high_time and high_time.group(3) is None else 1.0
+
+        def evaluate(ctx: _Context, within: Optional[Mask]) -> Mask:
+            start, end = ctx.resolve_time(low), ctx.resolve_time(high)
+            rows = ctx.time_index().rows_between(start, end + high_resolution, include_end=False)
+            return mask_from_rows(rows, ctx.n)
+
+        return 0, evaluate
+
+    return _all_of([_field_clause(column_id, ">=", low), _field_clause(column_id, "<=", high)])
+
+
+def _all_of(nodes: List[_Node]) -> _Node:
+    # Cheap column clauses first, so per-row checks only see the rows that survive them.
+    ordered = [evaluate for _cost, evaluate in sorted(nodes, key=lambda node: node[0])]
+
+    def evaluate(ctx: _Context, within: Optional[Mask]) -> Mask:
+        mask = within
+        for child in ordered:
+            child_mask = child(ctx, mask)
+            mask = child_mask if mask is None else _and(mask, child_mask)
+        return mask if mask is not None else mask_from_rows(range(ctx.n), ctx.n)
+
+    return max(cost for cost, _evaluate in nodes), evaluate
+
+
+def _any_of(nodes: List[_Node]) -> _Node:
+    evaluators = [evaluate for _cost, evaluate in nodes]
+
+    def evaluate(ctx: _Context, within: Optional[Mask]) -> Mask:
+        mask = evaluators[0](ctx, within)
+        for child in evaluators[1:]:
+            mask = _or(mask, child(ctx, within))
+        return mask
+
+    return max(cost for cost, _evaluate in nodes), evaluate
+
+
+def _none_of(node: _Node) -> _Node:
+    cost, inner = node
+    return cost, lambda ctx, within: _not(inner(ctx, within))
+
+
+# Parser
+class _Parser:
+    def __init__(self, text: str) -> None:
+        self.tokens: List[Tuple[str, str]] = []
+        pos = 0
+        text = text.strip()
+        while pos < len(text):
+            match = _TOKEN_RE.match(text, pos)
+            if match is None or match.end() == pos:
+                raise QuerySyntaxError(f"Unexpected character at position {pos + 1}: {text[pos]!r}")
+            kind = match.lastgroup or "word"
+            value = match.group(kind)
+            if kind == "quoted":
+                value = value[1:-1]
+            elif kind == "word" and value.lower() in _KEYWORDS:
+                kind, value = "keyword", value.lower()
+            self.tokens.append((kind, value))
+            pos = match.end()
+        self.pos = 0
+
+    def peek(self, offset: int = 0) -> Tuple[str, str]:
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else ("end", "")
+
+    def take(self) -> Tuple[str, str]:
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def expect_value(self) -> str:
+        kind, value = self.take()
+        if kind not in ("word", "quoted"):
+            raise QuerySyntaxError(f"Expected a value, found {value or 'end of query'!r}")
+        return value
+
+    def parse(self) -> Evaluator:
+        if not self.tokens:
+            raise QuerySyntaxError("Empty query")
+        _cost, evaluate = self.or_expr()
+        if self.peek()[0] != "end":
+            raise QuerySyntaxError(f"Unexpected {self.peek()[1]!r}")
+        return evaluate
+
+    def or_expr(self) -> _Node:
+        nodes = [self.and_expr()]
+        while self.peek() == ("keyword", "or"):
+            self.take()
+            nodes.append(self.and_expr())
+        return nodes[0] if len(nodes) == 1 else _any_of(nodes)
+
+    def and_expr(self) -> _Node:
+        nodes = [self.not_expr()]
+        while True:
+            token = self.peek()
+            if token == ("keyword", "and"):
+                self.take()
+            elif token[0] == "end" or token == ("paren", ")") or token == ("keyword", "or"):
+                return nodes[0] if len(nodes) == 1 else _all_of(nodes)
+            nodes.append(self.not_expr())
+
+    def not_expr(self) -> _Node:
+        token = self.peek()
+        if token == ("keyword", "not"):
+            self.take()
+            return _none_of(self.not_expr())
+        if token == ("paren", "("):
+            self.take()
+            node = self.or_expr()
+            if self.take() != ("paren", ")"):
+                raise QuerySyntaxError("Missing ')'")
+            return node
+        return self.clause()
+
+    def clause(self) -> _Node:
+        kind, value = self.peek()
+        if (kind, value) == ("keyword", "between"):
+            self.take()
+            return self.between("current_time")
+        if kind not in ("word", "quoted"):
+            raise QuerySyntaxError(f"Unexpected {value or 'end of query'!r}")
+
+        next_kind, next_value = self.peek(1)
+        is_field_op = next_kind == "op" or (next_kind == "keyword" and next_value in ("contains", "between"))
+        if kind == "word" and is_field_op:
+            column_id = FIELD_ALIASES.get(value.lower())
+            if column_id is None:
+                raise QuerySyntaxError(f"Unknown field {value!r} (try: {', '.join(sorted(set(FIELD_ALIASES)))})")
+            self.take()
+            _op_kind, op = self.take()
+            if op == "between":
+                return self.between(column_id)
+            op = "~" if op == "contains" else op
+            operand = self.expect_value()
+            if column_id == "current_time":
+                return _time_clause(op, operand)
+            return _field_clause(column_id, op, operand)
+
+        self.take()
+        return _text_clause(value)
+
+    def between(self, column_id: str) -> _Node:
+        low = self.expect_value()
+        if self.take() != ("keyword", "and"):
+            raise QuerySyntaxError("Expected 'and' in 'between ... and ...'")
+        high = self.expect_value()
+        return _between_clause(column_id, low, high)
+
+
+_compiled: Dict[str, Evaluator] = {}
+
+
+def compile_query(text: str) -> Evaluator:
+    """Parse *text* into an evaluator (cached); raises :class:`QuerySyntaxError`."""
+    evaluator = _compiled.get(text)
+    if evaluator is None:
+        evaluator = _Parser(text).parse()
+        if len(_compiled) >= _COMPILED_CACHE_LIMIT:
+            _compiled.clear()
+        _compiled[text] = evaluator
+    return evaluator
+
+
+def run_query(store: "EventStore", text: str) -> Sequence[int]:
+    """Ascending row numbers of *store* matching the structured query *text*."""
+    ctx = _Context(store)
+    return _positions(compile_query(text)(ctx, None))
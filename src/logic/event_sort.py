@@ -0,0 +1,113 @@
+"""Cached sort permutations for event columns.
+
+Sorting a view never moves rows: :class:`EventSortOrder` is a permutation of
+all row numbers of a store, ordered by one column, computed once per column
+and direction and reused for every later filter result.  Composing it with a
+filter result (ascending row numbers) yields the sorted view the virtual table
+displays.
+
+* ``current_time`` reuses the sorted order of the store's
+  :class:`~src.logic.event_time_index.EventTimeIndex`.
+* Dictionary-encoded columns of the
+  :class:`~src.logic.event_query.EventColumnStore` (criticality, UI mode, …)
+  are bucket-sorted by category in one pass.
+* Other columns are sorted by :func:`~src.logic.event_query.value_sort_key`
+  (numbers numerically, before case-insensitive text).
+
+All orders are stable: rows with equal keys keep their log order in both
+directions.  Rows whose timestamp did not parse sort last either way.
+"""
+
+from array import array
+from itertools import compress
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .event_query import EventColumnStore, mask_from_rows, value_sort_key
+from .event_time_index import EventTimeIndex
+
+
+class EventSortOrder:
+    """Row numbers of a store ordered by one column, plus the inverse mapping on demand."""
+
+    def __init__(self, order: "array[int]") -> None:
+        self.order = order
+        self._rank: Optional["array[int]"] = None
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    @property
+    def rank(self) -> "array[int]":
+        """``rank[row]`` is the position of *row* in :attr:`order`."""
+        if self._rank is None:
+            rank = array("I", bytes(4 * len(self.order)))
+            for position, row in enumerate(self.order):
+                rank[row] = position
+            self._rank = rank
+        return self._rank
+
+    def apply(self, rows: Sequence[int]) -> Sequence[int]:
+        """Reorder the ascending row numbers *rows* (a filter result) into this order."""
+        total = len(self.order)
+        if isinstance(rows, range) and len(rows) == total:
+            return self.order
+        if len(rows) * 8 < total:
+            # Small result: sorting it by rank is cheaper than scanning the whole permutation.
+            return sorted(rows, key=self.rank.__getitem__)
+        keep = mask_from_rows(rows, total)
+        return list(compress(self.order, map(keep.__getitem__, self.order)))
+
+    @classmethod
+    def by_time(cls, time_index: EventTimeIndex, descending: bool = False) -> "EventSortOrder":
+        """Order by parsed ``current_time``; rows without a parsed time go last."""
+        if descending:
+            order = array("I", sorted((row for _, row in time_index.iter_sorted()), key=time_index.epoch, reverse=True))
+        else:
+            order = array("I", (row for _, row in time_index.iter_sorted()))
+        order.extend(time_index.unparsed_rows())
+        return cls(order)
+
+    @classmethod
+    def by_column(cls, columns: EventColumnStore, column_id: str, descending: bool = False) -> "EventSortOrder":
+        """Order by the values of *column_id* in *columns*."""
+        column = columns.column(column_id)
+        if column.codes is not None:
+            # Categories with equal keys ("Low"/"low", "1.5"/"1.50") share a bucket, so their rows stay in log order.
+            keys = [value_sort_key(category) for category in column.categories]
+            buckets: Dict[Tuple[int, object], List[int]] = {key: [] for key in keys}
+            appenders = [buckets[key].append for key in keys]
+            for row, code in enumerate(column.codes):
+                appenders[code](row)
+            order = array("I")
+            for key in sorted(buckets, reverse=descending):
+                order.extend(buckets[key])
+            return cls(order)
+        values = column.lowered or []
+        return cls(array("I", sorted(range(len(values)), key=_sort_keys(values).__getitem__, reverse=descending)))
+
+
+def _sort_keys(values: List[str]) -> Sequence[object]:
+    """Keys ordering *values* like :func:`value_sort_key`, as plain floats or strings when possible."""
+    numbers = array("d")
+    try:
+        numbers.extend(map(float, values))
+    except ValueError:
+        if len(numbers) == 0 and not any(_is_number(v) for v in values):
+            return values  # No numbers at all: the text itself is the key.
+        return list(map(value_sort_key, values))
+    if any(number != number for number in numbers):
+        return list(map(value_sort_key, values))  # "nan" sorts as text
+    return numbers
+
+
+_NUMBER_START = frozenset("0123456789+-.i")  # values are lower-cased; "inf" parses as a float ("nan" is text)
+
+
+def _is_number(value: str) -> bool:
+    if value.lstrip()[:1] not in _NUMBER_START:
+        return False
+    try:
+        number = float(value)
+    except ValueError:
+        return False
+    return number == number
@@ -0,0 +1,201 @@
+"""Widget-independent storage for the parsed rows of an event log.
+
+:class:`EventStore` owns the event tuples of one loaded log together with the
+derived structures built from them (the search index, the time index and the
+pre-resolved media targets).  Views such
+as :class:`~src.ui.components.virtual_event_table.VirtualEventTable` hold only
+row numbers into the store and ask it for values when a row becomes visible.
+"""
+
+import threading
+from datetime import datetime
+from typing import Callable, Dict, NamedTuple, Optional, Sequence, Tuple
+
+from ..utils.timestamp_parser import epoch_to_datetime
+from .event_histogram import EventHistogram
+from .event_index import EventSearchIndex, event_search_text
+from .event_query import EventColumnStore, run_query
+from .event_sort import EventSortOrder
+from .event_time_index import EventTimeIndex
+from .media_index import MediaIndex, MediaTarget, MediaTargets
+
+#: Column identifiers of an event row, in file order.
+EVENT_COLUMNS: Tuple[str, ...] = ("current_time", "timestamp", "txt_manual", "txt_criticality", "ui_mode")
+
+#: Human-readable headings for :data:`EVENT_COLUMNS` and the ``source`` column of merged timelines.
+EVENT_COLUMN_HEADINGS = {
+    "current_time": "Current Time",
+    "timestamp": "Timestamp",
+    "txt_manual": "Event Description",
+    "txt_criticality": "Criticality",
+    "ui_mode": "UI Mode",
+    "source": "Source",
+}
+
+
+class EventRef(NamedTuple):
+    """An event handed to row-action callbacks: its raw timestamp, parsed epoch, log file and media target."""
+
+    timestamp: str
+    epoch: Optional[float] = None
+    source_path: Optional[str] = None
+    media: Optional[MediaTarget] = None
+
+    @property
+    def event_time(self) -> Optional[datetime]:
+        """The parsed timestamp, or ``None`` if it is not known yet (callers then parse ``timestamp``)."""
+        return None if self.epoch is None else epoch_to_datetime(self.epoch)
+
+
+class EventStore:
+    """Rows of a single event log plus lazily built lookup structures.
+
+    The row list is treated as immutable once the store is constructed, so a
+    store may be read from background threads while the UI displays it.
+    A *time_index* computed elsewhere (e.g. by a parser worker process) may be
+    passed in so it is not rebuilt.  Each derived structure is built under its
+    own lock, so viewers sharing a store (see
+    :mod:`src.logic.event_store_registry`) build it only once.
+    """
+
+    #: Identifier of each row position, used to name query fields.
+    column_ids: Tuple[str, ...] = EVENT_COLUMNS
+
+    def __init__(
+        self,
+        rows: Sequence[Tuple[str, ...]],
+        file_path: Optional[str] = None,
+        time_index: Optional[EventTimeIndex] = None,
+    ) -> None:
+        self.file_path = file_path
+        self._rows = rows
+        self._search_index: Optional[EventSearchIndex] = None
+        self._time_index: Optional[EventTimeIndex] = time_index
+        self._column_store: Optional[EventColumnStore] = None
+        self._media_targets: Optional[MediaTargets] = None
+        self._sort_orders: Dict[Tuple[str, bool], EventSortOrder] = {}
+        self._histogram: Optional[EventHistogram] = None
+        self._build_locks: Dict[object, threading.Lock] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _building(self, structure: object) -> threading.Lock:
+        """The lock serialising builds of one derived *structure* (``setdefault`` is atomic)."""
+        return self._build_locks.setdefault(structure, threading.Lock())
+
+    def __getitem__(self, index: int) -> Tuple[str, ...]:
+        return self._rows[index]
+
+    @property
+    def rows(self) -> Sequence[Tuple[str, ...]]:
+        return self._rows
+
+    @property
+    def search_index(self) -> Optional[EventSearchIndex]:
+        """The token index, or ``None`` until :meth:`build_search_index` has run."""
+        return self._search_index
+
+    def build_search_index(self) -> EventSearchIndex:
+        """Build (once) and return the search index.  Safe to call off the UI thread."""
+        with self._building("search_index"):
+            if self._search_index is None:
+                self._search_index = EventSearchIndex(self._rows)
+        return self._search_index
+
+    @property
+    def time_index(self) -> Optional[EventTimeIndex]:
+        """The epoch index over ``current_time``, or ``None`` until :meth:`build_time_index` has run."""
+        return self._time_index
+
+    def build_time_index(self) -> EventTimeIndex:
+        """Parse every ``current_time`` once (safe off the UI thread) and return the index."""
+        with self._building("time_index"):
+            if self._time_index is None:
+                self._time_index = EventTimeIndex.from_column([row[0] for row in self._rows])
+        return self._time_index
+
+    @property
+    def media_targets(self) -> Optional[MediaTargets]:
+        """Per-row video/bag targets, or ``None`` until :meth:`build_media_targets` has run."""
+        return self._media_targets
+
+    def build_media_targets(self, media_index_for: Callable[[str], MediaIndex]) -> Optional[MediaTargets]:
+        """Resolve every row's video and bag once (safe off the UI thread).
+
+        *media_index_for* maps the log's path to the recordings of its folder.
+        Returns ``None`` for a store without a file.
+        """
+        with self._building("media_targets"):
+            if self._media_targets is None and self.file_path:
+                self._media_targets = MediaTargets.resolve(media_index_for(self.file_path), self.build_time_index())
+        return self._media_targets
+
+    def media_coverage(self, index: int) -> Optional[Tuple[bool, bool]]:
+        """``(has_video, has_bag)`` of row *index*, or ``None`` while targets are not resolved."""
+        targets = self._media_targets
+        if targets is None:
+            return None
+        return targets.has_video(index), targets.has_bag(index)
+
+    def event_ref(self, index: int) -> EventRef:
+        """Describe row *index* for a row action, reusing its precomputed epoch and media target when available."""
+        epoch = self._time_index.epoch(index) if self._time_index is not None else None
+        media = self._media_targets.target(index) if self._media_targets is not None else None
+        return EventRef(str(self._rows[index][0]), epoch, self.file_path, media)
+
+    def build_column_store(self) -> EventColumnStore:
+        """Build (once) the column-oriented copy used by structured queries.  Safe off the UI thread."""
+        with self._building("column_store"):
+            if self._column_store is None:
+                self._column_store = EventColumnStore(self._rows, self.column_ids)
+        return self._column_store
+
+    def sort_order(self, column_id: str, descending: bool = False) -> EventSortOrder:
+        """Build (once per column and direction) the row permutation sorted by *column_id*.
+
+        Safe off the UI thread; ``current_time`` sorts by parsed time.
+        """
+        key = (column_id, descending)
+        with self._building(key):
+            order = self._sort_orders.get(key)
+            if order is None:
+                if column_id == EVENT_COLUMNS[0]:
+                    order = EventSortOrder.by_time(self.build_time_index(), descending)
+                else:
+                    order = EventSortOrder.by_column(self.build_column_store(), column_id, descending)
+                self._sort_orders[key] = order
+        return order
+
+    def cached_sort_order(self, column_id: str, descending: bool = False) -> Optional[EventSortOrder]:
+        """The permutation from :meth:`sort_order` if it has been built, else ``None``."""
+        return self._sort_orders.get((column_id, descending))
+
+    @property
+    def histogram(self) -> Optional[EventHistogram]:
+        """The per-minute density, or ``None`` until :meth:`build_histogram` has run (or nothing parsed)."""
+        return self._histogram
+
+    def build_histogram(self) -> Optional[EventHistogram]:
+        """Bin the events by minute and criticality once (safe off the UI thread)."""
+        with self._building("histogram"):
+            if self._histogram is None:
+                self._histogram = EventHistogram.from_indexes(self.build_time_index(), self.build_column_store())
+        return self._histogram
+
+    def query(self, text: str) -> Sequence[int]:
+        """Ascending row numbers matching a structured query (see :mod:`src.logic.event_query`).
+
+        Raises :class:`~src.logic.event_query.QuerySyntaxError` for malformed queries.
+        """
+        return run_query(self, text)
+
+    def search(self, text: str) -> Sequence[int]:
+        """Return ascending row numbers matching *text* (all rows when blank)."""
+        query = text.lower().strip()
+        if not query:
+            return range(len(self._rows))
+        if self._search_index is not None:
+            return self._search_index.search(query)
+        rows = self._rows
+        return [i for i in range(len(rows)) if query in event_search_text(rows[i])]
@@ -0,0 +1,130 @@
+"""Process-wide sharing of loaded event stores between viewers.
+
+Opening the same event log twice (a tab and a window, a second auto-open, or a
+merged timeline next to the per-log tabs) used to parse it again and keep a
+second copy of its rows and indexes.  :class:`EventStoreRegistry` hands out an
+:class:`EventStoreLease` per viewer instead: all leases on the same file share
+one :class:`~src.logic.event_store.EventStore`, which is loaded by the first
+lease that asks for it and dropped by the registry when the last lease is
+released.
+
+Files are identified by device, inode, size and modification time, so a log
+that changed on disk since it was loaded gets a fresh store while viewers of
+the old contents keep theirs.
+"""
+
+import os
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+from ..utils.logger import get_logger
+from .event_loader import load_event_store
+from .event_store import EventStore
+
+logger = get_logger(__name__)
+
+FileKey = Tuple[object, ...]
+
+
+def file_key(path: str) -> FileKey:
+    """Identity of the file at *path*; its absolute path alone when it cannot be stat'ed."""
+    real = os.path.realpath(path)
+    try:
+        st = os.stat(real)
+    except OSError:
+        return (real,)
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+class _Entry:
+    def __init__(self, path: str, load: Callable[[], EventStore]) -> None:
+        self.path = path
+        self.load: Optional[Callable[[], EventStore]] = load
+        self.store: Optional[EventStore] = None
+        self.refs = 0
+        self.lock = threading.Lock()
+
+
+class EventStoreLease:
+    """One viewer's claim on a shared store; call :meth:`release` when the viewer closes."""
+
+    def __init__(self, registry: "EventStoreRegistry", key: FileKey, entry: _Entry) -> None:
+        self._registry = registry
+        self.key = key
+        self._entry: Optional[_Entry] = entry
+
+    @property
+    def path(self) -> Optional[str]:
+        return self._entry.path if self._entry is not None else None
+
+    def store(self) -> EventStore:
+        """The shared store, loading it on first use (blocks; call off the UI thread).
+
+        Concurrent callers wait for the one load in progress.  A failed load
+        is not remembered, so the next call tries again.
+        """
+        entry = self._entry
+        if entry is None:
+            raise RuntimeError("Event store lease was already released")
+        with entry.lock:
+            if entry.store is None:
+                if entry.load is None:
+                    raise RuntimeError(f"Event store of {entry.path} was released")
+                entry.store = entry.load()
+                logger.debug("Loaded shared event store for %s (%d rows)", entry.path, len(entry.store))
+            return entry.store
+
+    def release(self) -> None:
+        """Give up the claim (idempotent); the store is dropped when no lease is left."""
+        if self._entry is not None:
+            self._registry._release(self.key, self._entry)
+            self._entry = None
+
+
+class EventStoreRegistry:
+    """Reference-counted :class:`EventStore` per event log file.
+
+    Args:
+        load: Loads a store from a path when :meth:`acquire` is not given a
+            loader; defaults to parsing the file in this process.
+    """
+
+    def __init__(self, load: Callable[[str], EventStore] = load_event_store) -> None:
+        self._load = load
+        self._entries: Dict[FileKey, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of files with at least one live lease."""
+        with self._lock:
+            return len(self._entries)
+
+    def acquire(self, path: str, load: Optional[Callable[[], EventStore]] = None) -> EventStoreLease:
+        """Lease the store of *path*, sharing it with every other live lease on the same file.
+
+        *load* (e.g. waiting on a parse already running elsewhere) is used only
+        if no lease on the file exists yet; later leases reuse whatever the
+        first one loads.
+        """
+        key = file_key(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry(path, load or (lambda: self._load(path)))
+            else:
+                logger.debug("Sharing event store of %s (%d other viewer(s))", path, entry.refs)
+            entry.refs += 1
+        return EventStoreLease(self, key, entry)
+
+    def _release(self, key: FileKey, entry: _Entry) -> None:
+        with self._lock:
+            entry.refs -= 1
+            if entry.refs > 0:
+                return
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+        # Drop the rows and a loader that may hold them (such as a finished future).  No lock: a
+        # load still in progress only fills the now unreachable entry, so closing never waits on it.
+        entry.store = None
+        entry.load = None
+        logger.debug("Released event store of %s", entry.path)
@@ -0,0 +1,156 @@
+"""Sorted epoch column for time-range queries over event log rows.
+
+Each event's ``current_time`` is parsed once (see
+:mod:`src.utils.timestamp_parser`) into naive epoch seconds.  Event logs are
+normally written in time order, in which case the epoch column is already
+sorted and a time range maps to a contiguous ``range`` of row numbers; rows
+whose timestamp did not parse may trail at the end (as in a merged timeline)
+without losing that.  Otherwise a permutation of the parseable rows, ordered by epoch, is kept
+alongside the sorted epochs so ranges are still answered by bisection.
+"""
+
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import compress, islice
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+from ..utils.timestamp_parser import TIMESTAMP_PARSER, normalize_timestamp_str
+
+#: ``HH:MM`` or ``HH:MM:SS`` typed by the user (taken on the log's first day).
+TIME_OF_DAY_RE = re.compile(r"^(\d{1,2}):(\d{2})(?::(\d{2}))?$")
+
+
+class EventTimeIndex:
+    """Per-row epochs plus a sorted view for bisecting time ranges.
+
+    Args:
+        epochs: Naive epoch seconds per row, NaN where the timestamp did not parse.
+    """
+
+    def __init__(self, epochs: "array[float]") -> None:
+        self._epochs = epochs
+        # Unparsed (NaN) rows at the end keep the fast path; NaN compares false, so any other one disables it.
+        parsed = len(epochs)
+        while parsed and epochs[parsed - 1] != epochs[parsed - 1]:
+            parsed -= 1
+        if all(a <= b for a, b in zip(islice(epochs, parsed), islice(epochs, 1, parsed))):
+            self._order: Optional[array] = None
+            self._sorted = epochs if parsed == len(epochs) else epochs[:parsed]
+        else:
+            order = sorted((i for i, e in enumerate(epochs) if e == e), key=epochs.__getitem__)
+            self._order = array("I", order)
+            self._sorted = array("d", (epochs[i] for i in order))
+
+    @classmethod
+    def from_column(cls, values: Sequence[object]) -> "EventTimeIndex":
+        """Parse a column of timestamp strings and index it."""
+        return cls(TIMESTAMP_PARSER.parse_column(values))
+
+    def __len__(self) -> int:
+        return len(self._epochs)
+
+    @property
+    def is_monotonic(self) -> bool:
+        """``True`` when row order is already time order, unparsed rows last (no permutation needed)."""
+        return self._order is None
+
+    def epoch(self, row: int) -> Optional[float]:
+        """Epoch of *row*, or ``None`` if its timestamp did not parse."""
+        value = self._epochs[row]
+        return None if value != value else value
+
+    def epochs_at(self, rows: Iterable[int]) -> "array[float]":
+        """Raw epochs of *rows* (NaN where the timestamp did not parse)."""
+        return array("d", map(self._epochs.__getitem__, rows))
+
+    def sorted_epochs(self, mask: Optional[bytes] = None) -> "array[float]":
+        """Ascending epochs of the parseable rows, only those whose *mask* byte is set if given."""
+        if mask is None:
+            return self._sorted
+        if self._order is None:
+            return array("d", compress(self._sorted, mask))
+        return array("d", compress(self._sorted, map(mask.__getitem__, self._order)))
+
+    def first_row_at_or_after(self, epoch: float) -> Optional[int]:
+        """Row of the earliest event at or after *epoch* (``None`` if there is none)."""
+        pos = bisect_left(self._sorted, epoch)
+        if pos >= len(self._sorted):
+            return None
+        return pos if self._order is None else self._order[pos]
+
+    def span(self) -> Optional[Tuple[float, float]]:
+        """``(earliest, latest)`` epoch, or ``None`` when no timestamp parsed."""
+        if not self._sorted:
+            return None
+        return self._sorted[0], self._sorted[-1]
+
+    def resolve_time(self, text: str) -> float:
+        """Epoch for a user-typed time; ``HH:MM[:SS]`` is taken on the log's first day.
+
+        Raises ``ValueError`` when *text* is not a recognised timestamp.
+        """
+        text = text.strip()
+        time_of_day = TIME_OF_DAY_RE.match(text)
+        if time_of_day:
+            hours, minutes, seconds = (int(g or 0) for g in time_of_day.groups())
+            span = self.span()
+            if span is None or hours > 23 or minutes > 59 or seconds > 59:
+                raise ValueError(f"Invalid time: {text!r}")
+            first_day = span[0] - span[0] % 86400
+            return first_day + hours * 3600 + minutes * 60 + seconds
+        epoch = TIMESTAMP_PARSER.parse_epoch(normalize_timestamp_str(text))
+        if epoch is None:
+            raise ValueError(f"Invalid time: {text!r} (expected YYYY-MM-DD HH:MM:SS or HH:MM[:SS])")
+        return epoch
+
+    def iter_sorted(self) -> Iterator[Tuple[float, int]]:
+        """``(epoch, row)`` pairs of every parseable row in time order."""
+        if self._order is None:
+            return zip(self._sorted, range(len(self._sorted)))
+        return zip(self._sorted, self._order)
+
+    def unparsed_rows(self) -> Sequence[int]:
+        """Ascending rows whose timestamp did not parse."""
+        if self._order is None:
+            return range(len(self._sorted), len(self._epochs))
+        return [i for i, e in enumerate(self._epochs) if e != e]
+
+    def rows_between(
+        self,
+        start: Optional[float],
+        end: Optional[float],
+        include_start: bool = True,
+        include_end: bool = True,
+    ) -> Sequence[int]:
+        """Ascending row numbers with ``start <= epoch <= end`` (``None`` leaves a side open).
+
+        *include_start* / *include_end* set to ``False`` make that bound strict.
+        """
+        if start is None:
+            lo = 0
+        else:
+            lo = (bisect_left if include_start else bisect_right)(self._sorted, start)
+        if end is None:
+            hi = len(self._sorted)
+        else:
+            hi = (bisect_right if include_end else bisect_left)(self._sorted, end)
+        if hi <= lo:
+            return ()
+        if self._order is None:
+            return range(lo, hi)
+        return sorted(self._order[lo:hi])
+
+    def restrict(self, rows: Sequence[int], start: Optional[float], end: Optional[float]) -> Sequence[int]:
+        """Keep the rows of ascending *rows* whose epoch lies in ``[start, end]``."""
+        in_range = self.rows_between(start, end)
+        if isinstance(in_range, range):
+            if isinstance(rows, range):
+                lo, hi = max(rows.start, in_range.start), min(rows.stop, in_range.stop)
+                return range(lo, max(lo, hi))
+            # Both ascending: the overlap is a slice of *rows*.
+            return rows[bisect_left(rows, in_range.start) : bisect_left(rows, in_range.stop)]
+        if isinstance(rows, range) and rows == range(len(self._epochs)):
+            return in_range
+        keep = set(in_range)
+        return [i for i in rows if i in keep]
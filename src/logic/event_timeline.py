@@ -0,0 +1,112 @@
+"""Merged timeline over several event logs.
+
+A TG vehicle folder usually holds more than one ``event_log_*.txt``.
+:class:`MergedEventStore` interleaves their rows by time so events from all
+logs can be read side by side in a single table.  Each source store's rows are
+already available in time order through its
+:class:`~src.logic.event_time_index.EventTimeIndex`, so the stores are k-way
+merged with :func:`heapq.merge`.  The merge only records, per merged row, which
+source it came from and the row number there (two compact arrays); row tuples
+are fetched from the source stores on demand and never copied.
+"""
+
+import collections.abc
+import heapq
+import os
+from array import array
+from itertools import repeat
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+from .event_store import EVENT_COLUMNS, EventRef, EventStore
+from .event_time_index import EventTimeIndex
+from .media_index import MediaIndex, MediaTargets
+
+
+class MergedEventRows(collections.abc.Sequence):
+    """Read-only sequence of merged rows; each is the source row plus its source label."""
+
+    def __init__(self, stores: Sequence[EventStore], labels: Sequence[str], sources: array, rows: array) -> None:
+        self._stores = stores
+        self._labels = tuple((label,) for label in labels)
+        self._sources = sources
+        self._rows = rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        source = self._sources[index]
+        return self._stores[source][self._rows[index]] + self._labels[source]
+
+    def __iter__(self) -> Iterator[Tuple[str, ...]]:
+        stores, labels = self._stores, self._labels
+        for source, row in zip(self._sources, self._rows):
+            yield stores[source][row] + labels[source]
+
+
+def _keyed(time_index: EventTimeIndex, source: int) -> Iterator[Tuple[float, int, int]]:
+    return ((epoch, source, row) for epoch, row in time_index.iter_sorted())
+
+
+class MergedEventStore(EventStore):
+    """An :class:`EventStore` whose rows are the time-ordered union of *stores*.
+
+    Rows carry one extra trailing column, the source label (the log's file
+    name).  Rows whose timestamp did not parse are appended after the merged
+    part, grouped by source.  :meth:`event_ref` points back to the source log
+    so row actions resolve videos and MCAPs against the right file.
+    """
+
+    column_ids = EVENT_COLUMNS + ("source",)
+
+    def __init__(self, stores: Sequence[EventStore], file_path: Optional[str] = None) -> None:
+        stores = list(stores)
+        labels = [os.path.basename(store.file_path or f"log {i + 1}") for i, store in enumerate(stores)]
+        time_indexes = [store.build_time_index() for store in stores]
+
+        sources = array("H")
+        rows = array("I")
+        epochs = array("d")
+        for epoch, source, row in heapq.merge(*(_keyed(ti, i) for i, ti in enumerate(time_indexes))):
+            epochs.append(epoch)
+            sources.append(source)
+            rows.append(row)
+        for source, ti in enumerate(time_indexes):
+            unparsed = ti.unparsed_rows()
+            sources.extend(repeat(source, len(unparsed)))
+            rows.extend(unparsed)
+            epochs.extend(repeat(float("nan"), len(unparsed)))
+
+        super().__init__(MergedEventRows(stores, labels, sources, rows), file_path)
+        self._stores = stores
+        self._sources = sources
+        self._source_rows = rows
+        self._time_index = EventTimeIndex(epochs)
+        self._media_resolved = False
+
+    @property
+    def stores(self) -> List[EventStore]:
+        return list(self._stores)
+
+    def source_of(self, index: int) -> Tuple[EventStore, int]:
+        """The source store of merged row *index* and the row number within it."""
+        return self._stores[self._sources[index]], self._source_rows[index]
+
+    def event_ref(self, index: int) -> EventRef:
+        store, row = self.source_of(index)
+        return store.event_ref(row)
+
+    def build_media_targets(self, media_index_for: Callable[[str], MediaIndex]) -> Optional[MediaTargets]:
+        """Resolve the media targets of every source log; merged rows look theirs up through the source."""
+        for store in self._stores:
+            store.build_media_targets(media_index_for)
+        self._media_resolved = True
+        return None
+
+    def media_coverage(self, index: int) -> Optional[Tuple[bool, bool]]:
+        if not self._media_resolved:
+            return None
+        store, row = self.source_of(index)
+        return store.media_coverage(row)
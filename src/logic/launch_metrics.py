@@ -0,0 +1,266 @@
+"""Launch-to-ready latency of external tools.
+
+Every launch is split into two durations:
+
+* **click-to-spawn** — from the moment a launch was requested until ``Popen``
+  returned.  It covers the work done before the tool starts (argument checks,
+  symlink directories, stopping a previous instance).
+* **spawn-to-ready** — from ``Popen`` returning until the tool is usable, as
+  reported by a :class:`ReadinessProbe`:
+
+  * :class:`WindowProbe` — a top-level X11 window owned by the tool's process
+    group appears (``wmctrl -lp``, else ``xprop``);
+  * :class:`OutputProbe` — a line matching a pattern shows up in its output;
+  * :class:`MpvIpcProbe` — its JSON IPC socket answers a property query.
+
+  Tools no probe applies to (e.g. a prebuilt Bazel binary without a display)
+  get their click-to-spawn time recorded only.
+
+:class:`LaunchMetrics` keeps, per tool, a fixed-bucket histogram of both
+durations over all launches plus the latest
+:data:`~src.utils.constants.LAUNCH_METRICS_RECENT` values (for the median and
+90th percentile), and persists them to a small JSON file so that a launch
+regression shows up against earlier sessions.
+"""
+
+import abc
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Set
+
+from ..utils.constants import LAUNCH_METRICS_FILE_PATH, LAUNCH_METRICS_RECENT, LAUNCH_READY_POLL_INTERVAL
+from ..utils.logger import get_logger
+from .mpv_ipc import MpvIpcClient, MpvIpcError
+from .process_output import ProcessOutput
+
+logger = get_logger(__name__)
+
+#: Upper bounds (milliseconds) of the histogram buckets; one more bucket counts everything above.
+BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+_XPROP_WINDOW_ID = re.compile(r"0x[0-9a-fA-F]+")
+_XPROP_PID = re.compile(r"=\s*(\d+)")
+
+
+class ReadinessProbe(abc.ABC):
+    """Tells when a freshly spawned tool is usable."""
+
+    kind = "none"
+
+    @abc.abstractmethod
+    def wait(self, proc: subprocess.Popen, deadline: float) -> bool:
+        """Block until the tool is ready (``True``), or it exits or *deadline* passes (``False``)."""
+
+    def _poll_until(self, proc: subprocess.Popen, deadline: float, check) -> bool:
+        while proc.poll() is None:
+            if check():
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(LAUNCH_READY_POLL_INTERVAL, remaining))
+        return False
+
+
+class WindowProbe(ReadinessProbe):
+    """Ready once any process in the tool's group owns a top-level X11 window."""
+
+    kind = "window"
+
+    def __init__(self, pgid: int) -> None:
+        self.pgid = pgid
+        self._checked: Set[str] = set()  # xprop: windows already known not to be ours
+
+    @staticmethod
+    def available() -> bool:
+        return (
+            sys.platform != "win32"
+            and bool(os.environ.get("DISPLAY"))
+            and bool(shutil.which("wmctrl") or shutil.which("xprop"))
+        )
+
+    def wait(self, proc: subprocess.Popen, deadline: float) -> bool:
+        self._checked.clear()
+        return self._poll_until(proc, deadline, self._has_window)
+
+    def _has_window(self) -> bool:
+        return any(self._in_group(pid) for pid in self._window_pids())
+
+    def _in_group(self, pid: int) -> bool:
+        try:
+            return os.getpgid(pid) == self.pgid
+        except OSError:
+            return False
+
+    def _window_pids(self) -> List[int]:
+        if shutil.which("wmctrl"):
+            # "<window id> <desktop> <pid> <host> <title>"
+            listing = _run_quietly(["wmctrl", "-lp"])
+            pids = []
+            for line in listing.splitlines():
+                fields = line.split(None, 3)
+                if len(fields) >= 3 and fields[2].isdigit():
+                    pids.append(int(fields[2]))
+            return pids
+        # "_NET_CLIENT_LIST(WINDOW): window id # 0x1a00003, 0x1c00007" then "_NET_WM_PID(CARDINAL) = 1234"
+        pids = []
+        for window in _XPROP_WINDOW_ID.findall(_run_quietly(["xprop", "-root", "_NET_CLIENT_LIST"])):
+            if window in self._checked:
+                continue
+            self._checked.add(window)
+            match = _XPROP_PID.search(_run_quietly(["xprop", "-id", window, "_NET_WM_PID"]))
+            if match:
+                pids.append(int(match.group(1)))
+        return pids
+
+
+class OutputProbe(ReadinessProbe):
+    """Ready once the tool prints a line matching *pattern*."""
+
+    kind = "output"
+
+    def __init__(self, output: ProcessOutput, pattern: str) -> None:
+        self.output = output
+        self.pattern = re.compile(pattern)
+
+    def wait(self, proc: subprocess.Popen, deadline: float) -> bool:
+        return self.output.wait_for_line(self.pattern, deadline - time.monotonic()) is not None
+
+
+class MpvIpcProbe(ReadinessProbe):
+    """Ready once mpv answers on its IPC socket; with *require* set, once that property has a value."""
+
+    kind = "ipc"
+
+    def __init__(self, socket_path: str, require: Optional[str] = None) -> None:
+        self.socket_path = socket_path
+        self.require = require
+
+    def wait(self, proc: subprocess.Popen, deadline: float) -> bool:
+        client = MpvIpcClient(self.socket_path, timeout=LAUNCH_READY_POLL_INTERVAL * 5)
+        try:
+            return self._poll_until(proc, deadline, lambda: self._answers(client))
+        finally:
+            client.close()
+
+    def _answers(self, client: MpvIpcClient) -> bool:
+        try:
+            value = client.get_property(self.require or "idle-active")
+        except MpvIpcError:
+            return False
+        return self.require is None or value is not None
+
+
+def _run_quietly(command: List[str]) -> str:
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, timeout=2)
+    except (OSError, subprocess.TimeoutExpired):
+        return ""
+    return result.stdout if result.returncode == 0 else ""
+
+
+def _bucket(seconds: float) -> int:
+    ms = seconds * 1000
+    return next((i for i, bound in enumerate(BUCKETS_MS) if ms <= bound), len(BUCKETS_MS))
+
+
+def _percentile(values: List[float], fraction: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class LaunchMetrics:
+    """Per-tool launch latency histograms, persisted to *path* as JSON; thread-safe.
+
+    Layout of the file::
+
+        {"<tool>": {"spawn": {"count", "total", "buckets", "recent"},
+                    "ready": {...same...},
+                    "not_ready": <launches that exited or timed out first>,
+                    "probe": "<kind of the last readiness probe>"}}
+    """
+
+    def __init__(self, path: str = LAUNCH_METRICS_FILE_PATH, recent: int = LAUNCH_METRICS_RECENT) -> None:
+        self.path = path
+        self._recent = recent
+        self._lock = threading.Lock()
+        self._tools: Dict[str, dict] = self._load()
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            with open(self.path, "r") as fh:
+                data = json.load(fh)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable launch metrics %s: %s", self.path, e)
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save(self) -> None:
+        tmp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "w") as fh:
+                json.dump(self._tools, fh, indent=1)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning("Could not save launch metrics to %s: %s", self.path, e)
+
+    def _add(self, series: dict, seconds: float) -> None:
+        buckets = series.setdefault("buckets", [0] * (len(BUCKETS_MS) + 1))
+        buckets[_bucket(seconds)] += 1
+        series["count"] = series.get("count", 0) + 1
+        series["total"] = series.get("total", 0.0) + seconds
+        recent = series.setdefault("recent", [])
+        recent.append(round(seconds, 4))
+        del recent[: -self._recent]
+
+    def record(self, tool: str, spawn_s: float, ready_s: Optional[float], probe: Optional[str]) -> None:
+        """Record one launch; *ready_s* is ``None`` when the tool never signalled readiness."""
+        with self._lock:
+            entry = self._tools.setdefault(tool, {})
+            self._add(entry.setdefault("spawn", {}), spawn_s)
+            if ready_s is not None:
+                self._add(entry.setdefault("ready", {}), ready_s)
+            elif probe is not None:
+                entry["not_ready"] = entry.get("not_ready", 0) + 1
+            if probe is not None:
+                entry["probe"] = probe
+            self._save()
+
+    def summary(self, tool: str) -> Optional[dict]:
+        """Launch count and median / p90 of both durations over the recent launches of *tool*."""
+        with self._lock:
+            entry = self._tools.get(tool)
+            if entry is None:
+                return None
+            spawn = list(entry.get("spawn", {}).get("recent", []))
+            ready = list(entry.get("ready", {}).get("recent", []))
+            launches = entry.get("spawn", {}).get("count", 0)
+            not_ready = entry.get("not_ready", 0)
+            probe = entry.get("probe")
+        return {
+            "tool": tool,
+            "launches": launches,
+            "not_ready": not_ready,
+            "probe": probe,
+            "spawn_median": _percentile(spawn, 0.5),
+            "spawn_p90": _percentile(spawn, 0.9),
+            "ready_median": _percentile(ready, 0.5),
+            "ready_p90": _percentile(ready, 0.9),
+            "ready_samples": len(ready),
+        }
+
+    def summaries(self) -> List[dict]:
+        with self._lock:
+            tools = sorted(self._tools)
+        return [summary for summary in map(self.summary, tools) if summary is not None]
@@ -0,0 +1,206 @@
+"""Pre-resolved video and rosbag targets for event log rows.
+
+A vehicle folder (``…/TG-xxxx/<vehicle>/``) holds the event logs under
+``logs/``, the camera recordings under ``video/`` and the rosbags under
+``rosbags/default/``; every recording is named after its start time.
+:class:`MediaIndex` lists one folder's recordings once, sorted by start epoch.
+:meth:`MediaTargets.resolve` then assigns every row of an event log the
+recording that contains it in a single merge-style pass over the rows in time
+order, so row actions launch without walking directories or parsing file
+names on each click, and rows without coverage are known up front.
+
+A row is covered by the latest recording that started at or before it (the
+same rule the click-time lookups used).  Offsets are derived from the row's
+epoch when a row is looked up, so only two small integer arrays are kept per
+log.
+"""
+
+import glob
+import os
+import threading
+import time
+from array import array
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from ..utils.logger import get_logger
+from ..utils.timestamp_parser import parse_epoch
+from .event_time_index import EventTimeIndex
+
+logger = get_logger(__name__)
+
+#: Seconds of rosbag played before the event when playing "at" an event.
+BAG_PREROLL_SECONDS = 30
+
+
+def vehicle_dir_of(event_log_path: str) -> str:
+    """Vehicle folder of an event log (``<vehicle>/logs/event_log_x.txt`` → ``<vehicle>``)."""
+    return os.path.dirname(os.path.dirname(event_log_path))
+
+
+def list_mcap_files(rosbags_dir: str, max_depth: int = 3, limit: int = 100) -> List[str]:
+    """MCAP files under *rosbags_dir*, at most *max_depth* levels deep.
+
+    The walk stops once more than *limit* files were found; walk errors
+    (permissions, vanished folders) are ignored.
+    """
+    mcap_files: List[str] = []
+    base_depth = rosbags_dir.count(os.sep)
+    try:
+        for root, dirs, files in os.walk(rosbags_dir):
+            if root.count(os.sep) - base_depth >= max_depth:
+                dirs[:] = []
+            mcap_files.extend(os.path.join(root, name) for name in files if name.endswith(".mcap"))
+            if len(mcap_files) > limit:
+                break
+    except Exception:  # nosec B110
+        pass
+    return mcap_files
+
+
+def _by_start_time(paths: Sequence[str], extension: str) -> List[Tuple[float, str]]:
+    timed = []
+    for path in paths:
+        start = parse_epoch(os.path.basename(path).replace(extension, ""))
+        if start is not None:
+            timed.append((start, path))
+    timed.sort(key=lambda item: item[0])
+    return timed
+
+
+class MediaTarget(NamedTuple):
+    """What the row actions of one event play.
+
+    ``bag_files``/``bag_offset`` start :data:`BAG_PREROLL_SECONDS` before the
+    event (two bags when the pre-roll crosses a bag boundary); ``bag`` is the
+    bag containing the event itself, which starts ``event_offset`` seconds
+    before it.  Missing coverage is ``None``.
+    """
+
+    video: Optional[str]
+    video_offset: int
+    bag: Optional[str]
+    event_offset: float
+    bag_files: Optional[List[str]]
+    bag_offset: float
+
+
+class MediaIndex:
+    """Videos and rosbags of one vehicle folder, sorted by start epoch.
+
+    Args:
+        vehicle_dir: The vehicle folder the recordings were listed from.
+        videos: ``(start_epoch, path)`` pairs of the ``.mp4`` recordings.
+        bags: ``(start_epoch, path)`` pairs of the ``.mcap`` files.
+    """
+
+    def __init__(
+        self,
+        vehicle_dir: str,
+        videos: Sequence[Tuple[float, str]] = (),
+        bags: Sequence[Tuple[float, str]] = (),
+    ) -> None:
+        self.vehicle_dir = vehicle_dir
+        self.video_starts = array("d", (start for start, _ in videos))
+        self.video_paths = [path for _, path in videos]
+        self.bag_starts = array("d", (start for start, _ in bags))
+        self.bag_paths = [path for _, path in bags]
+
+    @classmethod
+    def scan(cls, vehicle_dir: str) -> "MediaIndex":
+        """List and time-sort the recordings of *vehicle_dir* (missing folders give an empty index)."""
+        videos = _by_start_time(glob.glob(os.path.join(vehicle_dir, "video", "*.mp4")), ".mp4")
+        rosbags_dir = os.path.join(vehicle_dir, "rosbags", "default")
+        bags = _by_start_time(list_mcap_files(rosbags_dir) if os.path.isdir(rosbags_dir) else [], ".mcap")
+        logger.debug("Media index for %s: %d videos, %d bags", vehicle_dir, len(videos), len(bags))
+        return cls(vehicle_dir, videos, bags)
+
+    def bag_window(self, bag: int, epoch: float) -> Tuple[List[str], float]:
+        """Bags and offset that start playback :data:`BAG_PREROLL_SECONDS` before *epoch* in bag *bag*."""
+        starts, paths = self.bag_starts, self.bag_paths
+        buffered = epoch - BAG_PREROLL_SECONDS
+        if bag > 0:
+            previous = starts[bag - 1]
+            if previous <= buffered < starts[bag]:
+                return [paths[bag - 1], paths[bag]], buffered - previous
+            if buffered < previous:
+                return [paths[bag]], 0.0
+        return [paths[bag]], max(0.0, buffered - starts[bag])
+
+
+def _cover(starts: "array[float]", time_index: EventTimeIndex, row_count: int) -> "array[int]":
+    """Index of the latest start ``<=`` each row's epoch (``-1`` if none or unparsed)."""
+    covering = array("i", [-1]) * row_count
+    if not starts:
+        return covering
+    current, upcoming, total = -1, 0, len(starts)
+    for epoch, row in time_index.iter_sorted():
+        while upcoming < total and starts[upcoming] <= epoch:
+            current, upcoming = upcoming, upcoming + 1
+        covering[row] = current
+    return covering
+
+
+class MediaTargets:
+    """Covering video and bag of every row of one event log."""
+
+    def __init__(self, media: MediaIndex, time_index: EventTimeIndex, videos: "array[int]", bags: "array[int]"):
+        self.media = media
+        self._time_index = time_index
+        self._videos = videos
+        self._bags = bags
+
+    @classmethod
+    def resolve(cls, media: MediaIndex, time_index: EventTimeIndex) -> "MediaTargets":
+        """Resolve every row of *time_index* against *media* in one pass over the rows in time order."""
+        row_count = len(time_index)
+        return cls(
+            media,
+            time_index,
+            _cover(media.video_starts, time_index, row_count),
+            _cover(media.bag_starts, time_index, row_count),
+        )
+
+    def has_video(self, row: int) -> bool:
+        return self._videos[row] >= 0
+
+    def has_bag(self, row: int) -> bool:
+        return self._bags[row] >= 0
+
+    def target(self, row: int) -> MediaTarget:
+        """Playback target of *row*; offsets are computed from its epoch."""
+        media = self.media
+        epoch = self._time_index.epoch(row)
+        video, bag = self._videos[row], self._bags[row]
+        video_path, video_offset = None, 0
+        if video >= 0 and epoch is not None:
+            video_path, video_offset = media.video_paths[video], int(epoch - media.video_starts[video])
+        if bag < 0 or epoch is None:
+            return MediaTarget(video_path, video_offset, None, 0.0, None, 0.0)
+        bag_files, bag_offset = media.bag_window(bag, epoch)
+        event_offset = epoch - media.bag_starts[bag]
+        return MediaTarget(video_path, video_offset, media.bag_paths[bag], event_offset, bag_files, bag_offset)
+
+
+class MediaIndexCache:
+    """Thread-safe :class:`MediaIndex` per vehicle folder, rescanned after *ttl* seconds."""
+
+    def __init__(self, ttl: float = 60.0, scan: Callable[[str], MediaIndex] = MediaIndex.scan) -> None:
+        self._ttl = ttl
+        self._scan = scan
+        self._entries: Dict[str, Tuple[float, MediaIndex]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, vehicle_dir: str) -> MediaIndex:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(vehicle_dir)
+        if entry is not None and now - entry[0] < self._ttl:
+            return entry[1]
+        media = self._scan(vehicle_dir)
+        with self._lock:
+            self._entries[vehicle_dir] = (now, media)
+        return media
+
+    def for_event_log(self, event_log_path: str) -> MediaIndex:
+        """The index of the vehicle folder containing *event_log_path*."""
+        return self.get(vehicle_dir_of(event_log_path))
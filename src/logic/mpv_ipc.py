@@ -0,0 +1,170 @@
+"""Control a running mpv over its JSON IPC socket.
+
+mpv started with ``--input-ipc-server=<path>`` listens on a Unix socket for
+newline-delimited JSON commands (``{"command": [...], "request_id": n}``) and
+answers each with ``{"request_id": n, "error": "success", "data": ...}``,
+interleaved with unsolicited ``{"event": ...}`` lines.  :class:`MpvIpcClient`
+keeps one connection open so jumping the player to another event is a single
+round trip — a ``seek`` when the file is already loaded, otherwise a
+``loadfile`` starting at the requested offset — instead of killing mpv and
+launching it again.
+
+The socket is POSIX-only; :func:`ipc_supported` is ``False`` on Windows, where
+callers keep relaunching the player.
+"""
+
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Optional, Sequence, Union
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+#: Seconds to wait for a reply (or for a freshly started mpv to create its socket).
+IPC_TIMEOUT = 1.0
+
+
+class MpvIpcError(Exception):
+    """mpv is not reachable on the socket, or rejected a command."""
+
+
+def ipc_supported() -> bool:
+    return sys.platform != "win32" and hasattr(socket, "AF_UNIX")
+
+
+def default_socket_path() -> str:
+    """Per-application socket path, so two GUI instances never drive each other's player."""
+    return os.path.join(tempfile.gettempdir(), f"triage-gui-mpv-{os.getpid()}.sock")
+
+
+def socket_path_from_command(command: Union[str, Sequence[str]]) -> Optional[str]:
+    """The ``--input-ipc-server`` path of an mpv *command* line, or ``None`` if it has none.
+
+    An mpv adopted from an earlier session listens on that session's
+    :func:`default_socket_path`, so callers connect to what the command says.
+    """
+    args = command.split() if isinstance(command, str) else [str(arg) for arg in command]
+    return next((arg.split("=", 1)[1] for arg in args if arg.startswith("--input-ipc-server=")), None)
+
+
+class MpvIpcClient:
+    """JSON IPC connection to the mpv listening on *socket_path*; thread-safe.
+
+    The connection is opened on first use and reopened after errors, so one
+    client can outlive several mpv processes sharing the same socket path.
+    """
+
+    def __init__(self, socket_path: str, timeout: float = IPC_TIMEOUT) -> None:
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._buffer = b""
+        self._request_id = 0
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+    def _disconnect(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = None
+        self._buffer = b""
+
+    def _connect(self, wait: float) -> socket.socket:
+        deadline = time.monotonic() + wait
+        while True:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.socket_path)
+                return sock
+            except OSError as e:
+                sock.close()
+                if time.monotonic() >= deadline:
+                    raise MpvIpcError(f"mpv IPC socket not reachable: {e}") from e
+            time.sleep(0.02)
+
+    def command(self, *args: Any, wait: float = 0.0, **named: Any) -> Any:
+        """Run one mpv command and return its ``data``; raises :class:`MpvIpcError`.
+
+        With keyword arguments the command is sent in mpv's named-argument form
+        (``{"name": args[0], **named}``), which does not depend on the position
+        of optional arguments.  *wait* is how long to keep retrying the
+        connection, for an mpv that was only just started and may not have
+        created its socket yet.
+        """
+        payload: Any = dict(named, name=args[0]) if named else list(args)
+        with self._lock:
+            # A kept connection may belong to an mpv that has since been replaced: retry once on a fresh one.
+            retry = self._sock is not None
+            while True:
+                if self._sock is None:
+                    self._sock = self._connect(wait)
+                self._request_id += 1
+                request_id = self._request_id
+                try:
+                    self._sock.sendall(json.dumps({"command": payload, "request_id": request_id}).encode() + b"\n")
+                    reply = self._read_reply(self._sock, request_id)
+                    break
+                except (OSError, ValueError) as e:
+                    self._disconnect()
+                    if not retry:
+                        raise MpvIpcError(f"mpv IPC failed: {e}") from e
+                    retry = False
+        if reply.get("error") != "success":
+            raise MpvIpcError(f"mpv rejected {args[0]}: {reply.get('error')}")
+        return reply.get("data")
+
+    def _read_reply(self, sock: socket.socket, request_id: int) -> dict:
+        deadline = time.monotonic() + self.timeout
+        while True:
+            line, newline, rest = self._buffer.partition(b"\n")
+            if newline:
+                self._buffer = rest
+                message = json.loads(line)
+                if message.get("request_id") == request_id:
+                    return message
+                continue  # an event, or a late reply to an earlier request
+            if time.monotonic() >= deadline:
+                raise OSError("timed out waiting for mpv")
+            chunk = sock.recv(65536)
+            if not chunk:
+                raise OSError("mpv closed the IPC connection")
+            self._buffer += chunk
+
+    def get_property(self, name: str) -> Any:
+        return self.command("get_property", name)
+
+    def set_property(self, name: str, value: Any) -> None:
+        self.command("set_property", name, value)
+
+    def play(self, path: str, start: float, wait: float = 0.0) -> str:
+        """Show *path* at *start* seconds: seek if it is already loaded, else load it there.
+
+        Returns ``"seek"`` or ``"loadfile"`` to say which was needed.
+        """
+        current = None
+        try:
+            current = self.command("get_property", "path", wait=wait)
+        except MpvIpcError:
+            if self._sock is None:
+                raise  # not connected; "path" is merely unavailable while mpv is idle
+        if current and os.path.realpath(current) == os.path.realpath(path):
+            self.command("seek", start, "absolute+exact")
+            self.set_property("pause", False)
+            return "seek"
+        # Passed with the file, ``start`` applies to this file only; the global option is left alone.
+        self.command("loadfile", url=path, flags="replace", options=f"start={start}")
+        self.set_property("pause", False)
+        return "loadfile"
@@ -0,0 +1,331 @@
+"""Capture of launched tools' stdout/stderr into bounded in-memory logs.
+
+Each child is started with stdout and stderr on its own spill file under
+:data:`OUTPUT_DIR`, opened for appending.  The kernel writes the output, so a
+tool never waits for a reader and has no pipe to lose: it keeps running (and
+logging) when the application exits or crashes, and a later session picks
+its file up again with :meth:`OutputCapture.reopen`.
+
+:class:`OutputCapture` owns a single thread that, every
+:data:`~src.utils.constants.PROCESS_OUTPUT_POLL_INTERVAL`, reads what was
+appended to the files of live tools into their :class:`ProcessOutput` — a ring
+buffer of the last :data:`~src.utils.constants.PROCESS_OUTPUT_LINES` lines.
+A file grown past :data:`~src.utils.constants.PROCESS_OUTPUT_MAX_BYTES` is
+copied to ``<file>.1`` and truncated in place (the tool's descriptor appends,
+so it carries on at the new end), like logrotate's ``copytruncate``.  The
+truncation follows the copy immediately and what was not read yet is taken
+from the copy, so only output written in that instant can be lost.
+"""
+
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from collections import deque
+from typing import BinaryIO, Collection, Deque, List, Optional, Pattern
+
+from ..utils.constants import (
+    PROCESS_OUTPUT_KEEP,
+    PROCESS_OUTPUT_LINES,
+    PROCESS_OUTPUT_MAX_BYTES,
+    PROCESS_OUTPUT_POLL_INTERVAL,
+)
+from ..utils.logger import LOG_DIR, get_logger
+
+logger = get_logger(__name__)
+
+#: Directory of the per-process spill files.
+OUTPUT_DIR = os.path.join(LOG_DIR, "processes")
+
+_READ_SIZE = 1 << 16
+_REOPEN_BYTES = 256 * 1024  # tail of a previous session's file read back into the ring buffer
+
+
+class ProcessOutput:
+    """Last lines printed by one launched process, read from its spill file *path*.
+
+    Lines are added by :meth:`update` only (normally on the capture thread);
+    readers get consistent snapshots from :meth:`tail`.
+    """
+
+    def __init__(self, name: str, path: str, max_lines: int = PROCESS_OUTPUT_LINES) -> None:
+        self.name = name
+        self.path = path
+        self.pid: Optional[int] = None
+        self.process = None  # Popen-like, once spawned: its returncode tells when to stop reading
+        self.key: Optional[int] = None  # process id in the application, once it is tracked
+        self.sink: Optional[BinaryIO] = None  # the file to hand to the child as stdout, until it is spawned
+        self.lines: Deque[str] = deque(maxlen=max_lines)
+        self.total_lines = 0
+        self._partial = b""
+        self._closed = threading.Event()
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._read_lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._offset = 0
+        self._rotate = True
+
+    @property
+    def closed(self) -> bool:
+        """``True`` once the process exited and everything it wrote was read."""
+        return self._closed.is_set()
+
+    def tail(self, count: int) -> List[str]:
+        """The last *count* complete lines (plus an unterminated last line once closed)."""
+        with self._lock:
+            lines = list(self.lines)
+        return lines[-count:] if count < len(lines) else lines
+
+    def wait_for_line(self, pattern: Pattern[str], timeout: float) -> Optional[str]:
+        """Wait until a line printed from now on matches *pattern*; ``None`` on timeout or once closed."""
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            seen = self.total_lines
+            while True:
+                new = min(self.total_lines - seen, len(self.lines))
+                if new:
+                    for line in list(self.lines)[-new:]:
+                        if pattern.search(line):
+                            return line
+                seen = self.total_lines
+                remaining = deadline - time.monotonic()
+                if self._closed.is_set() or remaining <= 0:
+                    return None
+                self._changed.wait(remaining)
+
+    def update(self) -> bool:
+        """Read what was appended to the file since the last call; ``False`` once closed.
+
+        Never waits for the process (the file is a regular file).  The output
+        is closed by the first call after the process has exited.
+        """
+        with self._read_lock:
+            if self._closed.is_set():
+                return False
+            exited = self.process is None or self.process.returncode is not None
+            self._read()
+            if self._rotate and not exited and self._offset > PROCESS_OUTPUT_MAX_BYTES:
+                self._rotate_file()
+            if exited:
+                self._close()
+                return False
+            return True
+
+    def feed(self, data: bytes) -> None:
+        chunks = (self._partial + data).split(b"\n")
+        self._partial = chunks.pop()
+        if chunks:
+            self._add_lines(chunks)
+
+    def _open(self, offset: int) -> bool:
+        try:
+            self._fd = os.open(self.path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            self._offset = os.lseek(self._fd, offset, os.SEEK_SET)
+        except OSError as e:
+            logger.warning("Cannot read output of %s from %s: %s", self.name, self.path, e)
+            self._close_fd()
+            return False
+        return True
+
+    def _read(self) -> None:
+        if self._fd is None:
+            return
+        try:
+            if os.fstat(self._fd).st_size < self._offset:  # truncated by someone else
+                self._offset = os.lseek(self._fd, 0, os.SEEK_SET)
+            while True:
+                data = os.read(self._fd, _READ_SIZE)
+                if not data:
+                    return
+                self._offset += len(data)
+                self.feed(data)
+        except OSError as e:
+            logger.warning("Stopped reading output of %s: %s", self.name, e)
+            self._close_fd()
+
+    def _rotate_file(self) -> None:
+        # Keep one previous file: <name>.log.1
+        rotated = self.path + ".1"
+        try:
+            shutil.copyfile(self.path, rotated)
+            os.truncate(self.path, 0)
+        except OSError as e:
+            logger.warning("Cannot rotate output of %s (%s), it will keep growing: %s", self.name, self.path, e)
+            self._rotate = False
+            return
+        offset, self._offset = self._offset, 0
+        try:
+            if self._fd is not None:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+            with open(rotated, "rb") as fh:  # what was appended since the last read
+                fh.seek(offset)
+                for data in iter(lambda: fh.read(_READ_SIZE), b""):
+                    self.feed(data)
+        except OSError as e:
+            logger.warning("Lost output of %s while rotating %s: %s", self.name, self.path, e)
+
+    def _close(self) -> None:
+        if self._partial:
+            self._add_lines([self._partial])
+            self._partial = b""
+        self._close_fd()
+        with self._changed:
+            self._closed.set()
+            self._changed.notify_all()
+
+    def _close_fd(self) -> None:
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+
+    def _add_lines(self, chunks: List[bytes]) -> None:
+        decoded = [chunk.decode("utf-8", "replace").rstrip("\r") for chunk in chunks]
+        with self._lock:
+            self.lines.extend(decoded)
+            self.total_lines += len(decoded)
+            self._changed.notify_all()
+
+
+class OutputCapture:
+    """Follows the spill files of launched processes; keeps the last :data:`PROCESS_OUTPUT_KEEP` outputs.
+
+    A launch goes :meth:`create` (hand :attr:`ProcessOutput.sink` to ``Popen``
+    as stdout and stderr), then :meth:`attach` — or :meth:`discard` when the
+    spawn failed.
+    """
+
+    def __init__(self, keep: int = PROCESS_OUTPUT_KEEP) -> None:
+        self._keep = keep
+        self._outputs: List[ProcessOutput] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._wake = threading.Event()
+
+    def create(self, name: str) -> Optional[ProcessOutput]:
+        """A new spill file for a process about to be launched; ``None`` if it cannot be created."""
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", name).strip("_").lower() or "process"
+        prefix = f"{slug}-{time.strftime('%Y%m%d-%H%M%S')}-"
+        try:
+            os.makedirs(OUTPUT_DIR, exist_ok=True)
+            fd, path = tempfile.mkstemp(prefix=prefix, suffix=".log", dir=OUTPUT_DIR)
+            sink = os.fdopen(fd, "ab")  # O_APPEND: the child keeps writing at the end after a rotation
+        except OSError as e:
+            logger.warning("Cannot capture output of %s in %s: %s", name, OUTPUT_DIR, e)
+            return None
+        output = ProcessOutput(name, path)
+        output.sink = sink
+        return output
+
+    def attach(self, output: Optional[ProcessOutput], proc) -> Optional[ProcessOutput]:
+        """Start following *output* now that *proc* was spawned writing to its :attr:`~ProcessOutput.sink`."""
+        if output is None:
+            return None
+        self._close_sink(output)
+        return self._follow(output, proc, 0)
+
+    def discard(self, output: Optional[ProcessOutput]) -> None:
+        """Forget an output :meth:`create`\\ d for a launch that failed."""
+        if output is not None:
+            self._close_sink(output)
+            _remove_spill_files(output.path)
+
+    def reopen(self, name: str, path: str, proc) -> Optional[ProcessOutput]:
+        """Follow again the spill file of *proc*, launched by an earlier session; ``None`` if it is gone."""
+        return self._follow(ProcessOutput(name, path), proc, _line_start(path, _REOPEN_BYTES))
+
+    def outputs(self) -> List[ProcessOutput]:
+        """Captured outputs, oldest first."""
+        with self._lock:
+            return list(self._outputs)
+
+    def get(self, key: int) -> Optional[ProcessOutput]:
+        with self._lock:
+            return next((output for output in self._outputs if output.key == key), None)
+
+    def prune(self) -> None:
+        """Delete all but the newest :data:`PROCESS_OUTPUT_KEEP` spill files left by earlier sessions.
+
+        Files followed right now (e.g. re-opened for adopted tools) are kept.
+        """
+        with self._lock:
+            followed = {os.path.abspath(output.path) for output in self._outputs}
+        _prune_spill_dir(self._keep, followed)
+
+    @staticmethod
+    def _close_sink(output: ProcessOutput) -> None:
+        if output.sink is not None:
+            output.sink.close()  # the child has its own copy of the descriptor
+            output.sink = None
+
+    def _follow(self, output: ProcessOutput, proc, offset: Optional[int]) -> Optional[ProcessOutput]:
+        output.process = proc
+        output.pid = proc.pid
+        if offset is None or not output._open(offset):
+            return None
+        with self._lock:
+            self._outputs.append(output)
+            self._trim()
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True, name="ProcessOutputCapture")
+                self._thread.start()
+        self._wake.set()
+        return output
+
+    def _trim(self) -> None:
+        finished = [output for output in self._outputs if output.closed]
+        for output in finished[: max(0, len(self._outputs) - self._keep)]:
+            self._outputs.remove(output)
+            _remove_spill_files(output.path)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                live = [output for output in self._outputs if not output.closed]
+            for output in live:
+                output.update()
+            self._wake.wait(PROCESS_OUTPUT_POLL_INTERVAL if live else None)  # idle until the next launch
+            self._wake.clear()
+
+
+def _line_start(path: str, tail_bytes: int) -> Optional[int]:
+    """Offset of the first line starting in the last *tail_bytes* of *path*; ``None`` if it is unreadable."""
+    try:
+        with open(path, "rb") as fh:
+            size = fh.seek(0, os.SEEK_END)
+            if size <= tail_bytes:
+                return 0
+            start = fh.seek(size - tail_bytes - 1)  # from the byte before, to see if a line starts right there
+            head = fh.read(tail_bytes + 1)
+    except OSError:
+        return None
+    newline = head.find(b"\n")
+    return size if newline < 0 else start + newline + 1
+
+
+def _remove_spill_files(path: str) -> None:
+    for spill in (path, path + ".1"):
+        try:
+            os.remove(spill)
+        except OSError:
+            pass
+
+
+def _prune_spill_dir(keep: int, exclude: Collection[str] = ()) -> None:
+    """Delete all but the newest *keep* spill files in :data:`OUTPUT_DIR`, never those in *exclude*."""
+    try:
+        entries = [
+            entry
+            for entry in os.scandir(OUTPUT_DIR)
+            if entry.name.endswith(".log") and os.path.abspath(entry.path) not in exclude
+        ]
+    except OSError:
+        return
+    entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for entry in entries[keep:]:
+        _remove_spill_files(entry.path)
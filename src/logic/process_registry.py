@@ -0,0 +1,365 @@
+"""Indexed registry of the processes launched by the application.
+
+:class:`ProcessRegistry` replaces a plain list of dicts that every query
+copied and scanned, calling ``poll()`` on each entry.  Records are
+:class:`ProcessRecord` objects with ``__slots__``; the registry indexes them by
+id, by tool name and by media path, so lookups cost O(1) plus the (small)
+number of matches.  Exit state is written by the process supervisor
+(:meth:`ProcessRegistry.mark_exited`) the moment a child is reaped, which lets
+queries answer from memory without any syscall, from any thread and at any
+rate.
+
+Given a state file (the application uses
+:data:`~src.utils.constants.PROCESS_STATE_FILE_PATH`), the registry also
+survives a restart of the GUI: every change is written to it — from a snapshot
+taken under the lock, outside the lock — and
+:meth:`ProcessRegistry.adopt_saved` re-attaches to the tools of the previous
+session that are still running.  A saved pid is only trusted while
+``/proc/<pid>/stat`` reports the same start time, so a pid reused by an
+unrelated process is never adopted (or killed).
+"""
+
+import json
+import os
+import subprocess
+import threading
+import time
+from typing import Dict, List, Optional
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_PROC = "/proc"
+
+
+def _proc_stat(pid: int) -> Optional[List[str]]:
+    """Fields of ``/proc/<pid>/stat`` after the command name (state first), or ``None``."""
+    try:
+        with open(f"{_PROC}/{pid}/stat", "r") as fh:
+            stat = fh.read()
+    except OSError:
+        return None
+    # The command name may contain spaces and parentheses: split after its closing ')'.
+    return stat[stat.rfind(")") + 2 :].split()
+
+
+def proc_start_ticks(pid: int) -> Optional[int]:
+    """Start time of *pid* in clock ticks since boot; ``None`` if it is gone (or there is no ``/proc``)."""
+    fields = _proc_stat(pid)
+    try:
+        return int(fields[19]) if fields is not None else None
+    except (IndexError, ValueError):
+        return None
+
+
+def _is_alive(pid: int, start_ticks: int) -> bool:
+    fields = _proc_stat(pid)
+    if fields is None or fields[0] == "Z":
+        return False
+    try:
+        return int(fields[19]) == start_ticks
+    except (IndexError, ValueError):
+        return False
+
+
+class AdoptedProcess:
+    """``Popen``-like handle on a process started by an earlier session.
+
+    It is not our child, so its exit status cannot be collected: once it is
+    gone :attr:`returncode` is ``0``.
+    """
+
+    def __init__(self, pid: int, start_ticks: int) -> None:
+        self.pid = pid
+        self.start_ticks = start_ticks
+        self.returncode: Optional[int] = None
+
+    def poll(self) -> Optional[int]:
+        if self.returncode is None and not _is_alive(self.pid, self.start_ticks):
+            self.returncode = 0
+        return self.returncode
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.poll() is None:
+            if deadline is not None and time.monotonic() >= deadline:
+                raise subprocess.TimeoutExpired(f"pid {self.pid}", timeout)
+            time.sleep(0.05)
+        return self.returncode
+
+    def send_signal(self, sig: int) -> None:
+        if self.poll() is None:
+            os.kill(self.pid, sig)
+
+    def terminate(self) -> None:
+        self.send_signal(15)
+
+    def kill(self) -> None:
+        self.send_signal(9)
+
+
+class ProcessRecord:
+    """One tracked launch.  ``running`` reflects the supervisor's exit events, not a fresh ``poll()``."""
+
+    __slots__ = (
+        "id",
+        "name",
+        "process",
+        "pid",
+        "pgid",
+        "start_ticks",
+        "command",
+        "cwd",
+        "path",
+        "start_time",
+        "output",
+        "prebuilt",
+        "returncode",
+        "stopping",
+        "ready_after",
+        "adopted",
+    )
+
+    def __init__(self, proc_id, name, process, command, cwd=None, path=None, output=None, prebuilt=False) -> None:
+        self.id = proc_id
+        self.name = name
+        self.process = process
+        self.pid = process.pid
+        try:
+            self.pgid: Optional[int] = os.getpgid(process.pid)
+        except (AttributeError, OSError):  # no process groups, or already gone
+            self.pgid = None
+        self.start_ticks = proc_start_ticks(process.pid)
+        self.command = command
+        self.cwd = cwd
+        self.path = path
+        self.start_time = time.time()
+        self.output = output
+        self.prebuilt = prebuilt
+        self.returncode: Optional[int] = None
+        self.stopping = False  # being stopped by the application: its exit is not reported
+        self.ready_after: Optional[float] = None
+        self.adopted = False  # started by an earlier session of the application
+
+    @property
+    def running(self) -> bool:
+        return self.returncode is None
+
+    def __repr__(self) -> str:
+        state = "running" if self.running else f"exited {self.returncode}"
+        return f"ProcessRecord(id={self.id}, name={self.name!r}, pid={self.pid}, {state})"
+
+    def to_state(self) -> Optional[dict]:
+        """What :meth:`ProcessRegistry.adopt_saved` needs to find the process again; ``None`` if unsafe.
+
+        Only processes leading their own process group are saved: stopping one
+        kills its whole group, which must not be the application's own.
+        """
+        if self.start_ticks is None or self.pgid != self.pid:
+            return None
+        return {
+            "name": self.name,
+            "pid": self.pid,
+            "pgid": self.pgid,
+            "start_ticks": self.start_ticks,
+            "start_time": self.start_time,
+            "command": self.command,
+            "cwd": self.cwd,
+            "path": self.path,
+            "prebuilt": self.prebuilt,
+            "output": self.output.path if self.output is not None else None,
+        }
+
+
+def _path_key(path: Optional[str]) -> Optional[str]:
+    return os.path.abspath(path) if path else None
+
+
+class ProcessRegistry:
+    """Tracked processes by id, name and media path; thread-safe.
+
+    Records stay in the registry until they are :meth:`remove`\\ d or reported
+    by :meth:`mark_exited`; queries return them oldest first (:meth:`by_path`
+    in the order they started showing the path).
+
+    Args:
+        state_path: File the registry is saved to on every change, for
+            :meth:`adopt_saved`; ``None`` (the default) keeps it in memory only.
+    """
+
+    def __init__(self, state_path: Optional[str] = None) -> None:
+        self.state_path = state_path
+        self._lock = threading.RLock()
+        self._save_lock = threading.Lock()  # serialises writes of the state file
+        self._version = 0  # of the latest state snapshot
+        self._saved_version = 0  # of the snapshot last written
+        self._owner = {"pid": os.getpid(), "start_ticks": proc_start_ticks(os.getpid())}
+        self._next_id = 0
+        self._by_id: Dict[int, ProcessRecord] = {}
+        self._by_name: Dict[str, Dict[int, ProcessRecord]] = {}
+        self._by_path: Dict[str, Dict[int, ProcessRecord]] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def add(self, name, process, command, cwd=None, path=None, output=None, prebuilt=False) -> ProcessRecord:
+        """Track *process* under a new id and return its record."""
+        with self._lock:
+            record = ProcessRecord(self._next_id, name, process, command, cwd, path, output, prebuilt)
+            self._next_id += 1
+            self._insert(record)
+            state = self._state()
+        self._save(state)
+        return record
+
+    def _insert(self, record: ProcessRecord) -> None:
+        self._by_id[record.id] = record
+        self._by_name.setdefault(record.name, {})[record.id] = record
+        self._index_path(record)
+
+    def _index_path(self, record: ProcessRecord) -> None:
+        key = _path_key(record.path)
+        if key is not None:
+            self._by_path.setdefault(key, {})[record.id] = record
+
+    def _unindex(self, index: Dict[str, Dict[int, ProcessRecord]], key: Optional[str], proc_id: int) -> None:
+        bucket = index.get(key) if key is not None else None
+        if bucket is not None:
+            bucket.pop(proc_id, None)
+            if not bucket:
+                del index[key]
+
+    def remove(self, proc_id: int) -> Optional[ProcessRecord]:
+        """Stop tracking *proc_id*; returns its record, or ``None`` if it was not tracked."""
+        return self._remove(proc_id, None)
+
+    def mark_exited(self, proc_id: int, returncode: int) -> Optional[ProcessRecord]:
+        """Record that *proc_id* was reaped with *returncode* and stop tracking it."""
+        return self._remove(proc_id, returncode)
+
+    def _remove(self, proc_id: int, returncode: Optional[int]) -> Optional[ProcessRecord]:
+        with self._lock:
+            record = self._by_id.pop(proc_id, None)
+            if record is None:
+                return None
+            self._unindex(self._by_name, record.name, proc_id)
+            self._unindex(self._by_path, _path_key(record.path), proc_id)
+            if returncode is not None:
+                record.returncode = returncode
+            state = self._state()
+        self._save(state)
+        return record
+
+    def set_path(self, record: ProcessRecord, path: Optional[str]) -> None:
+        """Change the media *path* shown by *record* (e.g. a reused player loading another file)."""
+        with self._lock:
+            if self._by_id.get(record.id) is not record:
+                record.path = path
+                return
+            self._unindex(self._by_path, _path_key(record.path), record.id)
+            record.path = path
+            self._index_path(record)
+            state = self._state()
+        self._save(state)
+
+    def get(self, proc_id: int) -> Optional[ProcessRecord]:
+        return self._by_id.get(proc_id)
+
+    def by_name(self, name: str) -> List[ProcessRecord]:
+        with self._lock:
+            return list(self._by_name.get(name, {}).values())
+
+    def by_path(self, path: str) -> List[ProcessRecord]:
+        with self._lock:
+            return list(self._by_path.get(_path_key(path), {}).values())
+
+    def snapshot(self) -> List[ProcessRecord]:
+        """All tracked records, oldest first."""
+        with self._lock:
+            return list(self._by_id.values())
+
+    def _state(self) -> Optional[tuple]:
+        """Snapshot of what to save, taken under :attr:`_lock`; ``None`` when not persisting."""
+        if self.state_path is None:
+            return None
+        self._version += 1
+        processes = [entry for entry in (record.to_state() for record in self._by_id.values()) if entry]
+        return self._version, {"owner": self._owner, "processes": processes}
+
+    def _save(self, snapshot: Optional[tuple]) -> None:
+        """Write a :meth:`_state` snapshot; called outside :attr:`_lock`, skips snapshots older than the file."""
+        if snapshot is None:
+            return
+        version, state = snapshot
+        with self._save_lock:
+            path = self.state_path
+            if path is None or version <= self._saved_version:
+                return
+            self._saved_version = version
+            tmp_path = f"{path}.tmp"
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(tmp_path, "w") as fh:
+                    json.dump(state, fh, indent=1)
+                os.replace(tmp_path, path)
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning("Could not save process state to %s: %s", path, e)
+
+    def _load(self) -> dict:
+        try:
+            with open(self.state_path, "r") as fh:
+                state = json.load(fh)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable process state %s: %s", self.state_path, e)
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def adopt_saved(self, reopen_output=None) -> List[ProcessRecord]:
+        """Track again the saved processes that are still running; returns their records.
+
+        *reopen_output(name, path, process)*, if given, returns the output
+        capture of an adopted process from the spill file it still writes to.
+        If the session that saved the file is itself still running, its
+        processes are left to it and this registry stops persisting, so the
+        two sessions do not overwrite each other's state.
+        """
+        if self.state_path is None:
+            return []
+        state = self._load()
+        owner = state.get("owner") or {}
+        if owner.get("pid") != os.getpid() and _is_alive(owner.get("pid") or 0, owner.get("start_ticks")):
+            logger.info("Process state %s belongs to running PID %s; not persisting", self.state_path, owner["pid"])
+            self.state_path = None
+            return []
+        adopted = []
+        with self._lock:
+            for entry in state.get("processes") or []:
+                try:
+                    pid, start_ticks = int(entry["pid"]), int(entry["start_ticks"])
+                    if not _is_alive(pid, start_ticks) or os.getpgid(pid) != int(entry["pgid"]):
+                        continue
+                    record = ProcessRecord(
+                        self._next_id,
+                        entry["name"],
+                        AdoptedProcess(pid, start_ticks),
+                        entry["command"],
+                        entry.get("cwd"),
+                        entry.get("path"),
+                        None,
+                        bool(entry.get("prebuilt")),
+                    )
+                except (KeyError, TypeError, ValueError, OSError):
+                    continue
+                record.start_time = float(entry.get("start_time") or record.start_time)
+                record.adopted = True
+                if reopen_output is not None and entry.get("output"):
+                    record.output = reopen_output(record.name, entry["output"], record.process)
+                self._next_id += 1
+                self._insert(record)
+                adopted.append(record)
+            state = self._state()
+        self._save(state)  # drops the entries that are gone
+        return adopted
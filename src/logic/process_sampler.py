@@ -0,0 +1,197 @@
+"""Low-overhead CPU, memory and I/O sampling of launched tools from ``/proc``.
+
+Every tool is launched in its own session (``os.setsid``), so its process
+group id equals the PID of the launched process and covers everything it
+spawns (``bazel run`` → the built binary, …).  :class:`ProcessSampler` wakes
+every :data:`~src.utils.constants.PROCESS_SAMPLE_INTERVAL` seconds while
+anything is tracked, finds the members of each tracked group with one pass over
+``/proc/<pid>/stat``, and reads ``statm`` and ``io`` of those members only.
+
+Each tracked process keeps a :class:`ProcessHistory`: the last
+:data:`~src.utils.constants.PROCESS_SAMPLE_HISTORY` samples in a fixed-size
+ring buffer plus the peak CPU and RSS seen over its lifetime.  On systems
+without ``/proc`` the sampler stays idle and :attr:`ProcessSampler.available`
+is ``False``.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Iterator, NamedTuple, Optional, Tuple
+
+from ..utils.constants import PROCESS_SAMPLE_HISTORY, PROCESS_SAMPLE_INTERVAL
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_PROC = "/proc"
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+class ProcessSample(NamedTuple):
+    """Totals over one process group at one point in time."""
+
+    timestamp: float
+    cpu_percent: float  # of one core, so a group can exceed 100
+    rss_bytes: int
+    read_bytes: int  # cumulative storage I/O of the current members (0 when not readable)
+    write_bytes: int
+    processes: int
+
+
+class ProcessHistory:
+    """Ring buffer of :class:`ProcessSample` plus lifetime peaks for one tracked process group."""
+
+    def __init__(self, pgid: int, size: int = PROCESS_SAMPLE_HISTORY) -> None:
+        self.pgid = pgid
+        self.samples: Deque[ProcessSample] = deque(maxlen=size)
+        self.peak_cpu_percent = 0.0
+        self.peak_rss_bytes = 0
+        # pid -> CPU ticks (utime + stime) at the previous sample, for per-member deltas
+        self._ticks: Dict[int, int] = {}
+        self._sampled_at: Optional[float] = None
+
+    @property
+    def latest(self) -> Optional[ProcessSample]:
+        return self.samples[-1] if self.samples else None
+
+    def add(self, now: float, members: Dict[int, int]) -> None:
+        """Record one sample from *members* (pid → CPU ticks) of the group."""
+        cpu = 0.0
+        if self._sampled_at is not None and now > self._sampled_at:
+            # Members that appeared since the last sample have no baseline yet; they count from the next one.
+            used = sum(ticks - self._ticks[pid] for pid, ticks in members.items() if pid in self._ticks)
+            cpu = 100.0 * used / _CLOCK_TICKS / (now - self._sampled_at)
+        self._ticks = members
+        self._sampled_at = now
+
+        rss = read = write = 0
+        for pid in members:
+            rss += _rss_bytes(pid)
+            pid_read, pid_write = _io_bytes(pid)
+            read += pid_read
+            write += pid_write
+        self.samples.append(ProcessSample(now, cpu, rss, read, write, len(members)))
+        self.peak_cpu_percent = max(self.peak_cpu_percent, cpu)
+        self.peak_rss_bytes = max(self.peak_rss_bytes, rss)
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path, "r") as fh:
+            return fh.read()
+    except OSError:  # exited meanwhile, or not ours to read
+        return None
+
+
+def _iter_stats() -> Iterator[Tuple[int, int, int]]:
+    """``(pid, pgrp, utime + stime)`` of every process on the system."""
+    try:
+        names = os.listdir(_PROC)
+    except OSError:
+        return
+    for name in names:
+        if not name.isdigit():
+            continue
+        stat = _read(f"{_PROC}/{name}/stat")
+        if stat is None:
+            continue
+        # The command name may contain spaces and parentheses: split after its closing ')'.
+        fields = stat[stat.rfind(")") + 2 :].split()
+        try:
+            yield int(name), int(fields[2]), int(fields[11]) + int(fields[12])
+        except (IndexError, ValueError):
+            continue
+
+
+def _rss_bytes(pid: int) -> int:
+    statm = _read(f"{_PROC}/{pid}/statm")
+    try:
+        return int(statm.split()[1]) * _PAGE_SIZE if statm else 0
+    except (IndexError, ValueError):
+        return 0
+
+
+def _io_bytes(pid: int) -> Tuple[int, int]:
+    io = _read(f"{_PROC}/{pid}/io")
+    if not io:
+        return 0, 0
+    values = dict(line.split(": ", 1) for line in io.splitlines() if ": " in line)
+    try:
+        return int(values.get("read_bytes", 0)), int(values.get("write_bytes", 0))
+    except ValueError:
+        return 0, 0
+
+
+class ProcessSampler:
+    """Samples tracked process groups on a background thread; thread-safe.
+
+    Args:
+        interval: Seconds between samples.
+        history: Samples kept per process.
+    """
+
+    def __init__(self, interval: float = PROCESS_SAMPLE_INTERVAL, history: int = PROCESS_SAMPLE_HISTORY) -> None:
+        self.interval = interval
+        self._size = history
+        self._histories: Dict[int, ProcessHistory] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self.available = os.path.isfile(f"{_PROC}/self/stat")
+
+    def track(self, key: int, pgid: int) -> None:
+        """Start sampling process group *pgid* under *key* (the thread starts on first use)."""
+        if not self.available:
+            return
+        with self._lock:
+            self._histories[key] = ProcessHistory(pgid, self._size)
+            if self._thread is None or not self._thread.is_alive():
+                self._stopping = False
+                self._thread = threading.Thread(target=self._run, daemon=True, name="ProcessSampler")
+                self._thread.start()
+        self._wake.set()  # take the baseline sample now
+
+    def untrack(self, key: int) -> None:
+        with self._lock:
+            self._histories.pop(key, None)
+
+    def history(self, key: int) -> Optional[ProcessHistory]:
+        with self._lock:
+            return self._histories.get(key)
+
+    def stop(self) -> None:
+        self._stopping = True
+        self._wake.set()
+
+    def sample(self) -> None:
+        """Take one sample of every tracked group now."""
+        with self._lock:
+            histories = list(self._histories.values())
+        if not histories:
+            return
+        wanted = {history.pgid for history in histories}
+        members: Dict[int, Dict[int, int]] = {pgid: {} for pgid in wanted}
+        for pid, pgrp, ticks in _iter_stats():
+            if pgrp in wanted:
+                members[pgrp][pid] = ticks
+        now = time.monotonic()
+        for history in histories:
+            history.add(now, members[history.pgid])
+
+    def _run(self) -> None:
+        while not self._stopping:
+            with self._lock:
+                idle = not self._histories
+            # Sleep until something is tracked again rather than waking up for nothing.
+            self._wake.wait(None if idle else self.interval)
+            self._wake.clear()
+            if self._stopping:
+                break
+            try:
+                self.sample()
+            except Exception:
+                logger.exception("Process sampling failed")
@@ -0,0 +1,267 @@
+"""Event-driven supervision of launched child processes.
+
+:class:`ProcessSupervisor` reports every watched process's exit as soon as it
+happens instead of discovering it on a periodic ``poll()`` sweep.  One daemon
+thread blocks in a :mod:`selectors` selector on:
+
+* a ``pidfd`` per child (``os.pidfd_open``, Linux 5.3+), which becomes readable
+  when that child exits — only the exited child is then reaped; or, where
+  pidfds are unavailable,
+* a wake-up socket that a ``SIGCHLD`` handler writes to, after which all
+  watched children are checked once; or, on platforms without ``SIGCHLD`` (or
+  when the supervisor is not started from the main thread, where signal
+  handlers cannot be installed), a timeout of
+  :data:`~src.utils.constants.PROCESS_MONITOR_INTERVAL`.
+
+Processes that are not our children (``watch(..., child=False)``, e.g. tools
+re-adopted from a previous session) never raise ``SIGCHLD``: without pidfds
+they are checked by a liveness sweep every ``PROCESS_MONITOR_INTERVAL``.
+
+The same loop also reports each child once when it has been running longer
+than *overdue_after* seconds, by sleeping exactly until the next such deadline.
+Callbacks run on the supervisor thread; UI code must hand them over to Tk
+(``root.after``).
+"""
+
+import os
+import selectors
+import signal
+import socket
+import subprocess
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from ..utils.constants import PROCESS_MONITOR_INTERVAL
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+ExitCallback = Callable[[int, subprocess.Popen, int], None]
+OverdueCallback = Callable[[int, subprocess.Popen], None]
+
+
+def pidfd_supported() -> bool:
+    """``True`` when this Python and kernel provide ``os.pidfd_open``."""
+    if not hasattr(os, "pidfd_open"):
+        return False
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except OSError:
+        return False
+    return True
+
+
+def _drain(sock: socket.socket) -> None:
+    try:
+        while sock.recv(4096):
+            pass
+    except OSError:  # BlockingIOError once empty
+        pass
+
+
+class ProcessSupervisor:
+    """Watches ``Popen`` objects by key and calls *on_exit(key, proc, returncode)* once each exits.
+
+    Args:
+        on_exit: Called on the supervisor thread after the child was reaped.
+        on_overdue: Called once per child still running *overdue_after*
+            seconds after it was watched.
+        overdue_after: Age that triggers *on_overdue*; ``None`` disables it.
+    """
+
+    def __init__(
+        self,
+        on_exit: ExitCallback,
+        on_overdue: Optional[OverdueCallback] = None,
+        overdue_after: Optional[float] = None,
+    ) -> None:
+        self._on_exit = on_exit
+        self._on_overdue = on_overdue
+        self._overdue_after = overdue_after if on_overdue is not None else None
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[int, subprocess.Popen, bool]] = []
+        # key -> (proc, overdue deadline or None once reported)
+        self._watched: Dict[int, Tuple[subprocess.Popen, Optional[float]]] = {}
+        self._foreign: Set[int] = set()  # watched keys that are not our children
+        self._next_sweep: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._wake_r: Optional[socket.socket] = None
+        self._wake_w: Optional[socket.socket] = None
+        self._previous_sigchld = None
+        self.backend = "pidfd" if pidfd_supported() else "poll"
+
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the supervisor thread (no-op while it is running)."""
+        if self.is_alive():
+            return
+        self._stopping.clear()
+        with self._lock:  # children watched before a stop() are picked up again
+            self._pending[:0] = [(key, proc, key not in self._foreign) for key, (proc, _) in self._watched.items()]
+            self._watched.clear()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        if self.backend != "pidfd":
+            self.backend = "sigchld" if self._install_sigchld() else "poll"
+        self._thread = threading.Thread(target=self._run, args=(self._wake_r,), daemon=True, name="ProcessSupervisor")
+        self._thread.start()
+        logger.debug("Process supervisor started (%s)", self.backend)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the thread; watched children are no longer reported."""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        self._stopping.set()
+        self._wake()
+        thread.join(timeout)
+        if self._previous_sigchld is not None:
+            try:
+                signal.signal(signal.SIGCHLD, self._previous_sigchld)
+            except ValueError:  # not on the main thread
+                pass
+            self._previous_sigchld = None
+
+    def watch(self, key: int, proc: subprocess.Popen, child: bool = True) -> None:
+        """Report *proc*'s exit under *key* (immediately if it has already exited).
+
+        *child* is ``False`` for a process this one did not start; *proc* then
+        only needs ``pid`` and ``poll()`` (see
+        :class:`~src.logic.process_registry.AdoptedProcess`).
+        """
+        with self._lock:
+            self._pending.append((key, proc, child))
+        self._wake()
+
+    def _wake(self) -> None:
+        if self._wake_w is not None:
+            try:
+                self._wake_w.send(b"\0")
+            except OSError:  # buffer full: a wake-up is already pending
+                pass
+
+    def _install_sigchld(self) -> bool:
+        if not hasattr(signal, "SIGCHLD") or threading.current_thread() is not threading.main_thread():
+            return False
+        previous = signal.getsignal(signal.SIGCHLD)
+
+        def on_sigchld(signum, frame) -> None:
+            self._wake()
+            if callable(previous):
+                previous(signum, frame)
+
+        signal.signal(signal.SIGCHLD, on_sigchld)
+        self._previous_sigchld = previous
+        return True
+
+    def _run(self, wake_r: socket.socket) -> None:
+        selector = selectors.DefaultSelector()
+        selector.register(wake_r, selectors.EVENT_READ, None)
+        try:
+            while not self._stopping.is_set():
+                woken = False
+                exited: List[int] = []
+                for key, _events in selector.select(self._next_timeout()):
+                    if key.data is None:
+                        woken = True
+                        _drain(wake_r)
+                    else:
+                        selector.unregister(key.fileobj)
+                        os.close(key.fd)
+                        exited.append(key.data)
+                if self._stopping.is_set():
+                    break
+                exited.extend(self._take_pending(selector))
+                if self.backend == "poll" or (woken and self.backend == "sigchld"):
+                    exited.extend(key for key, (proc, _) in list(self._watched.items()) if proc.poll() is not None)
+                if self._sweep_due():
+                    exited.extend(key for key in self._foreign if self._watched[key][0].poll() is not None)
+                for key in dict.fromkeys(exited):
+                    self._report_exit(key)
+                self._report_overdue()
+        except Exception:
+            logger.exception("Process supervisor stopped unexpectedly")
+        finally:
+            for key in list(selector.get_map().values()):
+                if key.data is not None:
+                    os.close(key.fd)
+            selector.close()
+            for sock in (self._wake_r, self._wake_w):
+                if sock is not None:
+                    sock.close()
+            self._wake_r = self._wake_w = None
+
+    def _take_pending(self, selector: selectors.BaseSelector) -> List[int]:
+        """Start watching newly added children; returns those that already exited."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        exited = []
+        for key, proc, child in pending:
+            deadline = time.monotonic() + self._overdue_after if self._overdue_after is not None else None
+            self._watched[key] = (proc, deadline)
+            if not child:
+                self._foreign.add(key)
+            if self.backend == "pidfd":
+                try:
+                    pidfd = os.pidfd_open(proc.pid)
+                except ProcessLookupError:  # already reaped
+                    exited.append(key)
+                    continue
+                selector.register(pidfd, selectors.EVENT_READ, key)
+            elif proc.poll() is not None:
+                exited.append(key)
+        return exited
+
+    def _report_exit(self, key: int) -> None:
+        entry = self._watched.pop(key, None)
+        self._foreign.discard(key)
+        if entry is None:
+            return
+        proc = entry[0]
+        returncode = proc.poll()
+        if returncode is None:  # pidfd readable but not reaped by poll() yet
+            returncode = proc.wait()
+        try:
+            self._on_exit(key, proc, returncode)
+        except Exception:
+            logger.exception("Process exit callback failed")
+
+    def _sweep_due(self) -> bool:
+        """Whether the foreign processes should be checked now (sigchld backend only)."""
+        if self.backend != "sigchld" or not self._foreign:
+            self._next_sweep = None
+            return False
+        now = time.monotonic()
+        if self._next_sweep is None:
+            self._next_sweep = now + PROCESS_MONITOR_INTERVAL
+            return False
+        if now < self._next_sweep:
+            return False
+        self._next_sweep = now + PROCESS_MONITOR_INTERVAL
+        return True
+
+    def _next_timeout(self) -> Optional[float]:
+        deadlines = [deadline for _, deadline in self._watched.values() if deadline is not None]
+        if self._next_sweep is not None:
+            deadlines.append(self._next_sweep)
+        timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+        if self.backend == "poll":
+            timeout = PROCESS_MONITOR_INTERVAL if timeout is None else min(timeout, PROCESS_MONITOR_INTERVAL)
+        return timeout
+
+    def _report_overdue(self) -> None:
+        if self._on_overdue is None:
+            return
+        now = time.monotonic()
+        for key, (proc, deadline) in list(self._watched.items()):
+            if deadline is not None and deadline <= now:
+                self._watched[key] = (proc, None)
+                try:
+                    self._on_overdue(key, proc)
+                except Exception:
+                    logger.exception("Process overdue callback failed")
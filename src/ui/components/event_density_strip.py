@@ -0,0 +1,125 @@
+"""Overview strip showing how many events happened when, coloured by criticality.
+
+:class:`EventDensityStrip` draws an
+:class:`~src.logic.event_histogram.EventHistogram` as stacked bars on a
+canvas.  Adjacent bins are summed into one bar per group of pixels, so a redraw
+costs ``O(bins)`` no matter how many events the log has.  Clicking a bar
+reports the start of that time slice to the owner (the event viewer jumps
+there); hovering shows its time and event count.
+"""
+
+from __future__ import annotations
+
+import math
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, List, Optional
+
+from ...logic.event_histogram import EventHistogram
+from ...utils.timestamp_parser import epoch_to_datetime
+
+#: Bar colour per (lower-cased) criticality; unknown values use :data:`DEFAULT_COLOUR`.
+CRITICALITY_COLOURS = {
+    "critical": "#b71c1c",
+    "error": "#d32f2f",
+    "high": "#e53935",
+    "warning": "#fb8c00",
+    "medium": "#fb8c00",
+    "low": "#43a047",
+    "info": "#1e88e5",
+}
+DEFAULT_COLOUR = "#78909c"
+
+# Stacking order, bottom to top: the most severe events are drawn on top.
+_SEVERITY = ("info", "low", "medium", "warning", "high", "error", "critical")
+
+
+def _severity(category: str) -> int:
+    return _SEVERITY.index(category) if category in _SEVERITY else -1
+
+
+class EventDensityStrip:
+    """Canvas strip rendering an event histogram; packs itself with ``fill="x"``.
+
+    Args:
+        parent: Container widget.
+        on_jump: Called with the epoch of the clicked bar's first bin.
+        height: Strip height in pixels.
+    """
+
+    def __init__(self, parent: tk.Widget, on_jump: Callable[[float], None], height: int = 36) -> None:
+        self.frame = ttk.Frame(parent)
+        self.frame.pack(fill="x", pady=(0, 6))
+        self.canvas = tk.Canvas(self.frame, height=height, highlightthickness=0, background="white")
+        self.canvas.pack(side="left", fill="x", expand=True)
+        self._hover_label = ttk.Label(self.frame, text="", width=24, anchor="e")
+        self._hover_label.pack(side="right", padx=(6, 0))
+
+        self._on_jump = on_jump
+        self._histogram: Optional[EventHistogram] = None
+        self._group = 1  # bins per bar
+        self._bar_width = 1.0
+        self._bar_totals: List[int] = []
+
+        self.canvas.bind("<Configure>", lambda _e: self.redraw(), add="+")
+        self.canvas.bind("<Button-1>", self._on_click, add="+")
+        self.canvas.bind("<Motion>", self._on_motion, add="+")
+        self.canvas.bind("<Leave>", lambda _e: self._hover_label.config(text=""), add="+")
+
+    def set_histogram(self, histogram: Optional[EventHistogram]) -> None:
+        self._histogram = histogram
+        self.redraw()
+
+    def redraw(self) -> None:
+        canvas = self.canvas
+        canvas.delete("all")
+        histogram = self._histogram
+        bins = len(histogram) if histogram is not None else 0
+        width, height = canvas.winfo_width(), canvas.winfo_height()
+        if histogram is None or not bins or width <= 1:
+            self._bar_totals = []
+            return
+
+        group = self._group = max(1, math.ceil(bins / width))
+        starts = range(0, bins, group)
+        self._bar_width = width / len(starts)
+        stacks = [
+            (category, [sum(counts[i : i + group]) for i in starts])
+            for category, counts in sorted(
+                zip(histogram.categories, histogram.counts), key=lambda item: _severity(item[0])
+            )
+        ]
+        totals = self._bar_totals = [sum(column) for column in zip(*(bars for _, bars in stacks))]
+        peak = max(totals, default=0)
+        if not peak:
+            return
+
+        scale = (height - 2) / peak
+        base = [float(height)] * len(totals)
+        for category, bars in stacks:
+            colour = CRITICALITY_COLOURS.get(category, DEFAULT_COLOUR)
+            for i, count in enumerate(bars):
+                if count:
+                    top = base[i] - max(1.0, count * scale)
+                    x0 = i * self._bar_width
+                    canvas.create_rectangle(x0, top, x0 + max(1.0, self._bar_width - 1), base[i], fill=colour, width=0)
+                    base[i] = top
+
+    def _bar_at(self, x: int) -> Optional[int]:
+        if not self._bar_totals:
+            return None
+        bar = int(x / self._bar_width)
+        return bar if 0 <= bar < len(self._bar_totals) else None
+
+    def _on_click(self, event: tk.Event) -> None:  # type: ignore[type-arg]
+        bar = self._bar_at(event.x)
+        if bar is not None and self._histogram is not None:
+            self._on_jump(self._histogram.bin_start(bar * self._group))
+
+    def _on_motion(self, event: tk.Event) -> None:  # type: ignore[type-arg]
+        bar = self._bar_at(event.x)
+        if bar is None or self._histogram is None:
+            self._hover_label.config(text="")
+            return
+        start = epoch_to_datetime(self._histogram.bin_start(bar * self._group))
+        self._hover_label.config(text=f"{start:%H:%M} · {self._bar_totals[bar]} events")
@@ -2,9 +2,10 @@
 
 This module provides :class:`EventLogViewer`, a self-contained widget that
 can be embedded in either a :class:`tk.Toplevel` window or a
-:class:`ttk.Notebook` tab.  All data loading and timestamp parsing utilities
-are exposed as module-level functions so they can be imported independently
-(e.g. by :mod:`file_explorer_tab` for MCAP/video look-ups).
+:class:`ttk.Notebook` tab.  Event logs are parsed by
+:func:`~src.logic.event_loader.load_event_store`; :func:`parse_timestamp` is
+exposed at module level so it can be imported independently (e.g. by
+:mod:`file_explorer_tab` for MCAP/video look-ups).
 
 Typical usage::
 
@@ -17,10 +18,10 @@ Typical usage::
         on_close=on_close_cb,
         is_tab=True,
         log_message=self.log_message,
-        play_video_cb=lambda ts: self.play_video_at_timestamp(fp, ts, viewer_id=vid),
-        play_bazel_cb=lambda ts: self.play_bazel_at_timestamp(fp, ts, viewer_id=vid),
-        play_bazel_start_cb=lambda ts: self.play_bazel_from_start(fp, ts, viewer_id=vid),
-        navigate_mcap_cb=lambda ts: self.navigate_to_mcap_from_timestamp(fp, ts),
+        play_video_cb=lambda ref: self.play_video_at_timestamp(fp, ref.timestamp, viewer_id=vid),
+        play_bazel_cb=lambda ref: self.play_bazel_at_timestamp(fp, ref.timestamp, viewer_id=vid),
+        play_bazel_start_cb=lambda ref: self.play_bazel_from_start(fp, ref.timestamp, viewer_id=vid),
+        navigate_mcap_cb=lambda ref: self.navigate_to_mcap_from_timestamp(fp, ref.timestamp),
     )
     viewer.build_ui()
 """
@@ -29,49 +30,26 @@ from __future__ import annotations
 
 import os
 import threading
+import time
 import tkinter as tk
-from datetime import date, datetime
-from tkinter import ttk
-from typing import Callable, List, Optional, Tuple
-
+from bisect import bisect_left
+from datetime import datetime
+from tkinter import filedialog, ttk
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from ...logic.event_export import EXPORT_FORMATS, ExportCancelled, export_events
+from ...logic.event_loader import load_event_store
+from ...logic.event_query import QuerySyntaxError, is_structured_query
+from ...logic.event_store import EVENT_COLUMN_HEADINGS, EventRef, EventStore
+from ...logic.media_index import MediaIndex
 from ...utils.logger import get_logger
+from ...utils.timestamp_parser import TIMESTAMP_PARSER, epoch_to_datetime, normalize_timestamp_str
+from .event_density_strip import EventDensityStrip
 from .tooltip import attach_tooltip
+from .virtual_event_table import VirtualEventTable
 
 logger = get_logger(__name__)
-
-#: Timestamp format strings tried in order during parsing.
-TIMESTAMP_FORMATS: List[str] = [
-    "%Y-%m-%d %H:%M:%S",  # 2025-09-19 10:50:50
-    "%Y-%m-%d-%H-%M-%S",  # 2025-12-16-08-55-17  (MCAP filename format)
-    "%Y%m%d_%H%M%S",  # 20250919_093523
-    "%Y-%m-%d_%H-%M-%S",  # 2025-09-19_09-35-23
-    "%Y%m%d%H%M%S",  # 20250919093523
-    "%H:%M:%S",  # 09:35:23  (time-only — assumes today's date)
-    "%Y-%m-%d %H:%M:%S.%f",  # 2025-09-19 09:35:23.123456
-    "%Y%m%d%H%M%S%f",  # 20250919093523123456  (with microseconds)
-]
-
-
-def normalize_timestamp_str(timestamp_str: str) -> str:
-    """Pre-process a raw timestamp string before format-matching.
-
-    Handles MCAP filename prefixes (``PSA8411_2025-12-16-08-55-17_0`` → middle
-    part extracted) and trailing millisecond tokens (``2025-09-19 10:50:50 430``).
-    """
-    # Handle MCAP filename format: PREFIX_TIMESTAMP_SUFFIX
-    if "_" in timestamp_str and timestamp_str.count("_") >= 2:
-        parts = timestamp_str.split("_")
-        if len(parts) >= 3:
-            potential_ts = parts[1]
-            if "-" in potential_ts and len(potential_ts) >= 10:
-                return potential_ts
-
-    # Handle "2025-09-19 10:50:50 430" (trailing millisecond token)
-    tokens = timestamp_str.split()
-    if len(tokens) == 3:
-        return f"{tokens[0]} {tokens[1]}"
-
-    return timestamp_str
+_TIME_BOUND_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
 def parse_timestamp(
@@ -80,8 +58,9 @@ def parse_timestamp(
 ) -> Optional[datetime]:
     """Parse *timestamp_str* → :class:`~datetime.datetime`, or ``None`` on failure.
 
-    Tries :data:`TIMESTAMP_FORMATS` after normalising with
-    :func:`normalize_timestamp_str`. Errors are forwarded to *log_fn* when supplied.
+    Tries :data:`~src.utils.timestamp_parser.TIMESTAMP_FORMATS` after normalising with
+    :func:`normalize_timestamp_str`, using the compiled parser in
+    :mod:`src.utils.timestamp_parser`. Errors are forwarded to *log_fn* when supplied.
     """
     try:
         if not isinstance(timestamp_str, str):
@@ -89,15 +68,9 @@ def parse_timestamp(
 
         timestamp_str = normalize_timestamp_str(timestamp_str.strip())
 
-        for fmt in TIMESTAMP_FORMATS:
-            try:
-                if fmt == "%H:%M:%S":
-                    # Time-only: combine with today's date
-                    time_part = datetime.strptime(timestamp_str, fmt).time()
-                    return datetime.combine(date.today(), time_part)
-                return datetime.strptime(timestamp_str, fmt)
-            except ValueError:
-                continue
+        parsed = TIMESTAMP_PARSER.parse(timestamp_str)
+        if parsed is not None:
+            return parsed
 
         msg = f"Unknown timestamp format: '{timestamp_str}' (length: {len(timestamp_str)})"
         if log_fn:
@@ -113,161 +86,35 @@ def parse_timestamp(
         return None
 
 
-# Event log data loading — module-level utility functions
-def preprocess_event_log_lines(raw_lines: List[str]) -> List[str]:
-    """Strip blank lines and the header row; return lines ready for parsing."""
-    result: List[str] = []
-    for line in raw_lines:
-        stripped = line.rstrip("\n")
-        if not stripped.strip():
-            continue
-        if stripped.lstrip().startswith("current_time"):
-            continue  # Skip the column-header row
-        result.append(stripped)
-    return result
-
-
-def parse_event_rows(
-    data_lines: List[str],
-    tree: ttk.Treeview,
-) -> List[Tuple[str, ...]]:
-    """Parse tab-delimited event rows (with multi-line continuation) into *tree*."""
-    all_events: List[Tuple[str, ...]] = []
-    current_parts: Optional[List[str]] = None
-    batch_count = 0
-    BATCH_SIZE = 100
-
-    for line in data_lines:
-        try:
-            parts = [p.strip() for p in line.split("\t")]
-
-            if current_parts is None:
-                if len(parts) >= 5:
-                    all_events.append(tuple(parts[:5]))
-                    tree.insert("", "end", values=parts[:5])
-                    batch_count += 1
-                elif parts and (line.startswith("\t") or parts[0] == ""):
-                    pass  # Orphaned continuation line — skip silently
-                else:
-                    current_parts = parts
-            else:
-                # Continuation line
-                if line.startswith("\t") or (parts and parts[0] == ""):
-                    if parts and parts[0] == "":
-                        parts = parts[1:]
-                    current_parts.extend(parts)
-                else:
-                    # Treat as continuation of the description column
-                    if len(current_parts) >= 3 and parts:
-                        current_parts[2] = (current_parts[2] + " " + parts[0]).strip()
-                        if len(parts) > 1:
-                            current_parts.extend(parts[1:])
-                    else:
-                        current_parts.extend(parts)
-
-                if len(current_parts) >= 5:
-                    all_events.append(tuple(current_parts[:5]))
-                    tree.insert("", "end", values=current_parts[:5])
-                    current_parts = None
-                    batch_count += 1
-
-            if batch_count >= BATCH_SIZE:
-                tree.update_idletasks()
-                batch_count = 0
-
-        except Exception:  # nosec B110
-            pass  # Silent skip — avoids log spam for individual malformed lines
-
-    return all_events
-
-
-def _parse_event_file(file_path: str) -> List[Tuple[str, ...]]:
-    """Parse *file_path* into event rows without touching any Tkinter widget.
-
-    Safe to call from a background thread.  Returns a list of 5-element tuples.
-    """
-    all_events: List[Tuple[str, ...]] = []
-    current_parts: Optional[List[str]] = None
-
-    with open(file_path, "r", encoding="utf-8") as fh:
-        raw_lines = fh.readlines()
-
-    for line in preprocess_event_log_lines(raw_lines):
-        try:
-            parts = [p.strip() for p in line.split("\t")]
-            if current_parts is None:
-                if len(parts) >= 5:
-                    all_events.append(tuple(parts[:5]))
-                elif parts and (line.startswith("\t") or parts[0] == ""):
-                    pass
-                else:
-                    current_parts = parts
-            else:
-                if line.startswith("\t") or (parts and parts[0] == ""):
-                    if parts and parts[0] == "":
-                        parts = parts[1:]
-                    current_parts.extend(parts)
-                else:
-                    if len(current_parts) >= 3 and parts:
-                        current_parts[2] = (current_parts[2] + " " + parts[0]).strip()
-                        if len(parts) > 1:
-                            current_parts.extend(parts[1:])
-                    else:
-                        current_parts.extend(parts)
-
-                if len(current_parts) >= 5:
-                    all_events.append(tuple(current_parts[:5]))
-                    current_parts = None
-        except Exception:  # nosec B110
-            pass
-
-    return all_events
-
-
-def load_events(
-    file_path: str,
-    tree: ttk.Treeview,
-    log_fn: Optional[Callable[..., None]] = None,
-) -> List[Tuple[str, ...]]:
-    """Parse and load *file_path* into *tree*. Large files (>10 MB) emit a warning."""
-    all_events: List[Tuple[str, ...]] = []
-
-    # Warn for large files
-    try:
-        file_size = os.path.getsize(file_path)
-        if file_size > 10 * 1024 * 1024:  # 10 MB
-            if log_fn:
-                log_fn(
-                    f"⚠️ Large event log file ({file_size // (1024 * 1024)} MB) — loading may take a moment...",
-                    is_error=False,
-                )
-    except Exception:  # nosec B110
-        pass
-
-    try:
-        with open(file_path, "r", encoding="utf-8") as fh:
-            raw_lines = fh.readlines()
-
-        data_lines = preprocess_event_log_lines(raw_lines)
-        all_events = parse_event_rows(data_lines, tree)
-        logger.debug("Loaded %d events from %s", len(all_events), file_path)
-
-    except Exception as exc:
-        if log_fn:
-            log_fn(f"Error reading event log file: {exc}", is_error=True)
-        logger.exception("Error reading event log file: %s", file_path)
-
-    return all_events
-
-
 # EventLogViewer — self-contained viewer widget
 class EventLogViewer:
     """Self-contained event log viewer embeddable in a window or notebook tab.
 
-    All state (treeview, search var, events list) is owned by this instance.
-    Interaction with the application is via callbacks passed at construction.
+    All state (event table, search var, event store) is owned by this instance.
+    Rows live in an :class:`~src.logic.event_store.EventStore`; the
+    :class:`~.virtual_event_table.VirtualEventTable` only materialises the rows
+    in its viewport, so logs with millions of events stay responsive.
+    Interaction with the application is via callbacks passed at construction;
+    row actions receive an :class:`~src.logic.event_store.EventRef` carrying the
+    event's precomputed epoch once the background time index is ready.
+    *load_store* replaces the default single-file loader (e.g. with a merged
+    timeline), and *show_source* adds the trailing source column.  With
+    *media_index_for*, every row's video and rosbag are resolved in the
+    background after loading: row actions then launch without a lookup, rows
+    with no recording are greyed out and unavailable actions are disabled.
     """
 
+    #: ``(column_id, width, minwidth)`` for each displayed column.
+    COLUMN_LAYOUT: Tuple[Tuple[str, int, int], ...] = (
+        ("current_time", 180, 150),
+        ("timestamp", 120, 100),
+        ("txt_manual", 300, 200),
+        ("txt_criticality", 150, 100),
+        ("ui_mode", 100, 80),
+    )
+    #: Extra trailing column shown for merged timelines (``show_source=True``).
+    SOURCE_COLUMN_LAYOUT: Tuple[str, int, int] = ("source", 200, 120)
+
     def __init__(
         self,
         parent: tk.Widget,
@@ -277,10 +124,13 @@ class EventLogViewer:
         is_tab: bool = False,
         *,
         log_message: Callable[..., None],
-        play_video_cb: Optional[Callable[[str], None]] = None,
-        play_bazel_cb: Optional[Callable[[str], None]] = None,
-        play_bazel_start_cb: Optional[Callable[[str], None]] = None,
-        navigate_mcap_cb: Optional[Callable[[str], None]] = None,
+        play_video_cb: Optional[Callable[[EventRef], None]] = None,
+        play_bazel_cb: Optional[Callable[[EventRef], None]] = None,
+        play_bazel_start_cb: Optional[Callable[[EventRef], None]] = None,
+        navigate_mcap_cb: Optional[Callable[[EventRef], None]] = None,
+        load_store: Optional[Callable[[], EventStore]] = None,
+        show_source: bool = False,
+        media_index_for: Optional[Callable[[str], MediaIndex]] = None,
     ) -> None:
         self.parent = parent
         self.file_path = file_path
@@ -292,12 +142,24 @@ class EventLogViewer:
         self._play_bazel_cb = play_bazel_cb
         self._play_bazel_start_cb = play_bazel_start_cb
         self._navigate_mcap_cb = navigate_mcap_cb
+        # Builds the store off the UI thread; defaults to parsing *file_path*.
+        self._load_store = load_store or (lambda: load_event_store(file_path))
+        self._show_source = show_source
+        self._media_index_for = media_index_for
 
         # Populated by build_ui()
-        self._tree: Optional[ttk.Treeview] = None
+        self._table: Optional[VirtualEventTable] = None
         self._search_var: Optional[tk.StringVar] = None
-        self._all_events: List[Tuple[str, ...]] = []
+        self._time_widgets: Dict[str, tk.Widget] = {}
+        self._time_range: Optional[Tuple[Optional[float], Optional[float]]] = None
+        self._store = EventStore([], file_path)
         self._last_logged_selection_key: Optional[str] = None
+        self._update_button_states: Callable[[], None] = lambda: None
+        self._export_button: Optional[ttk.Button] = None
+        self._export_cancel: Optional[threading.Event] = None
+        self._sort: Optional[Tuple[str, bool]] = None  # (column_id, descending)
+        self._sort_pending: Set[Tuple[int, str, bool]] = set()
+        self._density: Optional[EventDensityStrip] = None
 
     # Public API
     def build_ui(self) -> None:
@@ -313,19 +175,21 @@ class EventLogViewer:
 
         _sf, search_var, search_entry, filter_result_label = self._create_search_frame(main_frame)
         self._search_var = search_var
+        self._create_time_filter_frame(main_frame)
+        self._density = EventDensityStrip(main_frame, on_jump=self._jump_to_time)
 
-        tree = self._create_event_tree(main_frame)
-        self._tree = tree
+        table = self._create_event_table(main_frame)
+        self._table = table
 
-        loading_id = tree.insert("", "end", values=("⏳ Loading events…", "", "", "", ""))
+        table.set_placeholder(("⏳ Loading events…",) + ("",) * (len(table.tree["columns"]) - 1))
 
-        _bf, buttons, functions, status_label = self._create_action_buttons(main_frame, tree)
+        _bf, buttons, functions, status_label = self._create_action_buttons(main_frame, table)
 
-        self._setup_event_handlers(tree, buttons)
-        update_status = self._setup_filtering(tree, search_var, filter_result_label, status_label)
+        self._setup_event_handlers(table, buttons, functions)
+        update_status = self._setup_filtering(table, search_var, filter_result_label, status_label)
 
-        self._bind_keyboard_shortcuts(main_frame, search_entry, tree, functions)
-        self.parent.after_idle(tree.focus_set)
+        self._bind_keyboard_shortcuts(main_frame, search_entry, table, functions)
+        self.parent.after_idle(table.focus_set)
 
         try:
             file_size = os.path.getsize(self.file_path)
@@ -339,27 +203,18 @@ class EventLogViewer:
 
         file_path = self.file_path
 
-        def _apply(events: List[Tuple[str, ...]]) -> None:
-            try:
-                tree.delete(loading_id)
-            except Exception:  # nosec B110
-                pass
-            for row in events:
-                tree.insert("", "end", values=row)
-            self._all_events.extend(events)
-            if events and not tree.selection():
-                first_item = tree.get_children()[0]
-                tree.selection_set(first_item)
-                tree.focus(first_item)
-                tree.see(first_item)
-                tree.event_generate("<<TreeviewSelect>>")
-            tree.focus_set()
-            logger.debug("Loaded %d events from %s", len(events), file_path)
+        def _apply(store: EventStore) -> None:
+            self._store = store
+            self._refilter()
+            if len(table) and table.selected_index() is None:
+                table.select_position(0)
+            table.focus_set()
+            logger.debug("Loaded %d events from %s", len(store), file_path)
             update_status()
 
         def _load() -> None:
             try:
-                events = _parse_event_file(file_path)
+                store = self._load_store()
             except Exception as exc:
                 logger.exception("Error reading event log file: %s", file_path)
                 if self._log_message:
@@ -368,16 +223,162 @@ class EventLogViewer:
                         lambda e=exc: self._log_message(f"Error reading event log file: {e}", is_error=True),
                     )
                 return
-            self.parent.after(0, lambda: _apply(events))
+            self.parent.after(0, lambda: _apply(store))
+
+            # Parse every timestamp once so row actions and the time filter never reparse.
+            store.build_time_index()
+            self.parent.after(0, lambda: self._on_time_index_ready(store))
+
+            # Resolve each row's video/bag now so clicks launch without a directory scan.
+            if self._media_index_for is not None:
+                try:
+                    store.build_media_targets(self._media_index_for)
+                except Exception:
+                    logger.exception("Error resolving media targets for %s", file_path)
+                else:
+                    self.parent.after(0, lambda: self._on_media_targets_ready(store))
+
+            # Index after the rows are on screen so the first paint is not delayed.
+            index = store.build_search_index()
+            self.parent.after(0, lambda: self._on_search_index_ready(store, index.vocabulary_size))
+
+            # Columns for structured queries; built lazily on the first query otherwise.
+            store.build_column_store()
+
+            # Per-minute density for the overview strip (reuses the time index and columns).
+            store.build_histogram()
+            self.parent.after(0, lambda: self._on_histogram_ready(store))
 
         threading.Thread(target=_load, daemon=True).start()
 
+    def _on_time_index_ready(self, store: EventStore) -> None:
+        time_index = store.time_index
+        if store is not self._store or time_index is None:
+            return
+        logger.debug(
+            "Time index ready for %s (%d rows, %s)",
+            self.file_path,
+            len(time_index),
+            "in time order" if time_index.is_monotonic else "sorted by permutation",
+        )
+        for widget in self._time_widgets.values():
+            widget.config(state="normal")
+        if self._time_range is not None:
+            self._refilter()
+
+    def _on_media_targets_ready(self, store: EventStore) -> None:
+        if store is not self._store or self._table is None:
+            return
+        self._table.tree.tag_configure("no_media", foreground="gray")
+        self._table.set_tag_getter(self._media_tags)
+        self._update_button_states()
+
+    def _media_tags(self, index: int) -> Tuple[str, ...]:
+        coverage = self._store.media_coverage(index)
+        if coverage is None or any(coverage):
+            return ()
+        return ("no_media",)
+
+    def _on_histogram_ready(self, store: EventStore) -> None:
+        if store is self._store and self._density is not None:
+            self._density.set_histogram(store.histogram)
+
+    def _jump_to_time(self, epoch: float) -> None:
+        """Select the first shown event at or after *epoch* (density strip click)."""
+        table, time_index = self._table, self._store.time_index
+        if table is None or time_index is None or not len(table):
+            return
+        row = time_index.first_row_at_or_after(epoch)
+        if row is None:
+            table.select_position(len(table) - 1)
+        elif self._sort is None and time_index.is_monotonic:
+            # Row order is time order: the nearest shown row follows by bisection.
+            table.select_position(min(bisect_left(table.view, row), len(table) - 1))
+        else:
+            self._select_row(row)
+        table.focus_set()
+
+    def _on_search_index_ready(self, store: EventStore, vocabulary_size: int) -> None:
+        logger.debug("Search index ready for %s (%d rows, %d tokens)", self.file_path, len(store), vocabulary_size)
+        # Re-run a query typed while the index was still building.
+        if store is self._store and self._search_var is not None and self._search_var.get().strip():
+            self._refilter()
+
+    def _refilter(self) -> None:
+        if self._search_var is not None:
+            self._search_var.set(self._search_var.get())
+
+    @property
+    def store(self) -> EventStore:
+        return self._store
+
     def load_events_list(self) -> List[Tuple[str, ...]]:
         """Return the full list of parsed events (empty before :meth:`build_ui`)."""
-        return list(self._all_events)
+        return list(self._store.rows)
+
+    def focus_events(self) -> None:
+        """Focus the event table, selecting the first row if nothing is selected."""
+        if self._table is not None:
+            self._table.ensure_selection()
+            self._table.focus_set()
+
+    def export_events(self) -> None:
+        """Ask for a file and export the rows currently shown, or cancel a running export.
+
+        The current filter result is snapshotted and streamed to disk by
+        :func:`~src.logic.event_export.export_events` in a background thread;
+        the format follows the chosen file extension.
+        """
+        if self._export_cancel is not None:
+            self._export_cancel.set()
+            return
+        if self._table is None or self._export_button is None:
+            return
+        store, rows = self._store, self._table.view
+        if not rows:
+            self._log_message("No events to export", is_error=True)
+            return
+        stem = os.path.splitext(os.path.basename(self.file_path))[0] or "events"
+        path = filedialog.asksaveasfilename(
+            parent=self.parent,
+            title="Export events",
+            initialfile=f"{stem}_events.csv",
+            defaultextension=".csv",
+            filetypes=[(name, f"*{ext}") for ext, name in EXPORT_FORMATS.items()],
+        )
+        if not path:
+            return
+
+        button = self._export_button
+        cancel = self._export_cancel = threading.Event()
+        button.config(text="Cancel export")
+
+        def progress(done: int, total: int) -> None:
+            self.parent.after(0, lambda: button.config(text=f"Cancel export ({done * 100 // total}%)"))
+
+        def finish(message: str, is_error: bool) -> None:
+            self._export_cancel = None
+            button.config(text="Export…")
+            self._log_message(message, is_error=is_error)
+
+        def run() -> None:
+            started = time.perf_counter()
+            try:
+                count = export_events(store, rows, path, progress=progress, should_cancel=cancel.is_set)
+            except ExportCancelled as exc:
+                result = (f"{exc}: {path}", True)
+            except Exception as exc:
+                logger.exception("Error exporting events to %s", path)
+                result = (f"Error exporting events: {exc}", True)
+            else:
+                result = (f"Exported {count} events to {path} in {time.perf_counter() - started:.1f}s", False)
+            self.parent.after(0, lambda: finish(*result))
+
+        self._log_message(f"Exporting {len(rows)} events to {path}...")
+        threading.Thread(target=run, daemon=True).start()
 
     def filter_events(self, search_text: str) -> None:
-        """Programmatically filter the treeview by *search_text* (case-insensitive)."""
+        """Programmatically filter the event table by *search_text* (case-insensitive)."""
         if self._search_var is not None:
             self._search_var.set(search_text)
 
@@ -393,6 +394,11 @@ class EventLogViewer:
         search_var = tk.StringVar()
         search_entry = ttk.Entry(search_frame, textvariable=search_var, width=40)
         search_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
+        attach_tooltip(
+            search_entry,
+            "Text search, or a query such as: crit = HIGH and mode = AUTO and desc contains brake "
+            "between 10:00 and 10:30 (fields: time, ts, desc, crit, mode, source; ops: = != < > <= >= ~ contains).",
+        )
 
         search_entry.bind("<Control-a>", self._select_all_text)
         search_entry.bind("<Control-A>", self._select_all_text)
@@ -411,76 +417,240 @@ class EventLogViewer:
 
         return search_frame, search_var, search_entry, filter_result_label
 
-    def _create_event_tree(self, parent: tk.Widget) -> ttk.Treeview:
-        tree_container = ttk.Frame(parent)
-        tree_container.pack(fill="both", expand=True)
+    def _create_time_filter_frame(self, parent: tk.Widget) -> ttk.Frame:
+        time_frame = ttk.Frame(parent)
+        time_frame.pack(fill="x", pady=(0, 10))
+
+        ttk.Label(time_frame, text="Time range:").pack(side="left", padx=(0, 5))
+
+        from_var = tk.StringVar()
+        to_var = tk.StringVar()
+        window_var = tk.StringVar(value="5")
+
+        from_entry = ttk.Entry(time_frame, textvariable=from_var, width=20)
+        from_entry.pack(side="left")
+        ttk.Label(time_frame, text="to").pack(side="left", padx=5)
+        to_entry = ttk.Entry(time_frame, textvariable=to_var, width=20)
+        to_entry.pack(side="left", padx=(0, 5))
+        attach_tooltip(from_entry, "Start time (YYYY-MM-DD HH:MM:SS, or HH:MM[:SS] on the log's first day).")
+        attach_tooltip(to_entry, "End time (YYYY-MM-DD HH:MM:SS, or HH:MM[:SS] on the log's first day).")
+
+        def apply_range(*_args: object) -> None:
+            try:
+                start = self._parse_time_bound(from_var.get())
+                end = self._parse_time_bound(to_var.get())
+            except ValueError as exc:
+                self._log_message(str(exc), is_error=True)
+                return
+            self._set_time_range(None if start is None and end is None else (start, end))
+
+        def around_selected() -> None:
+            table = self._table
+            index = table.selected_index() if table is not None else None
+            if index is None:
+                self._log_message("Select an event to filter around it", is_error=True)
+                return
+            epoch = self._store.event_ref(index).epoch
+            if epoch is None:
+                self._log_message("Selected event has no parseable timestamp", is_error=True)
+                return
+            try:
+                minutes = float(window_var.get())
+            except ValueError:
+                self._log_message(f"Invalid minute window: {window_var.get()!r}", is_error=True)
+                return
+            start, end = epoch - minutes * 60, epoch + minutes * 60
+            from_var.set(epoch_to_datetime(start).strftime(_TIME_BOUND_FORMAT))
+            to_var.set(epoch_to_datetime(end).strftime(_TIME_BOUND_FORMAT))
+            self._set_time_range((start, end), keep_row=index)
+
+        def clear_range() -> None:
+            from_var.set("")
+            to_var.set("")
+            self._set_time_range(None)
+
+        apply_btn = ttk.Button(time_frame, text="Apply", command=apply_range, style="Action.TButton")
+        apply_btn.pack(side="left", padx=(0, 10))
+        attach_tooltip(apply_btn, "Show only events between the two times (either side may be left empty).")
+
+        ttk.Label(time_frame, text="±").pack(side="left")
+        window_spin = ttk.Spinbox(time_frame, from_=1, to=1440, textvariable=window_var, width=5)
+        window_spin.pack(side="left")
+        ttk.Label(time_frame, text="min").pack(side="left", padx=(2, 5))
+
+        around_btn = ttk.Button(time_frame, text="Around Selected", command=around_selected, style="Action.TButton")
+        around_btn.pack(side="left", padx=(0, 5))
+        attach_tooltip(around_btn, "Show only events within ± the given minutes of the selected event.")
+
+        clear_btn = ttk.Button(time_frame, text="Clear", command=clear_range, style="Action.TButton")
+        clear_btn.pack(side="left")
+        attach_tooltip(clear_btn, "Remove the time-range restriction.")
+
+        for entry in (from_entry, to_entry):
+            entry.bind("<Return>", apply_range)
+            entry.bind("<Control-a>", self._select_all_text)
+            entry.bind("<Control-A>", self._select_all_text)
+
+        # Enabled by _on_time_index_ready() once timestamps have been parsed.
+        self._time_widgets = {
+            "from": from_entry,
+            "to": to_entry,
+            "apply": apply_btn,
+            "window": window_spin,
+            "around": around_btn,
+            "clear": clear_btn,
+        }
+        for widget in self._time_widgets.values():
+            widget.config(state="disabled")
 
-        columns = ("current_time", "timestamp", "txt_manual", "txt_criticality", "ui_mode")
-        tree = ttk.Treeview(tree_container, columns=columns, show="headings", height=14)
+        return time_frame
 
-        tree.heading("current_time", text="Current Time")
-        tree.heading("timestamp", text="Timestamp")
-        tree.heading("txt_manual", text="Event Description")
-        tree.heading("txt_criticality", text="Criticality")
-        tree.heading("ui_mode", text="UI Mode")
+    def _parse_time_bound(self, text: str) -> Optional[float]:
+        """Epoch for a time-range field; blank means open-ended.  Raises ``ValueError`` if unparseable."""
+        text = text.strip()
+        if not text:
+            return None
+        time_index = self._store.time_index
+        if time_index is None:
+            raise ValueError("Timestamps are still being indexed")
+        return time_index.resolve_time(text)
 
-        tree.column("current_time", width=180, minwidth=150)
-        tree.column("timestamp", width=120, minwidth=100)
-        tree.column("txt_manual", width=300, minwidth=200)
-        tree.column("txt_criticality", width=150, minwidth=100)
-        tree.column("ui_mode", width=100, minwidth=80)
+    def _set_time_range(
+        self,
+        time_range: Optional[Tuple[Optional[float], Optional[float]]],
+        keep_row: Optional[int] = None,
+    ) -> None:
+        """Restrict the table to *time_range* (``None`` clears it), reselecting *keep_row* if still visible."""
+        self._time_range = time_range
+        self._refilter()
+        table = self._table
+        if table is None or keep_row is None:
+            return
+        self._select_row(keep_row)
+
+    def _select_row(self, row: int) -> None:
+        """Select store row *row* if it is in the current view."""
+        table = self._table
+        if table is None:
+            return
+        view = table.view
+        if self._sort is None:
+            pos = bisect_left(view, row)
+            if pos < len(view) and view[pos] == row:
+                table.select_position(pos)
+            return
+        try:
+            table.select_position(view.index(row))
+        except ValueError:
+            pass
 
-        v_scroll = ttk.Scrollbar(tree_container, orient="vertical", command=tree.yview)
-        h_scroll = ttk.Scrollbar(tree_container, orient="horizontal", command=tree.xview)
-        tree.configure(yscrollcommand=v_scroll.set, xscrollcommand=h_scroll.set)
+    def _create_event_table(self, parent: tk.Widget) -> VirtualEventTable:
+        columns = [
+            (column_id, EVENT_COLUMN_HEADINGS[column_id], width, minwidth)
+            for column_id, width, minwidth in self.COLUMN_LAYOUT
+        ]
+        if self._show_source:
+            column_id, width, minwidth = self.SOURCE_COLUMN_LAYOUT
+            columns.append((column_id, EVENT_COLUMN_HEADINGS[column_id], width, minwidth))
+        table = VirtualEventTable(parent, columns, height=14)
+        for column_id, *_rest in columns:
+            table.tree.heading(column_id, command=lambda c=column_id: self._toggle_sort(c))
+        return table
+
+    # Column sorting
+    def _toggle_sort(self, column_id: str) -> None:
+        """Cycle *column_id* through ascending → descending → log order, keeping the selected row."""
+        if self._sort is None or self._sort[0] != column_id:
+            self._sort = (column_id, False)
+        elif not self._sort[1]:
+            self._sort = (column_id, True)
+        else:
+            self._sort = None
+        table = self._table
+        if table is None:
+            return
+        for column in table.tree["columns"]:
+            arrow = ""
+            if self._sort is not None and self._sort[0] == column:
+                arrow = " ▼" if self._sort[1] else " ▲"
+            table.tree.heading(column, text=EVENT_COLUMN_HEADINGS[column] + arrow)
+        self._refilter_keeping_selection()
+
+    def _refilter_keeping_selection(self) -> None:
+        selected = self._table.selected_index() if self._table is not None else None
+        self._refilter()
+        if selected is not None:
+            self._select_row(selected)
+
+    def _sorted(self, store: EventStore, view: Sequence[int]) -> Sequence[int]:
+        """Apply the active sort to *view*; builds a missing permutation in the background."""
+        if self._sort is None:
+            return view
+        column_id, descending = self._sort
+        order = store.cached_sort_order(column_id, descending)
+        if order is not None:
+            return order.apply(view)
+        key = (id(store), column_id, descending)
+        if key not in self._sort_pending:
+            self._sort_pending.add(key)
+
+            def build() -> None:
+                try:
+                    store.sort_order(column_id, descending)
+                except Exception:
+                    logger.exception("Error sorting %s by %s", self.file_path, column_id)
+                self.parent.after(0, lambda: (self._sort_pending.discard(key), self._on_sort_order_ready(store)))
 
-        tree.pack(side="left", fill="both", expand=True)
-        v_scroll.pack(side="right", fill="y")
-        h_scroll.pack(side="bottom", fill="x", before=tree)
+            threading.Thread(target=build, daemon=True).start()
+        return view
 
-        return tree
+    def _on_sort_order_ready(self, store: EventStore) -> None:
+        if store is self._store and self._sort is not None:
+            self._refilter_keeping_selection()
 
     def _create_action_buttons(
         self,
         parent: tk.Widget,
-        tree: ttk.Treeview,
+        table: VirtualEventTable,
     ) -> Tuple[ttk.Frame, dict, dict, ttk.Label]:
         button_frame = ttk.Frame(parent)
         button_frame.pack(fill="x", pady=(10, 0))
 
-        def _selected_ts() -> Optional[str]:
-            sel = tree.selection()
-            if sel:
-                vals = tree.item(sel[0])["values"]
-                if vals:
-                    return str(vals[0])
-            return None
+        def _selected_ref() -> Optional[EventRef]:
+            index = table.selected_index()
+            if index is None:
+                return None
+            return self._store.event_ref(index)
 
         def play_video() -> None:
-            if hasattr(tree, "play_video_func"):
-                tree.play_video_func()  # type: ignore[attr-defined]
+            ref = _selected_ref()
+            if ref and self._play_video_cb:
+                try:
+                    self._play_video_cb(ref)
+                except Exception as exc:
+                    self._log_message(f"Error playing video: {exc}", is_error=True)
 
         def play_bazel() -> None:
-            ts = _selected_ts()
-            if ts and self._play_bazel_cb:
+            ref = _selected_ref()
+            if ref and self._play_bazel_cb:
                 try:
-                    self._play_bazel_cb(ts)
+                    self._play_bazel_cb(ref)
                 except Exception as exc:
                     self._log_message(f"Error playing bazel: {exc}", is_error=True)
 
         def play_bazel_from_start() -> None:
-            ts = _selected_ts()
-            if ts and self._play_bazel_start_cb:
+            ref = _selected_ref()
+            if ref and self._play_bazel_start_cb:
                 try:
-                    self._play_bazel_start_cb(ts)
+                    self._play_bazel_start_cb(ref)
                 except Exception as exc:
                     self._log_message(f"Error playing bazel from start: {exc}", is_error=True)
 
         def show_mcap_in_explorer() -> None:
-            ts = _selected_ts()
-            if ts and self._navigate_mcap_cb:
+            ref = _selected_ref()
+            if ref and self._navigate_mcap_cb:
                 try:
-                    self._navigate_mcap_cb(ts)
+                    self._navigate_mcap_cb(ref)
                 except Exception as exc:
                     self._log_message(f"Error navigating to MCAP: {exc}", is_error=True)
 
@@ -532,6 +702,11 @@ class EventLogViewer:
         close_btn.pack(side="right")
         attach_tooltip(close_btn, "Close this event viewer tab or window. (Ctrl+F4)")
 
+        btn_export = ttk.Button(button_frame, text="Export…", command=self.export_events, style="Action.TButton")
+        btn_export.pack(side="right", padx=(0, 10))
+        attach_tooltip(btn_export, "Export the events currently shown to CSV, JSON Lines or a columnar file. (Ctrl+S)")
+        self._export_button = btn_export
+
         buttons = {
             "play_video": btn_video,
             "play_bazel": btn_bazel,
@@ -548,81 +723,78 @@ class EventLogViewer:
 
     def _setup_event_handlers(
         self,
-        tree: ttk.Treeview,
+        table: VirtualEventTable,
         buttons: dict,
+        functions: dict,
     ) -> None:
 
-        def on_row_select(event: tk.Event) -> None:  # type: ignore[type-arg]
-            sel = tree.selection()
-            if sel:
-                vals = tree.item(sel[0])["values"]
-                if vals:
-                    current_time = str(vals[0])
-                    if current_time.startswith("⏳ Loading events"):
-                        return
-
-                    description = str(vals[2]) if len(vals) > 2 else ""
-                    selection_key = f"{current_time}|{description}"
-                    if selection_key != self._last_logged_selection_key:
-                        self._log_message(f"Selected event: {vals[0]} - {description}")
-                        self._last_logged_selection_key = selection_key
-
-                    if self._play_video_cb:
-                        cb = self._play_video_cb
-                        tree.play_video_func = lambda _ts=current_time: cb(_ts)  # type: ignore[attr-defined]
-
-        def on_double_click(event: tk.Event) -> None:  # type: ignore[type-arg]
-            if hasattr(tree, "play_video_func"):
-                tree.play_video_func()  # type: ignore[attr-defined]
-
-        def update_button_states(*_args: object) -> None:
-            sel = tree.selection()
-            state = "normal" if sel else "disabled"
-            for btn in buttons.values():
-                btn.config(state=state)
-            if not sel:
-                buttons["play_video"].config(state="disabled")
-
-        tree.bind("<<TreeviewSelect>>", lambda e: (on_row_select(e), update_button_states()))
-        tree.bind("<Double-1>", on_double_click)
-        tree.focus_set()
+        def on_row_select() -> None:
+            vals = table.selected_values()
+            if vals:
+                current_time = str(vals[0])
+                description = str(vals[2]) if len(vals) > 2 else ""
+                selection_key = f"{current_time}|{description}"
+                if selection_key != self._last_logged_selection_key:
+                    self._log_message(f"Selected event: {vals[0]} - {description}")
+                    self._last_logged_selection_key = selection_key
+
+        def update_button_states() -> None:
+            index = table.selected_index()
+            # Until media targets are resolved every action stays available.
+            coverage = self._store.media_coverage(index) if index is not None else None
+            for name, btn in buttons.items():
+                if index is None:
+                    available = False
+                elif coverage is None:
+                    available = True
+                else:
+                    available = coverage[0] if name == "play_video" else coverage[1]
+                btn.config(state="normal" if available else "disabled")
+
+        self._update_button_states = update_button_states
+
+        table.bind_select(lambda: (on_row_select(), update_button_states()))
+        table.tree.bind("<Double-1>", lambda _e: functions["play_video"]())
+        table.focus_set()
 
     def _setup_filtering(
         self,
-        tree: ttk.Treeview,
+        table: VirtualEventTable,
         search_var: tk.StringVar,
         filter_result_label: ttk.Label,
         status_label: ttk.Label,
     ) -> Callable[[], None]:
-        all_events = self._all_events
 
         def update_status() -> None:
-            status_label.config(text=f"Total events: {len(tree.get_children())}")
+            status_label.config(text=f"Total events: {len(table)}")
 
         def filter_events(*_args: object) -> None:
+            store = self._store
             search_text = search_var.get().lower().strip()
 
-            for item in tree.get_children():
-                tree.delete(item)
-
-            if not search_text:
-                for evt in all_events:
-                    tree.insert("", "end", values=evt)
+            query_error = None
+            if is_structured_query(search_text):
+                try:
+                    view = store.query(search_text)
+                except QuerySyntaxError as exc:
+                    query_error = str(exc)
+                    view = store.search(search_text)
+            else:
+                view = store.search(search_text)
+            time_index = store.time_index
+            if self._time_range is not None and time_index is not None:
+                view = time_index.restrict(view, *self._time_range)
+            view = self._sorted(store, view)
+            table.set_view(view, store.__getitem__)
+
+            if query_error:
+                filter_result_label.config(text=f"Query error: {query_error}", foreground="red")
+            elif not search_text and self._time_range is None:
                 filter_result_label.config(text="")
-                update_status()
-                return
-
-            filtered = 0
-            for evt in all_events:
-                if search_text in " ".join(str(c) for c in evt).lower():
-                    tree.insert("", "end", values=evt)
-                    filtered += 1
-
-            total = len(all_events)
-            if filtered == 0:
+            elif len(table) == 0:
                 filter_result_label.config(text="No matches found", foreground="red")
             else:
-                filter_result_label.config(text=f"Showing {filtered} of {total}", foreground="blue")
+                filter_result_label.config(text=f"Showing {len(table)} of {len(store)}", foreground="blue")
             update_status()
 
         search_var.trace_add("write", filter_events)
@@ -632,7 +804,7 @@ class EventLogViewer:
         self,
         parent: tk.Widget,
         search_entry: ttk.Entry,
-        tree: ttk.Treeview,
+        table: VirtualEventTable,
         functions: dict,
     ) -> None:
 
@@ -653,17 +825,8 @@ class EventLogViewer:
             search_entry.focus_set()
 
         def ensure_tree_focus_selection() -> None:
-            items = tree.get_children()
-            if not items:
-                tree.focus_set()
-                return
-
-            selected = tree.selection()
-            target_item = selected[0] if selected and selected[0] in items else items[0]
-            tree.selection_set(target_item)
-            tree.focus(target_item)
-            tree.see(target_item)
-            tree.focus_set()
+            table.ensure_selection()
+            table.focus_set()
 
         def clear_search_and_focus_tree(event: tk.Event) -> str:  # type: ignore[type-arg]
             if not is_viewer_active():
@@ -676,26 +839,9 @@ class EventLogViewer:
         def move_tree_selection_from_search(step: int) -> str:
             if not is_viewer_active():
                 return "break"
-            items = tree.get_children()
-            if not items:
-                return "break"
-
-            selected = tree.selection()
-            if not selected:
-                next_index = 0 if step > 0 else len(items) - 1
-            else:
-                current_item = selected[0]
-                try:
-                    current_index = items.index(current_item)
-                except ValueError:
-                    current_index = -1
-                next_index = max(0, min(len(items) - 1, current_index + step))
-
-            next_item = items[next_index]
-            tree.selection_set(next_item)
-            tree.focus(next_item)
-            tree.see(next_item)
-            tree.focus_set()
+            if len(table):
+                table.move_selection(step)
+                table.focus_set()
             return "break"
 
         def run_shortcut(event: tk.Event, action: Callable[[], None]):  # type: ignore[type-arg]
@@ -712,7 +858,7 @@ class EventLogViewer:
             self.on_close()
             return "break"
 
-        targets = (parent, search_entry, tree)
+        targets = (parent, search_entry, table.tree)
 
         for target in targets:
             target.bind("<Control-v>", lambda e, f=functions: run_shortcut(e, f["play_video"]), add="+")
@@ -724,6 +870,9 @@ class EventLogViewer:
             target.bind("<Control-c>", lambda e, f=functions: run_shortcut(e, f["play_bazel_from_start"]), add="+")
             target.bind("<Control-C>", lambda e, f=functions: run_shortcut(e, f["play_bazel_from_start"]), add="+")
 
+            target.bind("<Control-s>", lambda e: run_shortcut(e, self.export_events), add="+")
+            target.bind("<Control-S>", lambda e: run_shortcut(e, self.export_events), add="+")
+
             target.bind("<Control-e>", focus_search, add="+")
             target.bind("<Control-E>", focus_search, add="+")
             target.bind("/", focus_search, add="+")
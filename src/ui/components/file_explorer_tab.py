@@ -4,10 +4,16 @@ import re
 import threading
 import time
 import tkinter as tk
+from concurrent.futures import Future
 from datetime import datetime, timedelta
 from tkinter import filedialog, ttk
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
+from ...logic.event_loader import EventLogLoader
+from ...logic.event_store import EventRef, EventStore
+from ...logic.event_store_registry import EventStoreLease, EventStoreRegistry
+from ...logic.event_timeline import MergedEventStore
+from ...logic.media_index import MediaIndexCache, MediaTarget, list_mcap_files
 from ...utils.constants import DEFAULT_SETTINGS
 from ...utils.logger import get_logger
 from ...utils.utils import get_file_icon
@@ -58,9 +64,12 @@ class FileExplorerTab:
         self._next_viewer_id = 0
 
         self.event_log_viewer_tabs = {}
+        self.event_loader = EventLogLoader()  # parses multi-log folders in worker processes
+        self.event_stores = EventStoreRegistry()  # one shared store per open event log file
 
         self._mcap_cache = {}  # {rosbags_dir: (timestamp, mcap_files_list)}
         self._mcap_cache_ttl = 60  # Cache for 60 seconds
+        self.media_indexes = MediaIndexCache(ttl=self._mcap_cache_ttl)  # per-vehicle videos/bags for event rows
         self._explorer_nav_index: Optional[int] = None
 
         self._button_tooltips = {
@@ -493,57 +502,202 @@ class FileExplorerTab:
         else:
             self.log_message(msg, is_error=True)
 
-    def open_event_log_viewer(self, file_path: str) -> None:
-        """Open a custom viewer for event log files, either as window or tab based on settings."""
+    def open_event_log_viewer(
+        self, file_path: str, load_store: Optional[Callable[[], EventStore]] = None, lazy: bool = False
+    ) -> Optional[int]:
+        """Open a custom viewer for event log files, either as window or tab based on settings.
+
+        *load_store* overrides how the viewer obtains its rows (e.g. waiting on
+        a parse already running in :attr:`event_loader`); it is only used when
+        no other viewer has the file open, otherwise the viewers share one
+        store through :attr:`event_stores`.  With *lazy*, a tab is only a
+        placeholder until it is first selected.  Returns the tab's viewer id
+        (``None`` for windows or on error).
+        """
+        lease = self.event_stores.acquire(file_path, load_store)
         try:
             settings = self._get_runtime_settings()
             open_as_tab = settings.get("event_log_viewer_as_tab", False)
             self.log_message(f"Opening event log viewer (as_tab={open_as_tab})")
 
             if open_as_tab:
-                self._open_event_log_viewer_as_tab(file_path)
-            else:
-                self._open_event_log_viewer_as_window(file_path)
+                return self._open_event_log_viewer_as_tab(file_path, lazy=lazy, leases=[lease], load_store=lease.store)
+            self._open_event_log_viewer_as_window(file_path, leases=[lease], load_store=lease.store)
 
         except Exception as e:
+            lease.release()
             self.log_message(f"Error opening event log viewer: {e}", is_error=True)
+        return None
+
+    def open_merged_timeline(
+        self,
+        event_log_files: List[str],
+        loading: Optional[Dict[str, "Future[EventStore]"]] = None,
+        lazy: bool = False,
+    ) -> None:
+        """Open one viewer showing the events of all *event_log_files* interleaved by time.
+
+        The timeline shares each log's store with any other viewer of that
+        file; when *loading* holds in-flight loads of those files, logs not
+        open elsewhere reuse the stores they produce instead of parsing again.
+        With *lazy*, a tab is only a placeholder (nothing is parsed or merged)
+        until it is first selected.
+        """
+        leases: List[EventStoreLease] = []
+        try:
+            settings = self._get_runtime_settings()
+            folder = os.path.dirname(event_log_files[0])
+            for f in event_log_files:
+                leases.append(self.event_stores.acquire(f, loading[f].result if loading is not None else None))
+
+            options = {
+                "load_store": lambda: MergedEventStore([lease.store() for lease in leases], folder),
+                "leases": leases,
+                "show_source": True,
+                "title": f"Timeline - {os.path.basename(folder)[:20]}",
+            }
+            self.log_message(f"Opening merged timeline of {len(leases)} event logs")
+            if settings.get("event_log_viewer_as_tab", False):
+                self._open_event_log_viewer_as_tab(folder, lazy=lazy, **options)
+            else:
+                self._open_event_log_viewer_as_window(folder, **options)
+        except Exception as e:
+            self._release_leases(leases)
+            self.log_message(f"Error opening merged timeline: {e}", is_error=True)
 
-    def _open_event_log_viewer_as_tab(self, file_path: str) -> None:
-        """Open event log viewer as a new tab in the main notebook."""
+    def _open_event_log_viewer_as_tab(
+        self,
+        file_path: str,
+        title: Optional[str] = None,
+        lazy: bool = False,
+        leases: Sequence[EventStoreLease] = (),
+        **viewer_options,
+    ) -> int:
+        """Open event log viewer as a new tab in the main notebook and return its viewer id.
+
+        A *lazy* tab is added unselected with a placeholder; its viewer widgets
+        are built (and its load thread started) on first selection, see
+        :meth:`_materialize_viewer_tab`.  *leases* are released when the tab
+        closes.
+        """
         viewer_id = self._next_viewer_id
         self._next_viewer_id += 1
 
         tab_frame = ttk.Frame(self.notebook, padding="10")
 
-        self.event_log_viewer_tabs[viewer_id] = {"frame": tab_frame, "processes": [], "file_path": file_path}
-
         def on_close() -> None:
             self._cleanup_viewer_tab(viewer_id)
 
-        EventLogViewer(
-            parent=tab_frame,
-            file_path=file_path,
-            viewer_id=viewer_id,
-            on_close=on_close,
-            is_tab=True,
-            log_message=self.log_message,
-            play_video_cb=lambda ts: self.play_video_at_timestamp(file_path, ts, viewer_id=viewer_id),
-            play_bazel_cb=lambda ts: self.play_bazel_at_timestamp(file_path, ts, viewer_id=viewer_id),
-            play_bazel_start_cb=lambda ts: self.play_bazel_from_start(file_path, ts, viewer_id=viewer_id),
-            navigate_mcap_cb=lambda ts: self.navigate_to_mcap_from_timestamp(file_path, ts),
-        ).build_ui()
+        def build_viewer() -> EventLogViewer:
+            viewer = EventLogViewer(
+                parent=tab_frame,
+                file_path=file_path,
+                viewer_id=viewer_id,
+                on_close=on_close,
+                is_tab=True,
+                log_message=self.log_message,
+                media_index_for=self.media_indexes.for_event_log,
+                **self._event_action_callbacks(file_path, viewer_id),
+                **viewer_options,
+            )
+            viewer.build_ui()
+            return viewer
+
+        self.event_log_viewer_tabs[viewer_id] = {
+            "frame": tab_frame,
+            "processes": [],
+            "file_path": file_path,
+            "viewer": None,
+            "build": build_viewer,
+            "leases": list(leases),
+        }
 
         # Keep the Settings tab rightmost when inserting dynamic event tabs.
-        tab_title = f"Event Log - {os.path.basename(file_path)[:20]}"
+        tab_title = title or f"Event Log - {os.path.basename(file_path)[:20]}"
         settings_tab_index = self._get_settings_tab_index()
         if settings_tab_index is not None:
             self.notebook.insert(settings_tab_index, tab_frame, text=tab_title)
         else:
             self.notebook.add(tab_frame, text=tab_title)
 
+        if lazy:
+            name = title or os.path.basename(file_path)
+            placeholder = ttk.Label(tab_frame, text=f"⏳ {name} loads when this tab is opened…")
+            placeholder.pack(anchor="w")
+            self.event_log_viewer_tabs[viewer_id]["placeholder"] = placeholder
+            self.log_message(f"Added event log tab: {name} (loads on first view)")
+            return viewer_id
+
+        self._materialize_viewer_tab(viewer_id)
         self.notebook.select(tab_frame)
 
         self.log_message(f"Opened event log tab: {os.path.basename(file_path)} (double-click tab to close)")
+        return viewer_id
+
+    def _materialize_viewer_tab(self, viewer_id: int) -> Optional[EventLogViewer]:
+        """Build the viewer of a lazy tab (no-op once built); returns it, or ``None`` for unknown ids."""
+        viewer_info = self.event_log_viewer_tabs.get(viewer_id)
+        if viewer_info is None:
+            return None
+        if viewer_info.get("viewer") is None:
+            placeholder = viewer_info.pop("placeholder", None)
+            if placeholder is not None:
+                placeholder.destroy()
+            viewer_info["viewer"] = viewer_info.pop("build")()
+        return viewer_info["viewer"]
+
+    def _select_viewer_tab(self, viewer_id: int) -> None:
+        viewer = self._materialize_viewer_tab(viewer_id)
+        if viewer is not None:
+            self.notebook.select(self.event_log_viewer_tabs[viewer_id]["frame"])
+
+    def _event_action_callbacks(self, file_path: str, viewer_id: int) -> Dict[str, Callable[[EventRef], None]]:
+        """Row-action callbacks for an :class:`EventLogViewer`, reusing each event's precomputed time.
+
+        Each action resolves against the row's own log (``ref.source_path``), so
+        rows of a merged timeline stay bound to the file they came from.  Once
+        the viewer has pre-resolved the row's recordings (``ref.media``), the
+        actions launch directly without searching for them.
+        """
+        return {
+            "play_video_cb": lambda ref: self.play_video_at_timestamp(
+                ref.source_path or file_path,
+                ref.timestamp,
+                viewer_id=viewer_id,
+                event_time=ref.event_time,
+                media=ref.media,
+            ),
+            "play_bazel_cb": lambda ref: self.play_bazel_at_timestamp(
+                ref.source_path or file_path,
+                ref.timestamp,
+                viewer_id=viewer_id,
+                event_time=ref.event_time,
+                media=ref.media,
+            ),
+            "play_bazel_start_cb": lambda ref: self.play_bazel_from_start(
+                ref.source_path or file_path,
+                ref.timestamp,
+                viewer_id=viewer_id,
+                event_time=ref.event_time,
+                media=ref.media,
+            ),
+            "navigate_mcap_cb": lambda ref: self.navigate_to_mcap_from_timestamp(
+                ref.source_path or file_path, ref.timestamp, event_time=ref.event_time, media=ref.media
+            ),
+        }
+
+    def focus_event_log_tab(self, tab_widget: tk.Widget) -> bool:
+        """Focus the event table of the viewer shown in *tab_widget*; return ``False`` if it is not one.
+
+        Called whenever an event tab becomes selected, so lazy tabs are built here.
+        """
+        for viewer_id, viewer_info in self.event_log_viewer_tabs.items():
+            if viewer_info.get("frame") == tab_widget:
+                viewer = self._materialize_viewer_tab(viewer_id)
+                if viewer is not None:
+                    self.root.after_idle(viewer.focus_events)
+                return True
+        return False
 
     def _get_settings_tab_index(self):
         """Return index of Settings tab if present."""
@@ -585,18 +739,29 @@ class FileExplorerTab:
         except Exception as e:
             self.log_message(f"Tab close error: {e}", is_error=False)
 
-    def _open_event_log_viewer_as_window(self, file_path: str) -> None:
-        """Open event log viewer as a new window (original behavior)."""
+    def _open_event_log_viewer_as_window(
+        self,
+        file_path: str,
+        title: Optional[str] = None,
+        leases: Sequence[EventStoreLease] = (),
+        **viewer_options,
+    ) -> None:
+        """Open event log viewer as a new window (original behavior); *leases* are released when it closes."""
         viewer_id = self._next_viewer_id
         self._next_viewer_id += 1
 
         # Create a new window for the event log viewer
         viewer_window = tk.Toplevel(self.root)
-        viewer_window.title(f"Event Log Viewer - {os.path.basename(file_path)}")
+        viewer_window.title(title or f"Event Log Viewer - {os.path.basename(file_path)}")
         viewer_window.geometry("1000x520")
 
         # Track this viewer
-        self.event_log_viewers[viewer_id] = {"window": viewer_window, "processes": [], "file_path": file_path}
+        self.event_log_viewers[viewer_id] = {
+            "window": viewer_window,
+            "processes": [],
+            "file_path": file_path,
+            "leases": list(leases),
+        }
 
         # Cleanup handler for when viewer closes
         def on_viewer_close() -> None:
@@ -613,10 +778,9 @@ class FileExplorerTab:
             on_close=on_viewer_close,
             is_tab=False,
             log_message=self.log_message,
-            play_video_cb=lambda ts: self.play_video_at_timestamp(file_path, ts, viewer_id=viewer_id),
-            play_bazel_cb=lambda ts: self.play_bazel_at_timestamp(file_path, ts, viewer_id=viewer_id),
-            play_bazel_start_cb=lambda ts: self.play_bazel_from_start(file_path, ts, viewer_id=viewer_id),
-            navigate_mcap_cb=lambda ts: self.navigate_to_mcap_from_timestamp(file_path, ts),
+            media_index_for=self.media_indexes.for_event_log,
+            **self._event_action_callbacks(file_path, viewer_id),
+            **viewer_options,
         ).build_ui()
 
     def _cleanup_viewer_tab(self, viewer_id):
@@ -643,6 +807,7 @@ class FileExplorerTab:
         except Exception as e:
             self.log_message(f"Failed to remove event log tab: {e}", is_error=False)
 
+        self._release_leases(viewer_info.get("leases", []))
         del self.event_log_viewer_tabs[viewer_id]
         self.log_message("Closed event log viewer tab")
 
@@ -698,7 +863,30 @@ class FileExplorerTab:
                 first_logs_path = os.path.dirname(event_log_files[0])
                 self._add_to_history(self.current_explorer_path)
                 self.current_explorer_path = first_logs_path
-                self.refresh_explorer(on_done=lambda: [self.open_event_log_viewer(f) for f in event_log_files])
+                open_timeline = len(event_log_files) > 1 and settings.get("merged_timeline_for_tg", True)
+
+                def _open_viewers() -> None:
+                    if settings.get("prewarm_mpv", False):
+                        self._prewarm_video_player()
+                    if len(event_log_files) == 1:
+                        self.open_event_log_viewer(event_log_files[0])
+                        return
+                    # Tabs (the timeline too) stay placeholders until first shown and only the first
+                    # log is opened.  With prefetch, all logs are parsed in parallel meanwhile and
+                    # each viewer waits on its own log only.
+                    loading = None
+                    if settings.get("prefetch_event_logs", False):
+                        loading = self.event_loader.load_many(event_log_files)
+                    tab_ids = [
+                        self.open_event_log_viewer(f, load_store=loading[f].result if loading else None, lazy=True)
+                        for f in event_log_files
+                    ]
+                    if open_timeline:
+                        self.open_merged_timeline(event_log_files, loading, lazy=True)
+                    if tab_ids[0] is not None:
+                        self._select_viewer_tab(tab_ids[0])
+
+                self.refresh_explorer(on_done=_open_viewers)
 
             if self._is_tg_folder(current_folder_name):
 
@@ -789,14 +977,20 @@ class FileExplorerTab:
             except tk.TclError:
                 pass
 
+    def forget_process(self, proc_id: int) -> None:
+        """Stop associating an exited process with any event-log viewer."""
+        for viewer_info in list(self.event_log_viewers.values()) + list(self.event_log_viewer_tabs.values()):
+            if proc_id in viewer_info["processes"]:
+                viewer_info["processes"].remove(proc_id)
+
     def _track_viewer_process(self, viewer_id: Optional[int], proc_id: Optional[int]) -> None:
         """Associate *proc_id* with the given event-log viewer (window or tab)."""
         if viewer_id is None or proc_id is None:
             return
-        if viewer_id in self.event_log_viewers:
-            self.event_log_viewers[viewer_id]["processes"].append(proc_id)
-        elif viewer_id in self.event_log_viewer_tabs:
-            self.event_log_viewer_tabs[viewer_id]["processes"].append(proc_id)
+        viewer_info = self.event_log_viewers.get(viewer_id) or self.event_log_viewer_tabs.get(viewer_id)
+        # A player reused over IPC reports the id it was launched with; track it once.
+        if viewer_info is not None and proc_id not in viewer_info["processes"]:
+            viewer_info["processes"].append(proc_id)
 
     def _set_explorer_cursor(
         self,
@@ -973,12 +1167,30 @@ class FileExplorerTab:
         except Exception as e:
             self.log_message(f"Error highlighting directory: {e}", is_error=False)
 
-    def play_video_at_timestamp(self, event_log_path: str, timestamp_str: str, viewer_id: Optional[int] = None) -> None:
-        """Play video at the specified timestamp using mpv."""
+    def play_video_at_timestamp(
+        self,
+        event_log_path: str,
+        timestamp_str: str,
+        viewer_id: Optional[int] = None,
+        event_time: Optional[datetime] = None,
+        media: Optional[MediaTarget] = None,
+    ) -> None:
+        """Play video at the specified timestamp using mpv.
+
+        With a pre-resolved *media* target the video is launched immediately.
+        """
+        if media is not None:
+            if media.video is None:
+                self.log_message("No matching video file found", is_error=True)
+            else:
+                self._launch_video(media.video, media.video_offset, viewer_id)
+            return
 
         def task():
             try:
-                event_time = parse_timestamp(timestamp_str, log_fn=self.log_message)
+                nonlocal event_time
+                if event_time is None:
+                    event_time = parse_timestamp(timestamp_str, log_fn=self.log_message)
                 if not event_time:
                     self.log_message(f"Could not parse timestamp: {timestamp_str}", is_error=True)
                     return
@@ -988,23 +1200,38 @@ class FileExplorerTab:
                     self.log_message("No matching video file found", is_error=True)
                     return
 
-                settings = self._get_runtime_settings()
-
-                def launch():
-                    self.log_message(f"Playing video: {os.path.basename(video_file)} at {start_offset}s")
-                    message, error, proc_id = self.logic.launch_mpv_video(video_file, start_offset, settings)
-                    self._track_viewer_process(viewer_id, proc_id)
-                    if message:
-                        self.log_message(message)
-                    if error:
-                        self.log_message(error, is_error=True)
-
-                self.root.after(0, launch)
+                self.root.after(0, lambda: self._launch_video(video_file, start_offset, viewer_id))
             except Exception as e:
                 self.root.after(0, lambda err=e: self.log_message(f"Error playing video: {err}", is_error=True))
 
         threading.Thread(target=task, daemon=True).start()
 
+    def _prewarm_video_player(self) -> None:
+        """Start the idle mpv in the background; a missing mpv is only logged to the log file."""
+
+        def task() -> None:
+            message, error, _proc_id = self.logic.prewarm_mpv(self._get_runtime_settings())
+            if message:
+                self.root.after(0, lambda: self.log_message(message))
+            if error:
+                logger.info("Could not pre-warm mpv: %s", error)
+
+        threading.Thread(target=task, daemon=True).start()
+
+    def _launch_video(self, video_file: str, start_offset: int, viewer_id: Optional[int]) -> None:
+        self.log_message(f"Playing video: {os.path.basename(video_file)} at {start_offset}s")
+        message, error, proc_id = self.logic.launch_mpv_video(video_file, start_offset, self._get_runtime_settings())
+        self._report_launch(viewer_id, proc_id, message, error)
+
+    def _report_launch(
+        self, viewer_id: Optional[int], proc_id: Optional[int], message: Optional[str], error: Optional[str]
+    ) -> None:
+        self._track_viewer_process(viewer_id, proc_id)
+        if message:
+            self.log_message(message)
+        if error:
+            self.log_message(error, is_error=True)
+
     def _get_runtime_settings(self) -> Dict[str, Any]:
         return getattr(self.logic, "settings", None) or DEFAULT_SETTINGS.copy()
 
@@ -1025,8 +1252,15 @@ class FileExplorerTab:
                     self.log_message(f"Error terminating process: {e}", is_error=True)
 
         # Remove viewer from tracking
+        self._release_leases(viewer_info.get("leases", []))
         del self.event_log_viewers[viewer_id]
 
+    @staticmethod
+    def _release_leases(leases: Sequence[EventStoreLease]) -> None:
+        """Give up a closed viewer's shared event stores; each is freed once no viewer uses it."""
+        for lease in leases:
+            lease.release()
+
     def find_video_for_timestamp(self, event_log_path: str, event_time: datetime) -> Tuple[Optional[str], int]:
         """Find the video file that contains the specified timestamp and calculate offset."""
         try:
@@ -1097,24 +1331,7 @@ class FileExplorerTab:
                 return cached_files
 
         # Cache miss or expired - scan directory
-        mcap_files = []
-        max_depth = 3
-        base_depth = rosbags_dir.count(os.sep)
-
-        try:
-            for root, dirs, files in os.walk(rosbags_dir):
-                current_depth = root.count(os.sep) - base_depth
-                if current_depth >= max_depth:
-                    dirs[:] = []
-
-                for file in files:
-                    if file.endswith(".mcap"):
-                        mcap_files.append(os.path.join(root, file))
-
-                if len(mcap_files) > 100:
-                    break
-        except Exception:  # nosec B110
-            pass  # Silently ignore walk errors (permissions, etc.)
+        mcap_files = list_mcap_files(rosbags_dir)
 
         # Update cache
         self._mcap_cache[rosbags_dir] = (current_time, mcap_files)
@@ -1280,12 +1497,30 @@ class FileExplorerTab:
             logger.exception("Error finding MCAP with buffer for %s", event_log_path)
             return None, None
 
-    def play_bazel_at_timestamp(self, event_log_path: str, timestamp_str: str, viewer_id: Optional[int] = None) -> None:
-        """Play rosbag at the specified timestamp using Bazel Bag GUI (30s pre-buffer)."""
+    def play_bazel_at_timestamp(
+        self,
+        event_log_path: str,
+        timestamp_str: str,
+        viewer_id: Optional[int] = None,
+        event_time: Optional[datetime] = None,
+        media: Optional[MediaTarget] = None,
+    ) -> None:
+        """Play rosbag at the specified timestamp using Bazel Bag GUI (30s pre-buffer).
+
+        With a pre-resolved *media* target the bag is launched immediately.
+        """
+        if media is not None:
+            if media.bag_files is None:
+                self.log_message("No matching MCAP file found", is_error=True)
+            else:
+                self._launch_bazel(media.bag_files, media.bag_offset, viewer_id)
+            return
 
         def task():
             try:
-                event_time = parse_timestamp(timestamp_str, log_fn=self.log_message)
+                nonlocal event_time
+                if event_time is None:
+                    event_time = parse_timestamp(timestamp_str, log_fn=self.log_message)
                 if not event_time:
                     self.log_message(f"Could not parse timestamp: {timestamp_str}", is_error=True)
                     return
@@ -1295,31 +1530,7 @@ class FileExplorerTab:
                     self.log_message("No matching MCAP file found", is_error=True)
                     return
 
-                settings = self._get_runtime_settings()
-
-                def launch():
-                    if len(mcap_files) > 1:
-                        self.log_message(
-                            f"Launching Bazel Bag GUI with combined MCAPs at offset {int(start_offset)}s..."
-                        )
-                        message, error, symlink_dir, proc_id = self.logic.play_bazel_bag_gui_with_symlinks(
-                            mcap_files, settings, start_time=start_offset
-                        )
-                    else:
-                        self.log_message(
-                            f"Launching Bazel Bag GUI with "
-                            f"{os.path.basename(mcap_files[0])} at offset {int(start_offset)}s..."
-                        )
-                        message, error, proc_id = self.logic.launch_bazel_bag_gui(
-                            mcap_files[0], settings, start_time=start_offset
-                        )
-                    self._track_viewer_process(viewer_id, proc_id)
-                    if message:
-                        self.log_message(message)
-                    if error:
-                        self.log_message(error, is_error=True)
-
-                self.root.after(0, launch)
+                self.root.after(0, lambda: self._launch_bazel(mcap_files, start_offset, viewer_id))
             except Exception as e:
                 self.root.after(
                     0, lambda err=e: self.log_message(f"Error playing bazel at timestamp: {err}", is_error=True)
@@ -1327,12 +1538,44 @@ class FileExplorerTab:
 
         threading.Thread(target=task, daemon=True).start()
 
-    def play_bazel_from_start(self, event_log_path: str, timestamp_str: str, viewer_id: Optional[int] = None) -> None:
-        """Play rosbag from the beginning using the timestamp to identify the correct file."""
+    def _launch_bazel(self, mcap_files: List[str], start_offset: float, viewer_id: Optional[int]) -> None:
+        settings = self._get_runtime_settings()
+        if len(mcap_files) > 1:
+            self.log_message(f"Launching Bazel Bag GUI with combined MCAPs at offset {int(start_offset)}s...")
+            message, error, symlink_dir, proc_id = self.logic.play_bazel_bag_gui_with_symlinks(
+                mcap_files, settings, start_time=start_offset
+            )
+        else:
+            self.log_message(
+                f"Launching Bazel Bag GUI with {os.path.basename(mcap_files[0])} at offset {int(start_offset)}s..."
+            )
+            message, error, proc_id = self.logic.launch_bazel_bag_gui(mcap_files[0], settings, start_time=start_offset)
+        self._report_launch(viewer_id, proc_id, message, error)
+
+    def play_bazel_from_start(
+        self,
+        event_log_path: str,
+        timestamp_str: str,
+        viewer_id: Optional[int] = None,
+        event_time: Optional[datetime] = None,
+        media: Optional[MediaTarget] = None,
+    ) -> None:
+        """Play rosbag from the beginning using the timestamp to identify the correct file.
+
+        With a pre-resolved *media* target the bag is launched immediately.
+        """
+        if media is not None:
+            if media.bag is None:
+                self.log_message("No matching MCAP file found", is_error=True)
+            else:
+                self._launch_bazel_from_start(media.bag, viewer_id)
+            return
 
         def task():
             try:
-                event_time = parse_timestamp(timestamp_str, log_fn=self.log_message)
+                nonlocal event_time
+                if event_time is None:
+                    event_time = parse_timestamp(timestamp_str, log_fn=self.log_message)
                 if not event_time:
                     self.log_message(f"Could not parse timestamp: {timestamp_str}", is_error=True)
                     return
@@ -1342,18 +1585,7 @@ class FileExplorerTab:
                     self.log_message("No matching MCAP file found", is_error=True)
                     return
 
-                settings = self._get_runtime_settings()
-
-                def launch():
-                    self.log_message(f"Launching Bazel Bag GUI with {os.path.basename(mcap_file)} from start...")
-                    message, error, proc_id = self.logic.launch_bazel_bag_gui(mcap_file, settings, start_time=None)
-                    self._track_viewer_process(viewer_id, proc_id)
-                    if message:
-                        self.log_message(message)
-                    if error:
-                        self.log_message(error, is_error=True)
-
-                self.root.after(0, launch)
+                self.root.after(0, lambda: self._launch_bazel_from_start(mcap_file, viewer_id))
             except Exception as e:
                 self.root.after(
                     0, lambda err=e: self.log_message(f"Error playing bazel from start: {err}", is_error=True)
@@ -1361,17 +1593,33 @@ class FileExplorerTab:
 
         threading.Thread(target=task, daemon=True).start()
 
-    def navigate_to_mcap_from_timestamp(self, event_log_path: str, timestamp_str: str) -> None:
-        """Navigate to the MCAP file in the file explorer based on the timestamp."""
+    def _launch_bazel_from_start(self, mcap_file: str, viewer_id: Optional[int]) -> None:
+        self.log_message(f"Launching Bazel Bag GUI with {os.path.basename(mcap_file)} from start...")
+        settings = self._get_runtime_settings()
+        message, error, proc_id = self.logic.launch_bazel_bag_gui(mcap_file, settings, start_time=None)
+        self._report_launch(viewer_id, proc_id, message, error)
+
+    def navigate_to_mcap_from_timestamp(
+        self,
+        event_log_path: str,
+        timestamp_str: str,
+        event_time: Optional[datetime] = None,
+        media: Optional[MediaTarget] = None,
+    ) -> None:
+        """Navigate to the MCAP file in the file explorer based on the timestamp (or pre-resolved *media*)."""
         try:
-            # Parse the timestamp from the event log
-            event_time = parse_timestamp(timestamp_str, log_fn=self.log_message)
-            if not event_time:
-                self.log_message(f"Could not parse timestamp: {timestamp_str}", is_error=True)
-                return
+            if media is not None:
+                mcap_file, start_offset = media.bag, media.event_offset
+            else:
+                # Parse the timestamp from the event log unless the viewer already did
+                if event_time is None:
+                    event_time = parse_timestamp(timestamp_str, log_fn=self.log_message)
+                if not event_time:
+                    self.log_message(f"Could not parse timestamp: {timestamp_str}", is_error=True)
+                    return
 
-            # Find the corresponding MCAP file
-            mcap_file, start_offset = self.find_mcap_for_timestamp(event_log_path, event_time)
+                # Find the corresponding MCAP file
+                mcap_file, start_offset = self.find_mcap_for_timestamp(event_log_path, event_time)
             if not mcap_file:
                 self.log_message("No matching MCAP file found", is_error=True)
                 return
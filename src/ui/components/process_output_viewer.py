@@ -0,0 +1,116 @@
+"""Window showing the last lines printed by launched tools.
+
+Lists every :class:`~src.logic.process_output.ProcessOutput` the application
+still holds (running tools and recently exited ones) and shows the tail of the
+selected one, refreshed once a second while the window is open.  Only the
+line counter is compared on each tick, so an idle tool costs nothing to watch.
+"""
+
+import os
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, List, Optional
+
+from ...logic.process_output import ProcessOutput
+from ...utils.file_operations import open_file_with_default_app
+
+#: Lines shown for the selected process.
+VIEW_LINES = 500
+REFRESH_MS = 1000
+
+
+class ProcessOutputViewer:
+    """Toplevel window with a process chooser and the selected process's last :data:`VIEW_LINES` lines.
+
+    Args:
+        root: Application root window.
+        get_outputs: Returns the captured outputs, oldest first.
+        log_message: Application log callback.
+    """
+
+    def __init__(
+        self,
+        root: tk.Tk,
+        get_outputs: Callable[[], List[ProcessOutput]],
+        log_message: Callable[..., None],
+    ) -> None:
+        self._get_outputs = get_outputs
+        self._log_message = log_message
+        self._outputs: List[ProcessOutput] = []
+        self._shown: Optional[ProcessOutput] = None
+        self._shown_lines = -1
+
+        self.window = tk.Toplevel(root)
+        self.window.title("Process Output")
+        self.window.geometry("900x500")
+
+        top = ttk.Frame(self.window, padding=(10, 10, 10, 0))
+        top.pack(fill="x")
+        ttk.Label(top, text="Process:").pack(side="left")
+        self._choice = tk.StringVar()
+        self._combo = ttk.Combobox(top, textvariable=self._choice, state="readonly", width=60)
+        self._combo.pack(side="left", padx=(6, 6), fill="x", expand=True)
+        self._combo.bind("<<ComboboxSelected>>", lambda _e: self._show_selected(), add="+")
+        ttk.Button(top, text="Open log file", command=self._open_log_file).pack(side="right")
+
+        body = ttk.Frame(self.window, padding=10)
+        body.pack(fill="both", expand=True)
+        self._text = tk.Text(body, wrap="none", font=("TkFixedFont", 9), state="disabled")
+        yscroll = ttk.Scrollbar(body, orient="vertical", command=self._text.yview)
+        xscroll = ttk.Scrollbar(body, orient="horizontal", command=self._text.xview)
+        self._text.configure(yscrollcommand=yscroll.set, xscrollcommand=xscroll.set)
+        yscroll.pack(side="right", fill="y")
+        xscroll.pack(side="bottom", fill="x")
+        self._text.pack(side="left", fill="both", expand=True)
+
+        self.window.bind("<Escape>", lambda _e: self.window.destroy())
+        self._refresh()
+
+    @staticmethod
+    def _label(output: ProcessOutput) -> str:
+        state = "exited" if output.closed else "running"
+        return f"{output.name} (PID {output.pid}, {state})"
+
+    def _refresh(self) -> None:
+        if not self.window.winfo_exists():
+            return
+        outputs = self._get_outputs()
+        if outputs != self._outputs or [o.closed for o in outputs] != [o.closed for o in self._outputs]:
+            self._outputs = outputs
+            self._combo["values"] = [self._label(output) for output in outputs]
+            if outputs and (self._shown is None or self._shown not in outputs):
+                self._shown = outputs[-1]  # newest by default
+            if self._shown is not None:
+                self._choice.set(self._label(self._shown))
+        if self._shown is not None and self._shown.total_lines != self._shown_lines:
+            self._render()
+        self.window.after(REFRESH_MS, self._refresh)
+
+    def _show_selected(self) -> None:
+        index = self._combo.current()
+        if 0 <= index < len(self._outputs):
+            self._shown = self._outputs[index]
+            self._render()
+
+    def _render(self) -> None:
+        output = self._shown
+        if output is None:
+            return
+        self._shown_lines = output.total_lines
+        at_bottom = self._text.yview()[1] >= 0.999
+        self._text.configure(state="normal")
+        self._text.delete("1.0", "end")
+        lines = output.tail(VIEW_LINES)
+        self._text.insert("end", "\n".join(lines) if lines else "(no output yet)")
+        self._text.configure(state="disabled")
+        if at_bottom:
+            self._text.see("end")
+
+    def _open_log_file(self) -> None:
+        output = self._shown
+        if output is None or not os.path.exists(output.path):
+            self._log_message("No output log file for this process", is_error=True)
+            return
+        success, message = open_file_with_default_app(output.path)
+        if not success:
+            self._log_message(message, is_error=True)
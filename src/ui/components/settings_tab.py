@@ -30,6 +30,19 @@ class SettingsTab:
             "width": 20,
         },
         {"label": "Bazel Bag GUI Rate:", "key": "bazel_bag_gui_rate", "type": "float", "widget": "entry", "width": 20},
+        {
+            "label": "Run prebuilt Bazel tools directly",
+            "key": "exec_prebuilt_bazel_tools",
+            "type": "bool",
+            "widget": "checkbutton",
+        },
+        {
+            "label": "Build only the launched tools",
+            "key": "build_tool_targets_only",
+            "type": "bool",
+            "widget": "checkbutton",
+        },
+        {"label": "Tool Build Targets:", "key": "bazel_build_targets", "type": "str", "widget": "entry", "width": 60},
         {
             "label": "Open Foxglove in browser",
             "key": "open_foxglove_in_browser",
@@ -42,6 +55,12 @@ class SettingsTab:
             "type": "bool",
             "widget": "checkbutton",
         },
+        {
+            "label": "Pre-warm video player",
+            "key": "prewarm_mpv",
+            "type": "bool",
+            "widget": "checkbutton",
+        },
         {
             "label": "Single instance for Rosbag",
             "key": "single_instance_rosbag",
@@ -60,6 +79,18 @@ class SettingsTab:
             "type": "bool",
             "widget": "checkbutton",
         },
+        {
+            "label": "Merged timeline for TG folders",
+            "key": "merged_timeline_for_tg",
+            "type": "bool",
+            "widget": "checkbutton",
+        },
+        {
+            "label": "Prefetch auto-opened event logs",
+            "key": "prefetch_event_logs",
+            "type": "bool",
+            "widget": "checkbutton",
+        },
     ]
 
     def __init__(self, parent, logic, log_message):
@@ -78,11 +109,19 @@ class SettingsTab:
             "logging_dir": "Path to LOGGING drive used by quick navigation.",
             "max_foxglove_files": "Maximum number of MCAP files to open in Foxglove at once.",
             "bazel_bag_gui_rate": "Playback rate for Bazel rosbag GUI.",
+            "exec_prebuilt_bazel_tools": "Start already-built Bazel tools from their binary instead of bazel run "
+            "(uses bazel run again after a checkout until the binary is re-resolved).",
+            "build_tool_targets_only": "Build button builds only the Tool Build Targets instead of //..., "
+            "and skips the build when no source changed since the last successful one.",
+            "bazel_build_targets": "Space-separated Bazel targets built by the Build button in tools-only mode.",
             "open_foxglove_in_browser": "Open single MCAP in browser Foxglove instead of desktop app.",
             "single_instance_video": "Keep only one MPV video process at a time.",
+            "prewarm_mpv": "Start an idle MPV window when a TG event log opens, so the first video plays instantly.",
             "single_instance_rosbag": "Keep only one Bazel rosbag process at a time.",
             "auto_open_event_log_for_tg": "Auto-open event logs when entering TG folders.",
             "event_log_viewer_as_tab": "Open event viewer inside main notebook tab.",
+            "merged_timeline_for_tg": "Also open a time-ordered view of all event logs in a TG folder.",
+            "prefetch_event_logs": "Parse auto-opened event logs in the background before their tab is shown.",
         }
 
         self.logic.set_runtime_settings(self.settings)
@@ -0,0 +1,274 @@
+"""Virtualised table widget for very large event logs.
+
+``ttk.Treeview`` becomes unusably slow once hundreds of thousands of items are
+inserted.  :class:`VirtualEventTable` keeps a Treeview with only as many items
+as fit in the viewport and rewrites their values as the user scrolls.  The
+rows themselves stay in the caller's data store; the table only holds a *view*
+— a sequence of row numbers into that store — and a getter used to fetch the
+values of the rows currently on screen.
+
+Selection, scrolling (scrollbar, wheel, keyboard) and focus are handled here
+so callers work in terms of view positions and store row numbers instead of
+Treeview item ids.
+"""
+
+from __future__ import annotations
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, List, Optional, Sequence, Tuple
+
+#: Fallback geometry used until the first row has been drawn and can be measured.
+_DEFAULT_ROW_HEIGHT = 20
+_DEFAULT_HEADING_HEIGHT = 25
+_WHEEL_ROWS = 3
+
+
+class VirtualEventTable:
+    """A scrollable, single-selection table that materialises only visible rows.
+
+    Args:
+        parent: Container widget; the table packs itself with ``fill="both"``.
+        columns: ``(column_id, heading, width, minwidth)`` tuples.
+        height: Initial number of visible rows before the widget is measured.
+    """
+
+    def __init__(
+        self,
+        parent: tk.Widget,
+        columns: Sequence[Tuple[str, str, int, int]],
+        height: int = 14,
+    ) -> None:
+        self.container = ttk.Frame(parent)
+        self.container.pack(fill="both", expand=True)
+
+        column_ids = tuple(c[0] for c in columns)
+        self.tree = ttk.Treeview(
+            self.container, columns=column_ids, show="headings", height=height, selectmode="browse"
+        )
+        for column_id, heading, width, minwidth in columns:
+            self.tree.heading(column_id, text=heading)
+            self.tree.column(column_id, width=width, minwidth=minwidth)
+
+        self._v_scroll = ttk.Scrollbar(self.container, orient="vertical", command=self._on_scrollbar)
+        h_scroll = ttk.Scrollbar(self.container, orient="horizontal", command=self.tree.xview)
+        self.tree.configure(xscrollcommand=h_scroll.set)
+
+        self.tree.pack(side="left", fill="both", expand=True)
+        self._v_scroll.pack(side="right", fill="y")
+        h_scroll.pack(side="bottom", fill="x", before=self.tree)
+
+        self._view: Sequence[int] = ()
+        self._row_getter: Callable[[int], Sequence[object]] = lambda _i: ()
+        self._tag_getter: Optional[Callable[[int], Tuple[str, ...]]] = None
+        self._placeholder: Optional[Tuple[object, ...]] = None
+        self._top = 0
+        self._visible = max(1, height)
+        self._row_height = _DEFAULT_ROW_HEIGHT
+        self._heading_height = _DEFAULT_HEADING_HEIGHT
+        self._slots: List[str] = []
+        self._selected_pos: Optional[int] = None
+        self._select_callbacks: List[Callable[[], None]] = []
+
+        self.tree.bind("<Configure>", self._on_resize, add="+")
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select, add="+")
+        self.tree.bind("<MouseWheel>", self._on_mousewheel, add="+")
+        self.tree.bind("<Button-4>", lambda _e: self._scroll_rows(-_WHEEL_ROWS), add="+")
+        self.tree.bind("<Button-5>", lambda _e: self._scroll_rows(_WHEEL_ROWS), add="+")
+        self.tree.bind("<Up>", lambda _e: self.move_selection(-1), add="+")
+        self.tree.bind("<Down>", lambda _e: self.move_selection(1), add="+")
+        self.tree.bind("<Prior>", lambda _e: self.move_selection(-self._visible), add="+")
+        self.tree.bind("<Next>", lambda _e: self.move_selection(self._visible), add="+")
+        self.tree.bind("<Home>", lambda _e: self._select_edge(first=True), add="+")
+        self.tree.bind("<End>", lambda _e: self._select_edge(first=False), add="+")
+
+    # Data
+    def set_view(
+        self,
+        view: Sequence[int],
+        row_getter: Optional[Callable[[int], Sequence[object]]] = None,
+    ) -> None:
+        """Display *view* (row numbers into the caller's store) from the top, clearing the selection."""
+        self._view = view
+        if row_getter is not None:
+            self._row_getter = row_getter
+        self._placeholder = None
+        self._top = 0
+        had_selection = self._selected_pos is not None
+        self._selected_pos = None
+        self._render()
+        if had_selection:
+            self._notify_select()
+
+    def set_placeholder(self, values: Optional[Tuple[object, ...]]) -> None:
+        """Show a single non-selectable row (e.g. a loading message) instead of the view."""
+        self._placeholder = values
+        self._selected_pos = None
+        self._render()
+
+    def set_tag_getter(self, tag_getter: Optional[Callable[[int], Tuple[str, ...]]]) -> None:
+        """Use *tag_getter(row_number)* to style rows via Treeview tags."""
+        self._tag_getter = tag_getter
+        self._render()
+
+    def refresh(self) -> None:
+        """Re-read the values of the visible rows from the store."""
+        self._render()
+
+    @property
+    def view(self) -> Sequence[int]:
+        return self._view
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    # Selection
+    def bind_select(self, callback: Callable[[], None]) -> None:
+        """Call *callback* whenever the selected row changes (including to no selection)."""
+        self._select_callbacks.append(callback)
+
+    def selected_position(self) -> Optional[int]:
+        return self._selected_pos
+
+    def selected_index(self) -> Optional[int]:
+        """Store row number of the selected row, or ``None``."""
+        if self._selected_pos is None:
+            return None
+        return self._view[self._selected_pos]
+
+    def selected_values(self) -> Optional[Sequence[object]]:
+        index = self.selected_index()
+        if index is None:
+            return None
+        return self._row_getter(index)
+
+    def select_position(self, pos: int, notify: bool = True) -> None:
+        """Select the row at view position *pos* (clamped) and scroll it into view."""
+        if self._placeholder is not None or not self._view:
+            return
+        pos = max(0, min(len(self._view) - 1, pos))
+        changed = pos != self._selected_pos
+        self._selected_pos = pos
+        self.see(pos)
+        if changed and notify:
+            self._notify_select()
+
+    def move_selection(self, step: int) -> str:
+        """Move the selection by *step* rows; selects the first/last row if nothing is selected."""
+        if self._view:
+            if self._selected_pos is None:
+                self.select_position(0 if step > 0 else len(self._view) - 1)
+            else:
+                self.select_position(self._selected_pos + step)
+        return "break"
+
+    def ensure_selection(self) -> None:
+        """Select the first row when nothing is selected, keep the current selection otherwise."""
+        if self._selected_pos is None:
+            self.select_position(0)
+        else:
+            self.see(self._selected_pos)
+
+    def focus_set(self) -> None:
+        self.tree.focus_set()
+
+    # Scrolling
+    def see(self, pos: int) -> None:
+        """Scroll so that view position *pos* is visible."""
+        if pos < self._top:
+            self._top = pos
+        elif pos >= self._top + self._visible:
+            self._top = pos - self._visible + 1
+        self._render()
+
+    def _max_top(self) -> int:
+        return max(0, len(self._view) - self._visible)
+
+    def _scroll_rows(self, rows: int) -> str:
+        top = max(0, min(self._max_top(), self._top + rows))
+        if top != self._top:
+            self._top = top
+            self._render()
+        return "break"
+
+    def _on_scrollbar(self, action: str, amount: str, unit: Optional[str] = None) -> None:
+        if action == "moveto":
+            total = len(self._view)
+            self._top = max(0, min(self._max_top(), int(float(amount) * total)))
+            self._render()
+        elif action == "scroll":
+            step = int(amount)
+            self._scroll_rows(step * self._visible if unit == "pages" else step)
+
+    def _on_mousewheel(self, event: tk.Event) -> str:  # type: ignore[type-arg]
+        return self._scroll_rows(-_WHEEL_ROWS if event.delta > 0 else _WHEEL_ROWS)
+
+    def _select_edge(self, first: bool) -> str:
+        if self._view:
+            self.select_position(0 if first else len(self._view) - 1)
+        return "break"
+
+    def _on_resize(self, event: tk.Event) -> None:  # type: ignore[type-arg]
+        if self._slots:
+            bbox = self.tree.bbox(self._slots[0])
+            if bbox:
+                self._heading_height, self._row_height = bbox[1], max(1, bbox[3])
+        visible = max(1, (event.height - self._heading_height) // self._row_height)
+        if visible != self._visible:
+            self._visible = visible
+            self._top = min(self._top, self._max_top())
+            self._render()
+
+    # Rendering
+    def _render(self) -> None:
+        tree = self.tree
+        if self._placeholder is not None:
+            rows: List[Tuple[Sequence[object], Tuple[str, ...]]] = [(self._placeholder, ())]
+        else:
+            view, getter, tag_getter = self._view, self._row_getter, self._tag_getter
+            end = min(len(view), self._top + self._visible)
+            rows = [(getter(view[pos]), tag_getter(view[pos]) if tag_getter else ()) for pos in range(self._top, end)]
+
+        while len(self._slots) < len(rows):
+            self._slots.append(tree.insert("", "end"))
+        while len(self._slots) > len(rows):
+            tree.delete(self._slots.pop())
+
+        for iid, (values, tags) in zip(self._slots, rows):
+            tree.item(iid, values=tuple(values), tags=tags)
+        tree.yview_moveto(0)
+
+        selected_slot = None
+        if self._selected_pos is not None and self._placeholder is None:
+            slot = self._selected_pos - self._top
+            if 0 <= slot < len(self._slots):
+                selected_slot = self._slots[slot]
+        if selected_slot is not None:
+            if tree.selection() != (selected_slot,):
+                tree.selection_set(selected_slot)
+            tree.focus(selected_slot)
+        elif tree.selection():
+            tree.selection_set(())
+
+        total = len(self._view)
+        if total and self._placeholder is None:
+            self._v_scroll.set(self._top / total, min(1.0, (self._top + len(rows)) / total))
+        else:
+            self._v_scroll.set(0.0, 1.0)
+
+    def _on_tree_select(self, _event: tk.Event) -> None:  # type: ignore[type-arg]
+        selection = self.tree.selection()
+        if not selection or self._placeholder is not None:
+            return
+        try:
+            slot = self._slots.index(selection[0])
+        except ValueError:
+            return
+        pos = self._top + slot
+        if pos != self._selected_pos and pos < len(self._view):
+            self._selected_pos = pos
+            self._notify_select()
+
+    def _notify_select(self) -> None:
+        for callback in self._select_callbacks:
+            callback()
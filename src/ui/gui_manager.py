@@ -12,7 +12,9 @@ from ..logic.file_explorer_logic import FileExplorerLogic
 from ..utils.constants import SETTINGS_FILE_PATH
 from ..utils.logger import TkinterLogHandler, get_logger
 from ..utils.settings_manager import SettingsManager
+from ..utils.utils import format_file_size
 from .components.file_explorer_tab import FileExplorerTab
+from .components.process_output_viewer import ProcessOutputViewer
 from .components.settings_tab import SettingsTab
 from .components.tooltip import attach_tooltip
 
@@ -39,6 +41,7 @@ class FoxgloveAppGUIManager:
         self.main_notebook.pack(fill="both", expand=True, padx=10, pady=10)
 
         self._button_map = {}
+        self._process_output_viewer = None
         self._button_tooltips = {
             "Open": "Open the selected file or folder.",
             "Copy": "Copy selected path(s) to clipboard. (Ctrl+C)",
@@ -48,8 +51,10 @@ class FoxgloveAppGUIManager:
             "Viz": "Run bazel tools visualization from Bazel working directory.",
             "Topic": "Run topic-gui: bazel run //tools/topic:gui.",
             "Plot": "Run av-plot: bazel run //tools/plot.",
-            "Build": "Run bazel build //... in Bazel working directory.",
+            "Build": "Build the launched tools (or //..., see Settings) in the Bazel working directory; "
+            "click again to cancel.",
             "Procs": "Show tracked process status, PID, and runtime. (Ctrl+P)",
+            "Output": "Show the last lines printed by launched tools. (Ctrl+O)",
         }
         self.create_shared_action_buttons(main_frame)
         self.file_explorer_tab = FileExplorerTab(
@@ -65,6 +70,9 @@ class FoxgloveAppGUIManager:
         )
 
         self.file_explorer_tab.focus_file_explorer_tab = self.focus_file_explorer_tab
+        self.logic.add_process_exit_listener(
+            lambda record, returncode: self.root.after(0, lambda: self._on_process_exited(record, returncode))
+        )
 
         _bootstrap = SettingsManager(SETTINGS_FILE_PATH)
         if not _bootstrap.get("nas_dir"):
@@ -160,6 +168,9 @@ class FoxgloveAppGUIManager:
         self.av_plot_button = self._create_button(button_frame, "Plot", self.launch_av_plot_tool, state=tk.NORMAL)
         self.build_bazel_button = self._create_button(button_frame, "Build", self.run_bazel_build)
         self.show_process_status_button = self._create_button(button_frame, "Procs", self.show_process_status)
+        self.show_process_output_button = self._create_button(
+            button_frame, "Output", self.show_process_output, state=tk.NORMAL
+        )
 
         self._button_map = {
             "open_file": self.open_file_button,
@@ -234,18 +245,25 @@ class FoxgloveAppGUIManager:
 
     def run_bazel_build(self):
         if getattr(self, "_building", False):
-            self.log_message("Bazel build is already running.")
+            if self.logic.cancel_bazel_build():
+                self.log_message("Cancelling Bazel build...")
+                self.build_bazel_button.config(state=tk.DISABLED)
             return
 
-        self.log_message("Starting Bazel build (bazel build //...)...")
+        targets = " ".join(self.logic.bazel_build_targets(self.settings_tab.settings))
+        self.log_message(f"Starting Bazel build (bazel build {targets})...")
         self.status_label.config(foreground="red")
         self.show_progress(True)
         self._building = True
-        self.build_bazel_button.config(state=tk.DISABLED)
+        self._build_progress = ""
+        self.build_bazel_button.config(text="Cancel")
         self._show_building_status()
 
+        def on_progress(text):
+            self.root.after(0, lambda: setattr(self, "_build_progress", text))
+
         def build_task():
-            message, error = self.logic.run_bazel_build(self.settings_tab.settings)
+            message, error = self.logic.run_bazel_build(self.settings_tab.settings, on_progress=on_progress)
             self.root.after(0, lambda: self._bazel_build_complete(message, error))
 
         self._run_in_thread(build_task)
@@ -255,13 +273,14 @@ class FoxgloveAppGUIManager:
             return
 
         dots = "." * ((count % 3) + 1)
-        self.update_status_bar(f"Building{dots}", "")
+        progress = getattr(self, "_build_progress", "")
+        self.update_status_bar(f"Building{dots} {progress}".rstrip(), "")
 
         self.root.after(400, lambda: self._show_building_status(count + 1))
 
     def _bazel_build_complete(self, message, error):
         self._building = False
-        self.build_bazel_button.config(state=tk.NORMAL)
+        self.build_bazel_button.config(text="Build", state=tk.NORMAL)
         self.show_progress(False)
         self.status_label.config(foreground="")
         if message:
@@ -272,6 +291,11 @@ class FoxgloveAppGUIManager:
         else:
             self.update_status_bar("Build complete", "")
 
+    def _on_process_exited(self, record, returncode):
+        """Main-thread: reflect a launched tool exiting on its own (the exit itself is already logged)."""
+        self.file_explorer_tab.forget_process(record.id)
+        self.update_status_bar(f"{record.name} exited (code {returncode})")
+
     def show_process_status(self):
         self.log_message("📊 Current Process Status:", clear_first=False)
         status = self.logic.get_process_status()
@@ -283,18 +307,43 @@ class FoxgloveAppGUIManager:
 
             for proc in status["processes"]:
                 status_icon = "🟢" if proc["running"] else "🔴"
+                adopted = ", re-attached" if proc.get("adopted") else ""
                 self.log_message(
-                    f"   {status_icon} {proc['name']} (PID: {proc['pid']}) - Runtime: {proc['runtime_display']}"
+                    f"   {status_icon} {proc['name']} (PID: {proc['pid']}{adopted})"
+                    f" - Runtime: {proc['runtime_display']}"
+                )
+                usage = proc.get("usage")
+                if usage:
+                    self.log_message(
+                        f"      CPU {usage['cpu_percent']:.0f}% (peak {usage['peak_cpu_percent']:.0f}%)"
+                        f" · RSS {format_file_size(usage['rss_bytes'])}"
+                        f" (peak {format_file_size(usage['peak_rss_bytes'])})"
+                        f" · I/O read {format_file_size(usage['read_bytes'])}"
+                        f", written {format_file_size(usage['write_bytes'])}"
+                        f" · {usage['processes']} process(es)"
+                    )
+
+        launches = [entry for entry in self.logic.launch_metrics() if entry["ready_median"] is not None]
+        if launches:
+            self.log_message("   Launch latency (median / p90 of recent launches):")
+            for entry in launches:
+                self.log_message(
+                    f"      {entry['tool']}: ready {entry['ready_median']:.1f}s / {entry['ready_p90']:.1f}s"
+                    f" via {entry['probe']} · spawn {entry['spawn_median'] * 1000:.0f} ms"
+                    f" · {entry['launches']} launch(es)"
                 )
 
-        # Also show if process monitor is running
-        monitor_status = (
-            "🟢 Active"
-            if self.logic._process_monitor_thread and self.logic._process_monitor_thread.is_alive()
-            else "🔴 Inactive"
-        )
+        # Also show if the process supervisor is running, and how it learns about exits
+        supervisor = self.logic._supervisor
+        monitor_status = f"🟢 Active ({supervisor.backend})" if supervisor.is_alive() else "🔴 Inactive"
         self.log_message(f"   Process Monitor: {monitor_status}")
 
+    def show_process_output(self):
+        if self._process_output_viewer is not None and self._process_output_viewer.window.winfo_exists():
+            self._process_output_viewer.window.lift()
+            return
+        self._process_output_viewer = ProcessOutputViewer(self.root, self.logic.process_outputs, self.log_message)
+
     def on_closing(self):
         # Clean up symlink dir if it exists
         symlink_dir = "/tmp/selected_bags_symlinks"
@@ -307,6 +356,7 @@ class FoxgloveAppGUIManager:
         self.log_message("Terminating launched processes...", clear_first=True)
         termination_log = self.logic.terminate_all_processes()
         self.log_message(termination_log)
+        self.file_explorer_tab.event_loader.shutdown()
         self.root.destroy()
 
     def setup_signal_handlers(self):
@@ -331,6 +381,7 @@ class FoxgloveAppGUIManager:
 
         ctrl_shortcuts = [
             ("p", lambda e: self.show_process_status()),
+            ("o", lambda e: self.show_process_output()),
             ("f", lambda e: self.open_with_foxglove() if self.open_foxglove_button["state"] == tk.NORMAL else None),
             ("b", lambda e: self.open_with_bazel() if self.open_bazel_button["state"] == tk.NORMAL else None),
             ("m", if_explorer_active(self.open_in_file_manager)),
@@ -429,29 +480,7 @@ class FoxgloveAppGUIManager:
                 self.root.after_idle(tab_widget.focus_set)
             return
 
-        def _find_treeview(widget):
-            if isinstance(widget, ttk.Treeview):
-                return widget
-            for child in widget.winfo_children():
-                found = _find_treeview(child)
-                if found is not None:
-                    return found
-            return None
-
-        tree = _find_treeview(tab_widget)
-        if tree is not None:
-
-            def _focus_tree():
-                items = tree.get_children()
-                if items and not tree.selection():
-                    first_item = items[0]
-                    tree.selection_set(first_item)
-                    tree.focus(first_item)
-                    tree.see(first_item)
-                    tree.event_generate("<<TreeviewSelect>>")
-                tree.focus_set()
-
-            self.root.after_idle(_focus_tree)
+        if self.file_explorer_tab.focus_event_log_tab(tab_widget):
             return
 
         self.root.after_idle(tab_widget.focus_set)
@@ -519,6 +548,7 @@ class FoxgloveAppGUIManager:
                     ("Ctrl+B", "Play Bazel at selected event"),
                     ("Ctrl+C", "Play Bazel from start at selected event"),
                     ("Ctrl+L", "Show related MCAP"),
+                    ("Ctrl+S", "Export shown events"),
                     ("Ctrl+F4", "Close event viewer tab/window"),
                 ],
             ),
@@ -526,6 +556,7 @@ class FoxgloveAppGUIManager:
                 "Process Management",
                 [
                     ("Ctrl+P", "Show process status"),
+                    ("Ctrl+O", "Show launched tools' output"),
                 ],
             ),
             (
@@ -702,6 +733,7 @@ class FoxgloveAppGUIManager:
         self.av_plot_button.config(state=tk.NORMAL)
         self.build_bazel_button.config(state=tk.NORMAL)
         self.show_process_status_button.config(state=tk.NORMAL)
+        self.show_process_output_button.config(state=tk.NORMAL)
 
         if current_tab_index == self._explorer_tab_index:
             self.file_explorer_tab.on_explorer_select(None, suppress_log=True)
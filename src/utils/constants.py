@@ -17,6 +17,9 @@ DEFAULT_BAZEL_WORKING_DIR = os.path.expanduser("~/av-system/catkin_ws/src")
 DEFAULT_LOGGING_DIR = f"/media/{getpass.getuser()}/LOGGING"
 SYMLINK_DIR = "/tmp/selected_bags_symlinks"
 SETTINGS_FILE_PATH = os.path.expanduser("~/.foxglove_gui_settings.json")
+LAUNCH_METRICS_FILE_PATH = os.path.expanduser("~/.traige_gui/launch_metrics.json")
+BAZEL_BUILD_STAMPS_PATH = os.path.expanduser("~/.traige_gui/bazel_build_stamps.json")
+PROCESS_STATE_FILE_PATH = os.path.expanduser("~/.traige_gui/processes.json")
 
 # ============================================================================
 # DEFAULT SETTINGS
@@ -30,11 +33,17 @@ DEFAULT_SETTINGS = {
     "logging_dir": DEFAULT_LOGGING_DIR,
     "max_foxglove_files": 50,
     "bazel_bag_gui_rate": 1.0,
+    "exec_prebuilt_bazel_tools": True,
+    "build_tool_targets_only": True,
+    "bazel_build_targets": "//tools/viz //tools/bag:gui //tools/topic:gui //tools/plot",
     "open_foxglove_in_browser": True,
     "single_instance_video": True,
+    "prewarm_mpv": False,
     "single_instance_rosbag": True,
     "auto_open_event_log_for_tg": True,
     "event_log_viewer_as_tab": True,
+    "merged_timeline_for_tg": True,
+    "prefetch_event_logs": False,
 }
 
 # ============================================================================
@@ -84,9 +93,24 @@ DEFAULT_FILE_ICON = "📄"
 # PERFORMANCE LIMITS
 # ============================================================================
 FILE_INFO_CACHE_SIZE_LIMIT = 1000
-PROCESS_MONITOR_INTERVAL = 10  # seconds
+PROCESS_MONITOR_INTERVAL = 10  # seconds; exit polling only where pidfd and SIGCHLD are unavailable
 LONG_RUNNING_PROCESS_THRESHOLD = 7200  # 2 hours in seconds
 PROCESS_SHUTDOWN_TIMEOUT = 2  # seconds
+PROCESS_TERMINATE_TIMEOUT = 3  # seconds stopped tools get to exit after SIGTERM, shared by all of them
+PROCESS_KILL_TIMEOUT = 2  # seconds to wait for tools still running after SIGKILL
+PROCESS_SAMPLE_INTERVAL = 2  # seconds between /proc samples of launched tools
+PROCESS_SAMPLE_HISTORY = 300  # samples kept per process (10 minutes)
+PROCESS_OUTPUT_LINES = 2000  # output lines kept in memory per launched process
+PROCESS_OUTPUT_MAX_BYTES = 1024 * 1024  # spill file size before rotating to <file>.1
+PROCESS_OUTPUT_POLL_INTERVAL = 0.1  # seconds between reads of the running tools' output files
+PROCESS_OUTPUT_KEEP = 20  # captured outputs (and spill files) kept after their process exits
+LAUNCH_READY_TIMEOUT = 120  # seconds a launched tool may take to show its window / answer before giving up
+LAUNCH_READY_POLL_INTERVAL = 0.1  # seconds between window / IPC readiness checks
+LAUNCH_METRICS_RECENT = 100  # latest launch durations kept per tool (for median / p90)
+BAZEL_RESOLVE_TIMEOUT = 300  # seconds for bazel info / cquery when resolving a tool's prebuilt binary
+BAZEL_SOURCES_CHECK_INTERVAL = 10.0  # seconds between git checks of workspaces with cached prebuilt binaries
+BAZEL_BUILD_TIMEOUT = 600  # seconds before the Build button's bazel build is killed
+BAZEL_BUILD_PROGRESS_INTERVAL = 1.0  # seconds between build progress updates sent to the UI
 
 # ============================================================================
 # FOXGLOVE CONSTANTS
@@ -44,11 +44,17 @@ _SETTINGS_SCHEMA: Dict[str, Any] = {
     "logging_dir": {"type": str, "required": False, "is_path": True},
     "max_foxglove_files": {"type": int, "required": False, "min_val": 1, "max_val": 1000},
     "bazel_bag_gui_rate": {"type": float, "required": False, "min_val": 0.01},
+    "exec_prebuilt_bazel_tools": {"type": bool, "required": False},
+    "build_tool_targets_only": {"type": bool, "required": False},
+    "bazel_build_targets": {"type": str, "required": False},
     "open_foxglove_in_browser": {"type": bool, "required": False},
     "single_instance_video": {"type": bool, "required": False},
+    "prewarm_mpv": {"type": bool, "required": False},
     "single_instance_rosbag": {"type": bool, "required": False},
     "auto_open_event_log_for_tg": {"type": bool, "required": False},
     "event_log_viewer_as_tab": {"type": bool, "required": False},
+    "merged_timeline_for_tg": {"type": bool, "required": False},
+    "prefetch_event_logs": {"type": bool, "required": False},
 }
 
 
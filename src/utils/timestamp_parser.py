@@ -0,0 +1,275 @@
+"""Compiled timestamp parsing for event logs, MCAP and video filenames.
+
+:func:`parse_datetime` accepts exactly the strings that trying
+:data:`TIMESTAMP_FORMATS` in order with :func:`datetime.strptime` would
+accept, and returns the same value, but without the per-miss ``ValueError``
+cost of ``strptime``:
+
+* Each format is compiled once into the same regular expression ``strptime``
+  builds for it, and matched fields are turned into integers directly.
+* Strings are grouped into *families* by their shape (every digit replaced by
+  ``9``, e.g. ``9999-99-99 99:99:99``).  The first time a family is seen, the
+  formats that cannot possibly match it are ruled out and the remaining
+  candidates are cached, so a whole column or directory of filenames is
+  usually parsed against a single format.
+
+:meth:`TimestampParser.parse_column` converts a column of values to epoch
+seconds in one pass.  Epoch values are *naive seconds*: the wall-clock time
+is treated as if it were UTC, so they order and subtract exactly like the
+naive datetimes returned by :func:`parse_datetime` and convert back with
+:func:`epoch_to_datetime`.
+"""
+
+import re
+from array import array
+from datetime import date, datetime, timedelta
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+#: Timestamp format strings tried in order during parsing.
+TIMESTAMP_FORMATS: List[str] = [
+    "%Y-%m-%d %H:%M:%S",  # 2025-09-19 10:50:50
+    "%Y-%m-%d-%H-%M-%S",  # 2025-12-16-08-55-17  (MCAP filename format)
+    "%Y%m%d_%H%M%S",  # 20250919_093523
+    "%Y-%m-%d_%H-%M-%S",  # 2025-09-19_09-35-23
+    "%Y%m%d%H%M%S",  # 20250919093523
+    "%H:%M:%S",  # 09:35:23  (time-only — assumes today's date)
+    "%Y-%m-%d %H:%M:%S.%f",  # 2025-09-19 09:35:23.123456
+    "%Y%m%d%H%M%S%f",  # 20250919093523123456  (with microseconds)
+]
+
+# Field patterns as used by ``_strptime.TimeRE`` (exact) and a looser form
+# accepting every string of the same shape (used to rule formats out).
+_DIRECTIVES: Dict[str, Tuple[str, str]] = {
+    "Y": (r"(\d\d\d\d)", r"\d{4}"),
+    "m": (r"(1[0-2]|0[1-9]|[1-9])", r"\d{1,2}"),
+    "d": (r"(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])", r"(?:\d{1,2}| \d)"),
+    "H": (r"(2[0-3]|[0-1]\d|\d)", r"\d{1,2}"),
+    "M": (r"([0-5]\d|\d)", r"\d{1,2}"),
+    "S": (r"(6[0-1]|[0-5]\d|\d)", r"\d{1,2}"),
+    "f": (r"([0-9]{1,6})", r"\d{1,6}"),
+}
+
+#: Canonical field order and the value ``strptime`` assumes for a missing field.
+_FIELD_ORDER = "YmdHMSf"
+_FIELD_DEFAULTS = ("1900", "1", "1", "0", "0", "0", "")
+
+_SHAPE_TABLE = str.maketrans("0123456789", "9999999999")
+_FAMILY_CACHE_LIMIT = 1024
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+_NAN = float("nan")
+
+
+def normalize_timestamp_str(timestamp_str: str) -> str:
+    """Pre-process a raw timestamp string before format-matching.
+
+    Handles MCAP filename prefixes (``PSA8411_2025-12-16-08-55-17_0`` → middle
+    part extracted) and trailing millisecond tokens (``2025-09-19 10:50:50 430``).
+    """
+    # Handle MCAP filename format: PREFIX_TIMESTAMP_SUFFIX
+    if "_" in timestamp_str and timestamp_str.count("_") >= 2:
+        parts = timestamp_str.split("_")
+        if len(parts) >= 3:
+            potential_ts = parts[1]
+            if "-" in potential_ts and len(potential_ts) >= 10:
+                return potential_ts
+
+    # Handle "2025-09-19 10:50:50 430" (trailing millisecond token)
+    tokens = timestamp_str.split()
+    if len(tokens) == 3:
+        return f"{tokens[0]} {tokens[1]}"
+
+    return timestamp_str
+
+
+def epoch_to_datetime(epoch: float) -> datetime:
+    """Inverse of the naive-seconds epoch produced by :class:`TimestampParser`."""
+    return _EPOCH + timedelta(microseconds=round(epoch * 1_000_000))
+
+
+def datetime_to_epoch(value: datetime) -> float:
+    """Naive seconds of *value* (its wall-clock time read as UTC)."""
+    return (value.replace(tzinfo=None) - _EPOCH).total_seconds()
+
+
+class _CompiledFormat:
+    """One ``strptime`` format compiled to a regex plus field positions."""
+
+    __slots__ = ("fmt", "regex", "shape_regex", "time_only", "_pick")
+
+    def __init__(self, fmt: str) -> None:
+        exact: List[str] = []
+        loose: List[str] = []
+        fields: List[str] = []
+        i = 0
+        while i < len(fmt):
+            char = fmt[i]
+            if char == "%":
+                directive = fmt[i + 1 : i + 2]
+                if directive not in _DIRECTIVES:
+                    raise ValueError(f"Unsupported directive %{directive} in timestamp format {fmt!r}")
+                exact.append(_DIRECTIVES[directive][0])
+                loose.append(_DIRECTIVES[directive][1])
+                fields.append(directive)
+                i += 2
+                continue
+            # strptime turns any run of whitespace in the format into \s+.
+            if char.isspace():
+                while i < len(fmt) and fmt[i].isspace():
+                    i += 1
+                exact.append(r"\s+")
+                loose.append(r"\s+")
+                continue
+            exact.append(re.escape(char))
+            loose.append(re.escape(char))
+            i += 1
+
+        self.fmt = fmt
+        self.regex = re.compile("".join(exact), re.IGNORECASE)
+        self.shape_regex = re.compile("".join(loose))
+        self.time_only = not {"Y", "m", "d"} & set(fields)
+        # Picks the canonical fields out of ``groups + _FIELD_DEFAULTS``.
+        self._pick = itemgetter(
+            *(fields.index(f) if f in fields else len(fields) + i for i, f in enumerate(_FIELD_ORDER))
+        )
+
+    def match_fields(self, text: str) -> Optional[Tuple[str, ...]]:
+        """``(Y, m, d, H, M, S, f)`` strings of *text*, or ``None`` if ``strptime`` would reject its layout."""
+        found = self.regex.match(text)
+        # Like strptime: take the first match and reject unconverted trailing data.
+        if found is None or found.end() != len(text):
+            return None
+        return self._pick(found.groups() + _FIELD_DEFAULTS)
+
+
+def _fraction(value: str) -> int:
+    return int(value + "0" * (6 - len(value))) if value else 0
+
+
+class TimestampParser:
+    """Parse timestamps in any of *formats* (tried in order, like ``strptime``).
+
+    Thread-safe: the only shared state is the family and date caches, whose
+    entries are immutable and may be recomputed harmlessly by concurrent callers.
+    """
+
+    def __init__(self, formats: Sequence[str] = TIMESTAMP_FORMATS) -> None:
+        self._formats = tuple(_CompiledFormat(fmt) for fmt in formats)
+        self._families: Dict[str, Tuple[_CompiledFormat, ...]] = {}
+        self._ordinals: Dict[Tuple[str, str, str], Optional[int]] = {}
+
+    @property
+    def formats(self) -> Tuple[str, ...]:
+        return tuple(f.fmt for f in self._formats)
+
+    def _candidates(self, text: str) -> Tuple[_CompiledFormat, ...]:
+        shape = text.translate(_SHAPE_TABLE)
+        candidates = self._families.get(shape)
+        if candidates is None:
+            candidates = tuple(f for f in self._formats if f.shape_regex.fullmatch(shape))
+            if len(self._families) >= _FAMILY_CACHE_LIMIT:
+                self._families.clear()
+            self._families[shape] = candidates
+        return candidates
+
+    def detect_format(self, text: str) -> Optional[str]:
+        """Return the first format that parses *text* (already normalised), if any."""
+        for compiled in self._candidates(text):
+            fields = compiled.match_fields(text)
+            if fields is not None and self._to_datetime(compiled, fields) is not None:
+                return compiled.fmt
+        return None
+
+    def parse(self, text: str) -> Optional[datetime]:
+        """Parse *text* (already normalised) to a naive datetime, or ``None``."""
+        for compiled in self._candidates(text):
+            fields = compiled.match_fields(text)
+            if fields is not None:
+                value = self._to_datetime(compiled, fields)
+                if value is not None:
+                    return value
+        return None
+
+    def parse_epoch(self, text: str) -> Optional[float]:
+        """Parse *text* (already normalised) to naive epoch seconds, or ``None``."""
+        for compiled in self._candidates(text):
+            fields = compiled.match_fields(text)
+            if fields is not None:
+                value = self._to_epoch(compiled, fields)
+                if value is not None:
+                    return value
+        return None
+
+    def parse_column(self, values: Iterable[object], normalize: bool = True) -> "array[float]":
+        """Parse every value to naive epoch seconds; unparseable values become NaN."""
+        result = array("d")
+        append = result.append
+        parse_epoch = self.parse_epoch
+        for value in values:
+            text = value if isinstance(value, str) else str(value)
+            text = text.strip()
+            if normalize:
+                text = normalize_timestamp_str(text)
+            epoch = parse_epoch(text)
+            append(_NAN if epoch is None else epoch)
+        return result
+
+    @staticmethod
+    def _to_datetime(compiled: _CompiledFormat, fields: Tuple[str, ...]) -> Optional[datetime]:
+        year, month, day, hour, minute, second, fraction = fields
+        try:
+            if compiled.time_only:
+                today = date.today()
+                return datetime(today.year, today.month, today.day, int(hour), int(minute), int(second))
+            return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second), _fraction(fraction))
+        except ValueError:
+            return None
+
+    def _ordinal(self, year: str, month: str, day: str) -> Optional[int]:
+        key = (year, month, day)
+        try:
+            return self._ordinals[key]
+        except KeyError:
+            pass
+        try:
+            ordinal: Optional[int] = date(int(year), int(month), int(day)).toordinal()
+        except ValueError:
+            ordinal = None
+        if len(self._ordinals) >= _FAMILY_CACHE_LIMIT:
+            self._ordinals.clear()
+        self._ordinals[key] = ordinal
+        return ordinal
+
+    def _to_epoch(self, compiled: _CompiledFormat, fields: Tuple[str, ...]) -> Optional[float]:
+        year, month, day, hour, minute, second, fraction = fields
+        if compiled.time_only:
+            ordinal: Optional[int] = date.today().toordinal()
+        else:
+            ordinal = self._ordinal(year, month, day)
+        sec = int(second)
+        if ordinal is None or sec > 59:
+            return None
+        seconds = (ordinal - _EPOCH_ORDINAL) * 86400 + int(hour) * 3600 + int(minute) * 60 + sec
+        return seconds + _fraction(fraction) / 1_000_000 if fraction else float(seconds)
+
+
+#: Shared parser for :data:`TIMESTAMP_FORMATS`; its family cache is reused by every caller.
+TIMESTAMP_PARSER = TimestampParser()
+
+
+def parse_datetime(timestamp_str: object) -> Optional[datetime]:
+    """Normalise and parse *timestamp_str* with :data:`TIMESTAMP_FORMATS`; ``None`` on failure."""
+    text = timestamp_str if isinstance(timestamp_str, str) else str(timestamp_str)
+    return TIMESTAMP_PARSER.parse(normalize_timestamp_str(text.strip()))
+
+
+def parse_epoch(timestamp_str: object) -> Optional[float]:
+    """Like :func:`parse_datetime` but returns naive epoch seconds."""
+    text = timestamp_str if isinstance(timestamp_str, str) else str(timestamp_str)
+    return TIMESTAMP_PARSER.parse_epoch(normalize_timestamp_str(text.strip()))
+
+
+def parse_epoch_column(values: Iterable[object]) -> "array[float]":
+    """Parse a whole column to naive epoch seconds (NaN where unparseable)."""
+    return TIMESTAMP_PARSER.parse_column(values)
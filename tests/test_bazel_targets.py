@@ -0,0 +1,180 @@
+import os
+import threading
+import time
+
+import pytest
+
+import src.logic.bazel_targets as bazel_targets
+from src.logic.bazel_targets import BazelRunCommand, BazelTargetResolver, PrebuiltTool, parse_bazel_run
+
+
+@pytest.mark.parametrize(
+    "command, expected",
+    [
+        ("bazel run //tools/viz", BazelRunCommand((), "//tools/viz", ())),
+        (
+            "bazel run --config=opt //tools/bag:gui -- --rate=2 'a b.mcap'",
+            BazelRunCommand(("--config=opt",), "//tools/bag:gui", ("--rate=2", "a b.mcap")),
+        ),
+        (["bazel", "run", "//tools/viz", "--", "--x"], BazelRunCommand((), "//tools/viz", ("--x",))),
+        ("bazel run //tools/viz -- --rate 2", BazelRunCommand((), "//tools/viz", ("--rate", "2"))),
+        ("bazel run -c opt //tools/viz", None),  # "opt" would look like a second target
+        ("bazel run", None),
+        ("bazel build //tools/viz", None),
+        ("bazel run //tools/viz && echo done", None),
+        ("bazel run //tools/viz | tee out.log", None),
+        ("bazel run '//tools/viz", None),  # unbalanced quote
+        ("./viz --rate=2", None),
+        ("", None),
+    ],
+)
+def test_parse_bazel_run(command, expected):
+    assert parse_bazel_run(command) == expected
+
+
+class FakeResolver(BazelTargetResolver):
+    """Resolves every target to *binary* instead of asking Bazel."""
+
+    def __init__(self, binary, **kwargs):
+        super().__init__(**kwargs)
+        self.binary = binary
+        self.resolved = []
+
+    def resolve(self, workspace, run, fingerprint=""):
+        self.resolved.append(run.target)
+        return PrebuiltTool(self.binary, workspace, {}, fingerprint)
+
+
+@pytest.fixture
+def sources(monkeypatch):
+    """The workspace's fingerprint, settable by the test; counts calls and the threads they ran on."""
+
+    class Sources:
+        fingerprint = "v1"
+        threads = []
+
+    def fingerprint(workspace, targets):
+        Sources.threads.append(threading.current_thread())
+        return Sources.fingerprint
+
+    monkeypatch.setattr(bazel_targets, "source_fingerprint", fingerprint)
+    return Sources
+
+
+@pytest.fixture
+def binary(tmp_path):
+    path = tmp_path / "viz"
+    path.write_text("#!/bin/sh\n")
+    path.chmod(0o755)
+    return str(path)
+
+
+RUN = BazelRunCommand((), "//tools/viz", ())
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def resolved(resolver, workspace, run=RUN):
+    resolver.resolve_async(workspace, run)
+    wait_until(lambda: not resolver._resolving)
+    return resolver.lookup(workspace, run)
+
+
+def test_lookup_never_fingerprints_on_the_calling_thread(sources, binary, tmp_path):
+    resolver = FakeResolver(binary, check_interval=3600)
+    workspace = str(tmp_path)
+    assert resolver.lookup(workspace, RUN) is None
+    tool = resolved(resolver, workspace)
+    assert tool is not None and (tool.binary, tool.fingerprint) == (binary, "v1")
+    for _ in range(3):
+        assert resolver.lookup(workspace, RUN) is tool
+    assert sources.threads and threading.current_thread() not in sources.threads
+    assert resolver.resolved == ["//tools/viz"]
+
+
+def test_background_check_drops_binaries_of_changed_sources(sources, binary, tmp_path):
+    resolver = FakeResolver(binary, check_interval=0.01)
+    workspace = str(tmp_path)
+    assert resolved(resolver, workspace) is not None
+    sources.fingerprint = "v2"  # an edit
+    wait_until(lambda: resolver.lookup(workspace, RUN) is None)
+    assert resolver.lookup(workspace, RUN) is None  # stays forgotten until resolved again
+    tool = resolved(resolver, workspace)
+    assert tool is not None and tool.fingerprint == "v2"
+
+
+def test_checks_stop_once_nothing_is_cached(sources, binary, tmp_path):
+    resolver = FakeResolver(binary, check_interval=0.01)
+    assert resolved(resolver, str(tmp_path)) is not None
+    checker = resolver._checker
+    assert checker is not None and checker.is_alive()
+    resolver.invalidate()
+    checker.join(5)
+    assert not checker.is_alive() and resolver._checker is None
+
+
+def test_outside_git_nothing_is_resolved(sources, binary, tmp_path):
+    sources.fingerprint = None
+    resolver = FakeResolver(binary, check_interval=3600)
+    assert resolved(resolver, str(tmp_path)) is None
+    assert resolver.resolved == []
+
+
+def test_missing_binary_is_forgotten(sources, binary, tmp_path):
+    resolver = FakeResolver(binary, check_interval=3600)
+    workspace = str(tmp_path)
+    assert resolved(resolver, workspace) is not None
+    os.remove(binary)
+    assert resolver.lookup(workspace, RUN) is None
+    assert resolver._tools == {}
+
+
+def test_forget_and_invalidate(sources, binary, tmp_path):
+    resolver = FakeResolver(binary, check_interval=3600)
+    workspace = str(tmp_path)
+    other = BazelRunCommand(("--config=opt",), "//tools/viz", ())  # same target, other options: another binary
+    assert resolved(resolver, workspace) is not None
+    assert resolved(resolver, os.path.join(workspace, "."), other) is not None
+
+    resolver.forget(workspace, RUN)
+    assert resolver.lookup(workspace, RUN) is None
+    assert resolver.lookup(workspace, other) is not None
+
+    resolver.invalidate()
+    assert resolver.lookup(workspace, other) is None
+
+
+def test_invalidate_discards_resolutions_in_flight(sources, binary, tmp_path):
+    started, release = threading.Event(), threading.Event()
+
+    class SlowResolver(FakeResolver):
+        def resolve(self, workspace, run, fingerprint=""):
+            started.set()
+            release.wait(5)
+            return super().resolve(workspace, run, fingerprint)
+
+    resolver = SlowResolver(binary, check_interval=3600)
+    workspace = str(tmp_path)
+    resolver.resolve_async(workspace, RUN)
+    assert started.wait(5)
+    resolver.invalidate()  # e.g. a build started: the binary being resolved may be replaced
+    release.set()
+    wait_until(lambda: not resolver._resolving)
+    assert resolver.lookup(workspace, RUN) is None
+
+
+def test_refresh_resolves_known_targets_again(sources, binary, tmp_path):
+    resolver = FakeResolver(binary, check_interval=3600)
+    workspace = str(tmp_path)
+    assert resolved(resolver, workspace) is not None
+    sources.fingerprint = "v2"  # a build changed the sources' state
+    resolver.refresh()
+    wait_until(lambda: not resolver._resolving)
+    tool = resolver.lookup(workspace, RUN)
+    assert tool is not None and tool.fingerprint == "v2"
+    assert resolver.resolved == ["//tools/viz", "//tools/viz"]
@@ -0,0 +1,137 @@
+import csv
+import json
+import math
+
+import pytest
+
+import src.logic.event_export as event_export
+from src.logic.event_export import COLUMNAR_MAGIC, ExportCancelled, export_events, export_format, read_columnar
+from src.logic.event_store import EVENT_COLUMNS, EventStore
+
+TRICKY = [
+    'comma, "quoted" text',
+    "line one\nline two\r\nline three",
+    "tab\there and a back\\slash\\t",
+    "unicode: café ✓",
+    "",
+]
+
+ROWS = [
+    (f"2025-09-19 10:00:{i:02d}", str(100 + i), TRICKY[i % len(TRICKY)] + f" #{i}", "HIGH" if i % 3 else "LOW", "AUTO")
+    for i in range(20)
+] + [("not a time", "x", "Unparsed, row", "LOW", "MANUAL")]
+
+FILTER = [0, 1, 2, 3, 4, 7, 19, 20]
+
+
+@pytest.fixture
+def store():
+    store = EventStore(ROWS, "events.txt")
+    store.build_time_index()
+    return store
+
+
+def read_csv(path):
+    with open(path, encoding="utf-8", newline="") as fh:
+        return [tuple(record) for record in csv.reader(fh)]
+
+
+def read_jsonl(path):
+    with open(path, encoding="utf-8") as fh:
+        return [json.loads(line) for line in fh]
+
+
+def test_csv_round_trip(store, tmp_path):
+    path = str(tmp_path / "out.csv")
+    assert export_events(store, FILTER, path) == len(FILTER)
+    records = read_csv(path)
+    assert records[0] == EVENT_COLUMNS
+    assert records[1:] == [ROWS[i] for i in FILTER]
+
+
+def test_jsonl_round_trip(store, tmp_path):
+    path = str(tmp_path / "out.jsonl")
+    assert export_events(store, FILTER, path) == len(FILTER)
+    assert read_jsonl(path) == [dict(zip(EVENT_COLUMNS, ROWS[i])) for i in FILTER]
+
+
+def test_jsonl_pads_short_rows(tmp_path):
+    path = str(tmp_path / "out.jsonl")
+    export_events(EventStore([("2025-09-19 10:00:00", "1")]), [0], path)
+    assert read_jsonl(path) == [dict(zip(EVENT_COLUMNS, ("2025-09-19 10:00:00", "1", "", "", "")))]
+
+
+def test_columnar_round_trip(store, tmp_path):
+    path = str(tmp_path / "out.evcol")
+    assert export_events(store, FILTER, path) == len(FILTER)
+    column_ids, rows, epochs = read_columnar(path)
+    assert column_ids == list(EVENT_COLUMNS)
+    assert rows == [ROWS[i] for i in FILTER]
+    assert list(epochs[:-1]) == [store.time_index.epoch(i) for i in FILTER[:-1]]
+    assert math.isnan(epochs[-1])
+
+
+def test_columnar_escapes_tabs_in_text_chunks(tmp_path):
+    # Enough distinct values that the column is stored as text, not as categories.
+    rows = [("2025-09-19 10:00:00", str(i), f"value {i}\twith tab \\t and \\\\", "LOW", "AUTO") for i in range(300)]
+    path = str(tmp_path / "out.evcol")
+    export_events(EventStore(rows), range(300), path)
+    column_ids, read_rows, epochs = read_columnar(path)
+    assert read_rows == rows
+    assert epochs is None  # no time index built
+
+
+def test_columnar_files_without_tabs_are_unchanged(store, tmp_path):
+    path = str(tmp_path / "out.evcol")
+    export_events(EventStore([r for r in ROWS if "\t" not in r[2]]), range(5), path)
+    with open(path, "rb") as fh:
+        assert b'"escaped"' not in fh.read()
+
+
+def test_multiple_row_groups(store, tmp_path, monkeypatch):
+    monkeypatch.setattr(event_export, "EXPORT_CHUNK_ROWS", 3)
+    progress = []
+    for extension in (".csv", ".jsonl", ".evcol"):
+        path = str(tmp_path / f"out{extension}")
+        progress.clear()
+        rows = range(8) if extension == ".csv" else FILTER  # both ways rows are chunked
+        export_events(store, rows, path, lambda done, total: progress.append((done, total)))
+        assert progress == [(3, 8), (6, 8), (8, 8)]
+    assert read_columnar(str(tmp_path / "out.evcol"))[1] == [ROWS[i] for i in FILTER]
+    assert read_csv(str(tmp_path / "out.csv"))[1:] == ROWS[:8]
+
+
+@pytest.mark.parametrize("extension", [".csv", ".jsonl", ".evcol"])
+def test_empty_selection(store, tmp_path, extension):
+    path = str(tmp_path / f"out{extension}")
+    assert export_events(store, [], path) == 0
+    if extension == ".csv":
+        assert read_csv(path) == [EVENT_COLUMNS]
+    elif extension == ".jsonl":
+        assert read_jsonl(path) == []
+    else:
+        column_ids, rows, epochs = read_columnar(path)
+        assert (column_ids, rows, list(epochs)) == (list(EVENT_COLUMNS), [], [])
+
+
+def test_cancel_leaves_partial_file(store, tmp_path, monkeypatch):
+    monkeypatch.setattr(event_export, "EXPORT_CHUNK_ROWS", 2)
+    path = str(tmp_path / "out.csv")
+    with pytest.raises(ExportCancelled):
+        export_events(store, range(len(ROWS)), path, should_cancel=lambda: True)
+    assert len(read_csv(path)) == 3  # header and the first chunk
+
+
+def test_export_format():
+    assert export_format("/tmp/A.CSV") == ".csv"
+    assert export_format("x.jsonl") == ".jsonl"
+    assert export_format("x.evcol") == ".evcol"
+    with pytest.raises(ValueError):
+        export_format("x.parquet")
+
+
+def test_read_columnar_rejects_other_files(tmp_path):
+    path = tmp_path / "out.evcol"
+    path.write_bytes(b"PAR1" + COLUMNAR_MAGIC)
+    with pytest.raises(ValueError):
+        read_columnar(str(path))
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from src.logic.event_index import EventSearchIndex, event_search_text
+
+ROWS = [
+    ("2025-09-19 10:50:50", "1726743050", "Brake pedal pressed", "HIGH", "AUTO"),
+    ("2025-09-19 10:51:02", "1726743062", "Lane change left", "LOW", "MANUAL"),
+    ("2025-09-19 10:52:13", "1726743133", "Brake light fault", "MEDIUM", "AUTO"),
+    ("2025-09-19 10:53:00", "1726743180", "Takeover request", "HIGH", "AUTO"),
+    ("2025-09-19 10:54:40", "1726743280", "lane keep assist off", "LOW", "MANUAL"),
+]
+
+
+def linear_search(rows, text):
+    query = text.lower().strip()
+    return [i for i, row in enumerate(rows) if query in event_search_text(row)]
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["", "  ", "brake", "BRAKE", "ake", "lane", "lane change", "change lane", "high auto", "10:5", "auto 2025", "zzz"],
+)
+def test_search_matches_linear_scan(query):
+    assert EventSearchIndex(ROWS).search(query) == linear_search(ROWS, query)
+
+
+def test_narrowing_queries_reuse_previous_result():
+    index = EventSearchIndex(ROWS)
+    for query in ["b", "br", "bra", "brake", "brake ", "brake p", "brake pedal", "brake", "l"]:
+        assert index.search(query) == linear_search(ROWS, query)
+
+
+def test_random_rows_and_queries_match_linear_scan():
+    rng = random.Random(7)
+    words = ["alpha", "beta", "gamma", "delta", "AB", "ba", "a-b", "x1", "10:05"]
+    rows = [tuple(" ".join(rng.choices(words, k=rng.randint(1, 3))) for _ in range(3)) for _ in range(300)]
+    index = EventSearchIndex(rows)
+    for _ in range(500):
+        text = " ".join(rng.choice(words)[: rng.randint(1, 5)] for _ in range(rng.randint(1, 3)))
+        assert index.search(text) == linear_search(rows, text), text
+
+
+def test_vocabulary_is_lower_cased_tokens():
+    index = EventSearchIndex([("Foo BAR", "foo")])
+    assert len(index) == 1
+    assert index.vocabulary_size == 2
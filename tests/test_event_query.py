@@ -0,0 +1,125 @@
+import pytest
+
+from src.logic.event_query import QuerySyntaxError, compile_query, is_structured_query
+from src.logic.event_store import EventStore
+
+ROWS = [
+    ("2025-09-19 10:00:05", "100", "Brake pedal pressed", "HIGH", "AUTO"),
+    ("2025-09-19 10:05:00", "250", "Lane change left", "LOW", "MANUAL"),
+    ("2025-09-19 10:05:59", "99", "Brake light fault", "MEDIUM", "AUTO"),
+    ("2025-09-19 10:06:00", "1000", "Takeover request", "CRITICAL", "AUTO"),
+    ("2025-09-19 10:31:00", "abc", "test drive start", "LOW", "MANUAL"),
+    ("garbage", "7", "Unparsed time", "HIGH", "AUTO"),
+]
+
+
+@pytest.fixture
+def store():
+    store = EventStore(ROWS, "events.txt")
+    store.build_time_index()
+    return store
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("crit = high", [0, 5]),
+        ("CRITICALITY = HIGH", [0, 5]),
+        ("crit != high", [1, 2, 3, 4]),
+        ("crit = high and mode = auto", [0, 5]),
+        ("crit = high mode = auto", [0, 5]),
+        ("crit = low or crit = critical", [1, 3, 4]),
+        ("(crit = high or crit = critical) and not desc ~ brake", [3, 5]),
+        ("not (mode = auto)", [1, 4]),
+        ("desc contains brake", [0, 2]),
+        ('desc ~ "test drive"', [4]),
+        ("desc ~ brake and light", [2]),
+        ("mode = auto brake", [0, 2]),
+        ("ts > 99", [0, 1, 3, 4]),
+        ("ts >= 100 and ts < 1000", [0, 1]),
+        ("ts between 99 and 250", [0, 1, 2]),
+        ("time = 10:05", [1, 2]),
+        ("time = 10:05:00", [1]),
+        ("time < 10:05", [0]),
+        ("time <= 10:05", [0, 1, 2]),
+        ("time > 10:05", [3, 4]),
+        ("time >= 10:06", [3, 4]),
+        ("time != 10:05", [0, 3, 4, 5]),
+        ("between 10:00 and 10:05", [0, 1, 2]),
+        ("time between 10:05:00 and 10:06:00", [1, 2, 3]),
+        ('time >= "2025-09-19 10:30:00"', [4]),
+        ("between 10:00 and 10:30 and crit = high", [0]),
+    ],
+)
+def test_query_results(store, query, expected):
+    assert list(store.query(query)) == expected
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["crit = high", "desc contains x", "time between 10:00 and 11:00", "between 10:00 and 11:00", "(mode != auto)"],
+)
+def test_structured_queries_are_detected(query):
+    assert is_structured_query(query)
+
+
+@pytest.mark.parametrize("query", ["brake", "lane change", "high", "between us", "10:05"])
+def test_plain_searches_are_not_structured(query):
+    assert not is_structured_query(query)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "colour = red",
+        "crit =",
+        "(crit = high",
+        "crit = high)",
+        "between 10:00 10:30",
+        "time = nonsense",
+        "crit = high or",
+        'desc ~ "unterminated',
+    ],
+)
+def test_syntax_errors(store, query):
+    with pytest.raises(QuerySyntaxError):
+        store.query(query)
+
+
+def test_time_clause_needs_the_time_index():
+    with pytest.raises(QuerySyntaxError):
+        EventStore(ROWS).query("time > 10:00")
+
+
+def test_compiled_queries_are_cached():
+    assert compile_query("crit = high") is compile_query("crit = high")
+
+
+def test_high_cardinality_columns_match_brute_force():
+    rows = [
+        (
+            f"2025-09-19 10:{i // 60:02d}:{i % 60:02d}",
+            str(i),
+            f"event {i} {'brake' if i % 7 == 0 else 'lane'}",
+            "LOW",
+            "AUTO",
+        )
+        for i in range(600)
+    ]
+    store = EventStore(rows)
+    store.build_time_index()
+    assert list(store.query("desc ~ brake")) == [i for i in range(600) if i % 7 == 0]
+    assert list(store.query("desc = 'event 14 brake'")) == [14]
+    assert list(store.query("ts >= 590")) == list(range(590, 600))
+    assert list(store.query("desc ~ brake and ts < 30")) == [0, 7, 14, 21, 28]
+
+
+@pytest.mark.parametrize("word", ["brake", "Brake", "BRAKE", " bRaKe "])
+def test_free_text_is_case_insensitive_on_sparse_and_dense_paths(word):
+    rows = [("2025-09-19 10:00:00", str(i), f"event {i}", "LOW", "AUTO") for i in range(100)]
+    rows[3] = ("2025-09-19 10:00:00", "3", "Brake pedal pressed", "HIGH", "AUTO")
+    rows[50] = ("2025-09-19 10:00:00", "50", "brake light", "LOW", "AUTO")
+    store = EventStore(rows)
+    assert list(store.query(f"crit = high and {word}")) == [3]  # one row in play: checked row by row
+    assert list(store.query(f"crit = low and {word}")) == [50]  # most rows in play: search index
+    assert list(store.query(f"mode = auto {word}")) == [3, 50]
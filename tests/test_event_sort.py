@@ -0,0 +1,96 @@
+import random
+from array import array
+
+import pytest
+
+import src.logic.event_query as event_query
+from src.logic.event_query import EventColumnStore
+from src.logic.event_sort import EventSortOrder
+from src.logic.event_store import EventStore
+
+MIXED = ["10", "9", "b", "A", "9", "nan", "10", "a", "-1.5", "inf"]
+
+
+@pytest.fixture(params=["categories", "text"])
+def columns(request, monkeypatch):
+    """Build a one-column store, dictionary-encoded or (no categories allowed) plain text."""
+    if request.param == "text":
+        monkeypatch.setattr(event_query, "_MAX_CATEGORIES", 0)
+
+    def build(values):
+        store = EventColumnStore([(value,) for value in values], ("value",))
+        assert not values or (store.column("value").codes is None) == (request.param == "text")
+        return store
+
+    return build
+
+
+def sort(columns, values, descending=False):
+    return list(EventSortOrder.by_column(columns(values), "value", descending).order)
+
+
+@pytest.mark.parametrize(
+    "values, ascending, descending",
+    [
+        # Numbers first and numerically, then text case-insensitively; "nan" is text.
+        (MIXED, [8, 1, 4, 0, 6, 9, 3, 7, 2, 5], [5, 2, 3, 7, 9, 0, 6, 1, 4, 8]),
+        (["2", "nan", "1", "NaN", "3"], [2, 0, 4, 1, 3], [1, 3, 4, 0, 2]),
+        (["3", "1.5", "-2", "1.50", "1e1"], [2, 1, 3, 0, 4], [4, 0, 1, 3, 2]),
+        (["b", "B", "a", "c", "A"], [2, 4, 0, 1, 3], [3, 0, 1, 2, 4]),
+        ([], [], []),
+    ],
+)
+def test_by_column(columns, values, ascending, descending):
+    assert sort(columns, values) == ascending
+    assert sort(columns, values, descending=True) == descending
+
+
+def test_ties_keep_log_order_in_both_directions(columns):
+    rng = random.Random(7)
+    values = [rng.choice(["1", "1.0", "2", "x", "Y", "y"]) for _ in range(200)]
+    for descending in (False, True):
+        order = sort(columns, values, descending)
+        keys = [event_query.value_sort_key(values[row].lower()) for row in order]
+        assert keys == sorted(keys, reverse=descending)
+        for key in set(keys):
+            rows = [row for row in order if event_query.value_sort_key(values[row].lower()) == key]
+            assert rows == sorted(rows)
+
+
+def test_by_time_puts_unparsed_rows_last():
+    times = ["2025-09-19 10:00:20", "2025-09-19 10:00:10", "garbage", "2025-09-19 10:00:10", "2025-09-19 10:00:30", ""]
+    store = EventStore([(time, str(i), "", "", "") for i, time in enumerate(times)])
+    assert list(store.sort_order("current_time").order) == [1, 3, 0, 4, 2, 5]
+    assert list(store.sort_order("current_time", descending=True).order) == [4, 0, 1, 3, 2, 5]
+    assert store.cached_sort_order("current_time") is store.sort_order("current_time")
+
+
+@pytest.fixture
+def shuffled():
+    order = list(range(100))
+    random.Random(3).shuffle(order)
+    return EventSortOrder(array("I", order))
+
+
+def expected(order, rows):
+    keep = set(rows)
+    return [row for row in order.order if row in keep]
+
+
+def test_apply_everything_returns_the_order_itself(shuffled):
+    assert shuffled.apply(range(100)) is shuffled.order
+
+
+@pytest.mark.parametrize("rows", [[], [3], [3, 7, 50], list(range(0, 100, 9))])
+def test_apply_small_result_sorts_by_rank(shuffled, rows):
+    assert len(rows) * 8 < len(shuffled)
+    assert list(shuffled.apply(rows)) == expected(shuffled, rows)
+
+
+@pytest.mark.parametrize("rows", [range(10, 90), list(range(0, 100, 2)), range(99)])
+def test_apply_large_result_filters_the_order(shuffled, rows):
+    assert list(shuffled.apply(rows)) == expected(shuffled, rows)
+
+
+def test_rank_inverts_the_order(shuffled):
+    assert [shuffled.rank[row] for row in shuffled.order] == list(range(100))
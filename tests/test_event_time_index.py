@@ -0,0 +1,139 @@
+import math
+from array import array
+
+import pytest
+
+from src.logic.event_time_index import EventTimeIndex
+from src.utils.timestamp_parser import parse_epoch
+
+NAN = float("nan")
+
+TIMES = [
+    "2025-09-19 10:00:00",
+    "2025-09-19 10:00:10",
+    "2025-09-19 10:00:10",
+    "2025-09-19 10:00:20",
+    "2025-09-19 10:00:30",
+]
+BASE = parse_epoch(TIMES[0])
+
+
+def linear_rows(epochs, start, end, include_start=True, include_end=True):
+    def keep(e):
+        if e != e:
+            return False
+        if start is not None and (e < start if include_start else e <= start):
+            return False
+        if end is not None and (e > end if include_end else e >= end):
+            return False
+        return True
+
+    return [i for i, e in enumerate(epochs) if keep(e)]
+
+
+@pytest.fixture(params=["sorted", "sorted_nan_tail", "shuffled"])
+def epochs(request):
+    values = [parse_epoch(t) for t in TIMES]
+    if request.param == "sorted_nan_tail":
+        values += [NAN, NAN]
+    elif request.param == "shuffled":
+        values = [values[3], NAN, values[0], values[2], values[4], NAN, values[1]]
+    return array("d", values)
+
+
+def test_from_column_parses_and_marks_unparsed_rows():
+    index = EventTimeIndex.from_column(TIMES + ["garbage", ""])
+    assert index.is_monotonic
+    assert len(index) == 7
+    assert index.epoch(0) == BASE and index.epoch(5) is None
+    assert list(index.unparsed_rows()) == [5, 6]
+    assert index.span() == (BASE, BASE + 30)
+    assert math.isnan(index.epochs_at([6, 1])[0]) and index.epochs_at([6, 1])[1] == BASE + 10
+
+
+def test_monotonic_detection(epochs):
+    index = EventTimeIndex(epochs)
+    parsed = list(epochs)
+    while parsed and math.isnan(parsed[-1]):
+        parsed.pop()
+    assert index.is_monotonic == (not any(map(math.isnan, parsed)) and parsed == sorted(parsed))
+    assert list(index.sorted_epochs()) == sorted(e for e in epochs if e == e)
+    assert list(index.unparsed_rows()) == [i for i, e in enumerate(epochs) if e != e]
+    assert [epochs[row] for _, row in index.iter_sorted()] == list(index.sorted_epochs())
+
+
+@pytest.mark.parametrize("include_start", [True, False])
+@pytest.mark.parametrize("include_end", [True, False])
+@pytest.mark.parametrize(
+    "start, end",
+    [
+        (None, None),
+        (BASE, BASE + 30),  # exactly the first and last events
+        (BASE + 10, BASE + 10),  # duplicated timestamp
+        (BASE + 5, BASE + 25),
+        (None, BASE + 10),
+        (BASE + 20, None),
+        (BASE - 100, BASE - 1),  # before everything: empty
+        (BASE + 31, BASE + 100),  # after everything: empty
+        (BASE + 20, BASE + 10),  # reversed: empty
+    ],
+)
+def test_rows_between_matches_linear_scan(epochs, start, end, include_start, include_end):
+    index = EventTimeIndex(epochs)
+    rows = index.rows_between(start, end, include_start, include_end)
+    assert list(rows) == linear_rows(epochs, start, end, include_start, include_end)
+
+
+def test_empty_range_and_empty_index():
+    index = EventTimeIndex(array("d", [NAN, NAN]))
+    assert index.span() is None
+    assert list(index.rows_between(None, None)) == []
+    assert index.first_row_at_or_after(0) is None
+    with pytest.raises(ValueError):
+        index.resolve_time("10:00")  # no day to anchor a time of day to
+    assert list(EventTimeIndex(array("d")).rows_between(0, 1)) == []
+
+
+def test_first_row_at_or_after(epochs):
+    index = EventTimeIndex(epochs)
+    for target in (BASE - 1, BASE, BASE + 10, BASE + 15, BASE + 30):
+        expected = min(((e, i) for i, e in enumerate(epochs) if e == e and e >= target), default=None)
+        assert index.first_row_at_or_after(target) == (expected[1] if expected else None)
+    assert index.first_row_at_or_after(BASE + 31) is None
+
+
+def test_restrict_intersects_with_rows(epochs):
+    index = EventTimeIndex(epochs)
+    everything = range(len(epochs))
+    expected = linear_rows(epochs, BASE + 10, BASE + 20)
+    assert list(index.restrict(everything, BASE + 10, BASE + 20)) == expected
+    assert list(index.restrict(range(2, len(epochs)), BASE + 10, BASE + 20)) == [i for i in expected if i >= 2]
+    odd = [i for i in everything if i % 2]
+    assert list(index.restrict(odd, BASE + 10, BASE + 20)) == [i for i in expected if i % 2]
+
+
+def test_sorted_epochs_with_mask(epochs):
+    index = EventTimeIndex(epochs)
+    mask = bytes(i % 2 for i in range(len(epochs)))
+    assert list(index.sorted_epochs(mask)) == sorted(e for i, e in enumerate(epochs) if e == e and i % 2)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("10:00", BASE),
+        (" 10:00:20 ", BASE + 20),
+        ("23:59:59", BASE - 10 * 3600 + 86399),
+        ("2025-09-19 10:00:10", BASE + 10),
+        ("2025-09-20 00:00:00", BASE + 14 * 3600),
+        ("20250919_100030", BASE + 30),
+    ],
+)
+def test_resolve_time(text, expected):
+    assert EventTimeIndex.from_column(TIMES).resolve_time(text) == expected
+
+
+@pytest.mark.parametrize("text", ["24:00", "10:60", "10:00:60", "10", "yesterday", "2025-13-01 00:00:00", ""])
+def test_resolve_time_rejects_invalid_input(text):
+    with pytest.raises(ValueError):
+        EventTimeIndex.from_column(TIMES).resolve_time(text)
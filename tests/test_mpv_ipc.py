@@ -0,0 +1,87 @@
+import json
+import os
+import socket
+import threading
+
+import pytest
+
+from src.logic.mpv_ipc import MpvIpcClient, MpvIpcError, ipc_supported, socket_path_from_command
+
+pytestmark = pytest.mark.skipif(not ipc_supported(), reason="needs Unix sockets")
+
+
+class FakeMpv:
+    """Answers mpv JSON IPC requests on a Unix socket and records the commands."""
+
+    def __init__(self, path):
+        self.path = path
+        self.loaded = None
+        self.commands = []
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(path)
+        self._server.listen()
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        conn, _ = self._server.accept()
+        with conn, conn.makefile("rb") as requests:
+            conn.sendall(b'{"event": "idle"}\n')  # unsolicited events are skipped by the client
+            for line in requests:
+                request = json.loads(line)
+                command = request["command"]
+                self.commands.append(command)
+                reply = {"request_id": request["request_id"], "error": "success", "data": None}
+                if command == ["get_property", "path"]:
+                    reply["data"] = self.loaded
+                    if self.loaded is None:
+                        reply["error"] = "property unavailable"
+                elif isinstance(command, dict) and command["name"] == "loadfile":
+                    self.loaded = command["url"]
+                conn.sendall(json.dumps(reply).encode() + b"\n")
+
+    def close(self):
+        self._server.close()
+
+
+@pytest.fixture
+def mpv(tmp_path):
+    fake = FakeMpv(str(tmp_path / "mpv.sock"))
+    yield fake
+    fake.close()
+
+
+def test_loadfile_passes_start_as_a_per_file_option(mpv, tmp_path):
+    video = str(tmp_path / "a.mp4")
+    client = MpvIpcClient(mpv.path)
+    assert client.play(video, 12.5) == "loadfile"
+    assert mpv.commands[1:] == [
+        {"name": "loadfile", "url": video, "flags": "replace", "options": "start=12.5"},
+        ["set_property", "pause", False],
+    ]
+    assert not any(command[:2] == ["set_property", "start"] for command in mpv.commands if isinstance(command, list))
+
+    del mpv.commands[:]
+    assert client.play(os.path.join(str(tmp_path), ".", "a.mp4"), 30) == "seek"
+    assert mpv.commands == [["get_property", "path"], ["seek", 30, "absolute+exact"], ["set_property", "pause", False]]
+    client.close()
+
+
+def test_unreachable_socket(tmp_path):
+    with pytest.raises(MpvIpcError):
+        MpvIpcClient(str(tmp_path / "missing.sock")).play("a.mp4", 0)
+
+
+@pytest.mark.parametrize(
+    "command, expected",
+    [
+        (
+            ["mpv", "--input-ipc-server=/tmp/triage-gui-mpv-42.sock", "--start=3", "a.mp4"],
+            "/tmp/triage-gui-mpv-42.sock",
+        ),
+        ("mpv --idle=yes --input-ipc-server=/tmp/x.sock", "/tmp/x.sock"),
+        (["mpv", "--start=3", "a.mp4"], None),
+        ("", None),
+    ],
+)
+def test_socket_path_from_command(command, expected):
+    assert socket_path_from_command(command) == expected
@@ -0,0 +1,219 @@
+import os
+import re
+import shutil
+import threading
+import time
+
+import pytest
+
+import src.logic.process_output as process_output
+from src.logic.process_output import OutputCapture, ProcessOutput, _line_start
+
+
+class FakeProc:
+    def __init__(self, pid=4242, returncode=None):
+        self.pid = pid
+        self.returncode = returncode
+
+
+@pytest.fixture
+def output_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "processes"
+    monkeypatch.setattr(process_output, "OUTPUT_DIR", str(directory))
+    return directory
+
+
+def follow(path, proc=None):
+    output = ProcessOutput("Tool", str(path))
+    output.process = proc or FakeProc()
+    assert output._open(0)
+    return output
+
+
+def append(path, data):
+    with open(path, "ab") as fh:
+        fh.write(data)
+
+
+def test_feed_joins_partial_lines():
+    output = ProcessOutput("Tool", "unused")
+    output.feed(b"first\nsec")
+    assert output.tail(10) == ["first"]
+    output.feed(b"ond\r\n\nthi")
+    output.feed(b"rd")
+    assert output.tail(10) == ["first", "second", ""]
+    assert output.total_lines == 3
+    output._close()
+    assert output.tail(10) == ["first", "second", "", "third"]
+    assert output.tail(2) == ["", "third"]
+
+
+def test_ring_buffer_keeps_the_last_lines():
+    output = ProcessOutput("Tool", "unused", max_lines=3)
+    output.feed(b"".join(b"%d\n" % i for i in range(10)))
+    assert output.tail(10) == ["7", "8", "9"]
+    assert output.total_lines == 10
+
+
+def test_update_reads_appended_output_until_the_process_exits(tmp_path):
+    path = tmp_path / "tool.log"
+    path.write_bytes(b"")
+    proc = FakeProc()
+    output = follow(path, proc)
+    append(path, b"one\ntw")
+    assert output.update() and output.tail(10) == ["one"]
+    append(path, b"o\n")
+    assert output.update() and output.tail(10) == ["one", "two"]
+    append(path, b"last, unterminated")
+    proc.returncode = 0
+    assert not output.update()
+    assert output.closed and output.tail(10) == ["one", "two", "last, unterminated"]
+    assert not output.update()
+
+
+def test_wait_for_line(tmp_path):
+    path = tmp_path / "tool.log"
+    path.write_bytes(b"ready before waiting\n")
+    proc = FakeProc()
+    output = follow(path, proc)
+    output.update()
+    pattern = re.compile(r"ready")
+
+    def write_later():
+        time.sleep(0.05)
+        append(path, b"starting\nready on port 8765\n")
+        output.update()
+
+    writer = threading.Thread(target=write_later)
+    writer.start()
+    assert output.wait_for_line(pattern, timeout=5) == "ready on port 8765"  # only lines printed from now on
+    writer.join()
+
+    assert output.wait_for_line(pattern, timeout=0.05) is None
+    proc.returncode = 0
+    output.update()
+    started = time.monotonic()
+    assert output.wait_for_line(pattern, timeout=5) is None  # closed: no need to wait
+    assert time.monotonic() - started < 1
+
+
+def test_rotation_keeps_every_line(tmp_path, monkeypatch):
+    monkeypatch.setattr(process_output, "PROCESS_OUTPUT_MAX_BYTES", 100)
+    path = tmp_path / "tool.log"
+    path.write_bytes(b"")
+    output = follow(path)
+    lines = [b"line %03d" % i for i in range(60)]
+    for start in range(0, len(lines), 15):
+        append(path, b"".join(line + b"\n" for line in lines[start : start + 15]))
+        output.update()
+        assert path.stat().st_size == 0  # every update went past the limit and rotated
+    assert output.tail(100) == [line.decode() for line in lines]
+    assert (tmp_path / "tool.log.1").read_bytes().endswith(lines[-1] + b"\n")
+
+
+def test_rotation_reads_output_appended_during_the_copy(tmp_path, monkeypatch):
+    monkeypatch.setattr(process_output, "PROCESS_OUTPUT_MAX_BYTES", 10)
+    path = tmp_path / "tool.log"
+    path.write_bytes(b"")
+    output = follow(path)
+
+    copyfile = shutil.copyfile
+
+    def copy_while_writing(src, dst):
+        append(src, b"written during the copy\n")
+        return copyfile(src, dst)
+
+    monkeypatch.setattr(process_output.shutil, "copyfile", copy_while_writing)
+    append(path, b"before the rotation\n")
+    output.update()
+    assert output.tail(10) == ["before the rotation", "written during the copy"]
+    append(path, b"after\n")
+    output.update()
+    assert output.tail(10)[-1] == "after"
+
+
+def test_failed_rotation_stops_rotating(tmp_path, monkeypatch):
+    monkeypatch.setattr(process_output, "PROCESS_OUTPUT_MAX_BYTES", 10)
+    path = tmp_path / "tool.log"
+    path.write_bytes(b"")
+    output = follow(path)
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(process_output.shutil, "copyfile", fail)
+    append(path, b"more than ten bytes\n")
+    output.update()
+    append(path, b"and more\n")
+    output.update()
+    assert output.tail(10) == ["more than ten bytes", "and more"]
+    assert path.stat().st_size == 29
+
+
+def test_truncation_by_someone_else_restarts_at_the_top(tmp_path):
+    path = tmp_path / "tool.log"
+    path.write_bytes(b"old output\n")
+    output = follow(path)
+    output.update()
+    path.write_bytes(b"new\n")
+    output.update()
+    assert output.tail(10) == ["old output", "new"]
+
+
+@pytest.mark.parametrize(
+    "content, tail_bytes, expected",
+    [
+        (b"short\n", 100, 0),
+        (b"aaaa\nbbbb\ncccc\n", 7, 10),  # the tail starts inside "bbbb": skip to the next line
+        (b"aaaa\nbbbb\ncccc\n", 5, 10),  # the tail starts exactly at a line
+        (b"aaaa\nbbbb\ncccc\n", 11, 5),
+        (b"no newline at all", 5, 17),
+    ],
+)
+def test_line_start(tmp_path, content, tail_bytes, expected):
+    path = tmp_path / "tool.log"
+    path.write_bytes(content)
+    assert _line_start(str(path), tail_bytes) == expected
+
+
+def test_line_start_of_a_missing_file(tmp_path):
+    assert _line_start(str(tmp_path / "gone.log"), 10) is None
+
+
+def test_reopen_reads_back_the_tail(output_dir, monkeypatch):
+    monkeypatch.setattr(process_output, "_REOPEN_BYTES", 21)  # exactly the last three lines
+    output_dir.mkdir()
+    path = output_dir / "viz-20250919-100000-abcd.log"
+    path.write_bytes(b"".join(b"line %d\n" % i for i in range(10)))
+    capture = OutputCapture()
+
+    output = capture.reopen("Viz", str(path), FakeProc(returncode=0))
+    assert output is not None and output.pid == 4242
+    assert output.wait_for_line(re.compile("never"), timeout=5) is None  # the capture thread closes it
+    assert output.closed
+    assert output.tail(10) == ["line 7", "line 8", "line 9"]
+    assert capture.outputs() == [output]
+    assert capture.reopen("Viz", str(output_dir / "gone.log"), FakeProc()) is None
+
+
+def test_create_attach_and_discard(output_dir):
+    capture = OutputCapture(keep=1)
+    output = capture.create("Bag GUI (prebuilt)")
+    assert os.path.basename(output.path).startswith("bag_gui_prebuilt-")
+    output.sink.write(b"hello\n")
+    output.sink.flush()
+    proc = FakeProc(pid=7)
+    assert capture.attach(output, proc) is output
+    assert output.sink is None
+    proc.returncode = 0
+    assert output.wait_for_line(re.compile("never"), timeout=5) is None
+    assert output.tail(10) == ["hello"]
+
+    failed = capture.create("Viz")
+    capture.discard(failed)
+    assert failed.sink is None and not os.path.exists(failed.path)
+
+    newer = capture.attach(capture.create("Viz"), FakeProc(returncode=0))
+    assert newer.wait_for_line(re.compile("never"), timeout=5) is None
+    assert capture.attach(capture.create("Viz"), FakeProc(returncode=0)) is not None
+    assert output not in capture.outputs() and not os.path.exists(output.path)  # trimmed to keep=1
@@ -0,0 +1,176 @@
+import json
+import os
+import subprocess
+import threading
+
+import pytest
+
+from src.logic.process_registry import AdoptedProcess, ProcessRegistry, proc_start_ticks
+
+pytestmark = pytest.mark.skipif(not os.path.isdir("/proc/self"), reason="needs /proc")
+
+
+class FakeOutput:
+    def __init__(self, path):
+        self.path = path
+
+
+@pytest.fixture
+def spawn():
+    procs = []
+
+    def start():
+        proc = subprocess.Popen(["sleep", "30"], start_new_session=True)
+        procs.append(proc)
+        return proc
+
+    yield start
+    for proc in procs:
+        proc.kill()
+        proc.wait()
+
+
+def stop(proc):
+    proc.kill()
+    proc.wait()
+
+
+def saved_pids(path):
+    with open(path) as fh:
+        return sorted(entry["pid"] for entry in json.load(fh)["processes"])
+
+
+def test_indexes_by_id_name_and_path(spawn):
+    registry = ProcessRegistry()
+    viz = registry.add("Viz", spawn(), ["viz"])
+    bag = registry.add("Bag GUI", spawn(), ["bag"], path="/data/a.mcap")
+    bag2 = registry.add("Bag GUI", spawn(), ["bag"], path="/data/b.mcap")
+
+    assert len(registry) == 3
+    assert registry.get(viz.id) is viz
+    assert registry.by_name("Bag GUI") == [bag, bag2]
+    assert registry.by_path("/data/./a.mcap") == [bag]
+    assert registry.snapshot() == [viz, bag, bag2]
+
+    registry.set_path(bag, "/data/b.mcap")
+    assert registry.by_path("/data/a.mcap") == []
+    assert registry.by_path("/data/b.mcap") == [bag2, bag]  # in the order they opened it
+
+    assert registry.mark_exited(bag.id, 3) is bag
+    assert bag.returncode == 3 and not bag.running
+    assert registry.by_name("Bag GUI") == [bag2]
+    assert registry.by_path("/data/b.mcap") == [bag2]
+    assert registry.mark_exited(bag.id, 0) is None
+    assert registry.remove(viz.id) is viz and viz.running
+    assert registry.snapshot() == [bag2]
+
+
+def test_does_not_persist_by_default(spawn, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    registry = ProcessRegistry()
+    registry.add("Viz", spawn(), ["viz"])
+    assert registry.state_path is None
+    assert registry.adopt_saved() == []
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_save_and_adopt_round_trip(spawn, tmp_path):
+    state = str(tmp_path / "processes.json")
+    first = ProcessRegistry(state)
+    kept = first.add("Viz", spawn(), ["viz", "--x"], cwd="/ws", path="/data/a.mcap", prebuilt=True)
+    kept.output = FakeOutput("/logs/viz.log")
+    first.set_path(kept, "/data/b.mcap")  # saves again, now with the output path
+    gone = first.add("Bag GUI", spawn(), ["bag"])
+    assert saved_pids(state) == sorted([kept.pid, gone.pid])
+    stop(gone.process)
+
+    reopened = []
+    second = ProcessRegistry(state)
+    adopted = second.adopt_saved(lambda name, path, proc: reopened.append((name, path, proc.pid)) or FakeOutput(path))
+
+    assert [record.pid for record in adopted] == [kept.pid]
+    record = adopted[0]
+    assert record.adopted and record.running and isinstance(record.process, AdoptedProcess)
+    assert (record.name, record.command, record.cwd, record.path) == ("Viz", ["viz", "--x"], "/ws", "/data/b.mcap")
+    assert record.prebuilt and record.start_time == kept.start_time
+    assert record.output.path == "/logs/viz.log"
+    assert reopened == [("Viz", "/logs/viz.log", kept.pid)]
+    assert second.by_name("Viz") == [record]
+    assert saved_pids(state) == [kept.pid]  # the exited tool is dropped from the file
+
+    stop(kept.process)
+    assert record.process.poll() == 0
+
+
+def test_reused_pid_is_not_adopted(spawn, tmp_path):
+    state = str(tmp_path / "processes.json")
+    ProcessRegistry(state).add("Viz", spawn(), ["viz"])
+    with open(state) as fh:
+        saved = json.load(fh)
+    saved["processes"][0]["start_ticks"] -= 1  # same pid, started at another time: not ours
+    with open(state, "w") as fh:
+        json.dump(saved, fh)
+
+    assert ProcessRegistry(state).adopt_saved() == []
+    assert saved_pids(state) == []
+
+
+def test_processes_of_a_running_session_are_left_alone(spawn, tmp_path):
+    state = str(tmp_path / "processes.json")
+    ProcessRegistry(state).add("Viz", spawn(), ["viz"])
+    other = spawn()  # stands in for another GUI session that still owns the file
+    with open(state) as fh:
+        saved = json.load(fh)
+    saved["owner"] = {"pid": other.pid, "start_ticks": proc_start_ticks(other.pid)}
+    with open(state, "w") as fh:
+        json.dump(saved, fh)
+
+    registry = ProcessRegistry(state)
+    assert registry.adopt_saved() == []
+    assert registry.state_path is None
+    registry.add("Bag GUI", spawn(), ["bag"])
+    with open(state) as fh:
+        assert json.load(fh) == saved  # not overwritten
+
+
+def test_groups_not_led_by_the_process_are_not_saved(tmp_path):
+    state = str(tmp_path / "processes.json")
+    proc = subprocess.Popen(["sleep", "30"])  # stays in our process group
+    try:
+        ProcessRegistry(state).add("Viz", proc, ["viz"])
+        assert saved_pids(state) == []
+    finally:
+        stop(proc)
+
+
+def test_concurrent_changes_leave_the_latest_state_on_disk(spawn, tmp_path):
+    state = str(tmp_path / "processes.json")
+    registry = ProcessRegistry(state)
+    procs = [spawn() for _ in range(8)]
+
+    def churn(index):
+        record = registry.add(f"tool{index}", procs[index], ["sleep"])
+        registry.set_path(record, f"/data/{index}.mcap")
+        if index % 2:
+            registry.mark_exited(record.id, 0)
+
+    threads = [threading.Thread(target=churn, args=(index,)) for index in range(len(procs))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert saved_pids(state) == sorted(record.pid for record in registry.snapshot())
+    assert len(registry) == 4
+
+
+def test_adopted_process_wait_and_signals(spawn):
+    proc = spawn()
+    adopted = AdoptedProcess(proc.pid, proc_start_ticks(proc.pid))
+    assert adopted.poll() is None
+    with pytest.raises(subprocess.TimeoutExpired):
+        adopted.wait(0.1)
+    adopted.terminate()
+    proc.wait()
+    assert adopted.wait(1) == 0
+    adopted.kill()  # gone: no signal is sent
@@ -0,0 +1,131 @@
+import math
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from src.utils.timestamp_parser import (
+    TIMESTAMP_FORMATS,
+    TimestampParser,
+    datetime_to_epoch,
+    epoch_to_datetime,
+    normalize_timestamp_str,
+    parse_datetime,
+    parse_epoch,
+    parse_epoch_column,
+)
+
+
+def strptime_parse(text):
+    """Reference: try TIMESTAMP_FORMATS in order with datetime.strptime."""
+    text = normalize_timestamp_str(text.strip())
+    for fmt in TIMESTAMP_FORMATS:
+        try:
+            if fmt == "%H:%M:%S":
+                return datetime.combine(date.today(), datetime.strptime(text, fmt).time())
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def assert_equivalent(text):
+    expected = strptime_parse(text)
+    assert parse_datetime(text) == expected, text
+    epoch = parse_epoch(text)
+    if expected is None:
+        assert epoch is None, text
+    else:
+        assert epoch == datetime_to_epoch(expected), text
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "2025-09-19 10:50:50",
+        "2025-09-19 10:50:50 430",
+        "2025-09-19  10:50:50",
+        "2025-12-16-08-55-17",
+        "PSA8411_2025-12-16-08-55-17_0",
+        "20250919_093523",
+        "2025-09-19_09-35-23",
+        "20250919093523",
+        "09:35:23",
+        "9:5:3",
+        "2025-09-19 09:35:23.123456",
+        "2025-09-19 09:35:23.1",
+        "20250919093523123456",
+        "2025-9-1 1:2:3",
+        "2025-09- 1 10:50:50",
+        "2024-02-29 00:00:00",
+        "2025-02-29 00:00:00",
+        "2025-02-30 10:00:00",
+        "2025-09-19 10:50:60",
+        "2025-09-19 10:50:61",
+        "2025-09-19 24:00:00",
+        "20251301093523",
+        "2025021093523",
+        "20250230093523123",
+        "2025-09-19 10:50",
+        "not a timestamp",
+        "",
+        "   ",
+    ],
+)
+def test_matches_strptime(text):
+    assert_equivalent(text)
+
+
+def _mutate(rng, text):
+    chars = list(text)
+    for _ in range(rng.randint(1, 3)):
+        op = rng.randrange(3)
+        pos = rng.randrange(len(chars) + 1)
+        if op == 0 and chars:
+            del chars[min(pos, len(chars) - 1)]
+        elif op == 1:
+            chars.insert(pos, rng.choice("0123456789 -_:."))
+        elif chars:
+            chars[min(pos, len(chars) - 1)] = rng.choice("0123456789")
+    return "".join(chars)
+
+
+def test_fuzzed_inputs_match_strptime():
+    rng = random.Random(2025)
+    start = datetime(2020, 1, 1)
+    for _ in range(20000):
+        moment = start + timedelta(seconds=rng.randrange(86400 * 3000), microseconds=rng.randrange(1_000_000))
+        text = moment.strftime(rng.choice(TIMESTAMP_FORMATS))
+        if rng.random() < 0.7:
+            text = _mutate(rng, text)
+        assert_equivalent(text)
+
+
+def test_random_strings_match_strptime():
+    rng = random.Random(11)
+    for _ in range(20000):
+        assert_equivalent("".join(rng.choices("0123456789 -_:.", k=rng.randint(1, 22))))
+
+
+def test_parse_column_marks_unparseable_as_nan():
+    epochs = parse_epoch_column(["2025-09-19 10:50:50", "junk", 20250919093523])
+    assert epochs[0] == datetime_to_epoch(datetime(2025, 9, 19, 10, 50, 50))
+    assert math.isnan(epochs[1])
+    assert epochs[2] == datetime_to_epoch(datetime(2025, 9, 19, 9, 35, 23))
+
+
+def test_epoch_round_trip():
+    value = datetime(2025, 9, 19, 9, 35, 23, 123456)
+    assert epoch_to_datetime(datetime_to_epoch(value)) == value
+
+
+def test_detect_format_and_custom_formats():
+    parser = TimestampParser(["%Y%m%d", "%Y-%m-%d"])
+    assert parser.detect_format("2025-09-19") == "%Y-%m-%d"
+    assert parser.detect_format("20250919") == "%Y%m%d"
+    assert parser.detect_format("2025/09/19") is None
+
+
+def test_unsupported_directive_is_rejected():
+    with pytest.raises(ValueError):
+        TimestampParser(["%Y-%b"])